@@ -0,0 +1,97 @@
+"""
+Benchmark des animations (vizstyle.animate)
+===========================================
+
+Compare, pour une séquence d'images écrite dans un dossier (un PNG par
+image), le débit de :
+- 'savefig' : une figure styled_* complète construite puis enregistrée
+  (fig.savefig) à chaque image
+- 'animate' : vizstyle.animate, figure construite une fois, données mises
+  à jour sur place et buffer RGBA brut écrit directement
+
+Les deux méthodes produisent des PNG de même taille et de même résolution.
+
+Usage:
+    python benchmarks/bench_animate.py [--frames 50] [--points 5000] [--cells 100]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _frames(kind, n_frames, points, cells, seed=0):
+    """Données des images : nuage qui dérive ou matrice qui évolue."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    if kind == 'scatter':
+        x, y = rng.normal(size=(2, points))
+        for t in range(n_frames):
+            yield {'x': x + 0.02 * t, 'y': y, 'title': f"t = {t}"}
+    else:
+        data = rng.random((cells, cells))
+        for t in range(n_frames):
+            yield {'data': data + 0.1 * np.sin(t / 5 + data), 'title': f"t = {t}"}
+
+
+def measure_savefig(kind, n_frames, points, cells, directory):
+    """Images par seconde avec une figure complète et un savefig par image."""
+    import matplotlib.pyplot as plt
+
+    import vizstyle
+
+    func = getattr(vizstyle, f'styled_{kind}')
+    # Mêmes rendus que animate (points individuels, heatmap en image)
+    options = {'mode': 'points'} if kind == 'scatter' else {'renderer': 'image', 'annot': False}
+    t0 = time.perf_counter()
+    for i, frame in enumerate(_frames(kind, n_frames, points, cells)):
+        fig, _ = func(show=False, **options, **frame)
+        fig.savefig(os.path.join(directory, f"frame_{i:05d}.png"))
+        plt.close(fig)
+    return n_frames / (time.perf_counter() - t0)
+
+
+def measure_animate(kind, n_frames, points, cells, directory):
+    """Images par seconde avec vizstyle.animate."""
+    import vizstyle
+
+    options = {} if kind == 'scatter' else {'annot': False}
+    t0 = time.perf_counter()
+    vizstyle.animate(kind, _frames(kind, n_frames, points, cells), directory, **options)
+    return n_frames / (time.perf_counter() - t0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Animations : savefig par image vs animate")
+    parser.add_argument('--frames', type=int, default=50,
+                        help="Images par séquence (défaut: %(default)s)")
+    parser.add_argument('--points', type=int, default=5000,
+                        help="Points du nuage (défaut: %(default)s)")
+    parser.add_argument('--cells', type=int, default=100,
+                        help="Côté de la matrice de la heatmap (défaut: %(default)s)")
+    args = parser.parse_args()
+
+    import matplotlib
+    matplotlib.use('Agg')
+
+    print(f"{'type':>8} {'savefig':>12} {'animate':>12} {'gain':>7}")
+    for kind in ('scatter', 'heatmap'):
+        rates = []
+        for measure in (measure_savefig, measure_animate):
+            directory = tempfile.mkdtemp(prefix='vizstyle-anim-')
+            try:
+                rates.append(measure(kind, args.frames, args.points, args.cells, directory))
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+        print(f"{kind:>8} {rates[0]:>7.1f} im/s {rates[1]:>7.1f} im/s {rates[1] / rates[0]:>6.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
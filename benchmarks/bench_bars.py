@@ -0,0 +1,93 @@
+"""
+Benchmark des barres groupées de VizStyle
+=========================================
+
+Compare les deux rendus des barres groupées de styled_bar :
+- 'patches' : un Rectangle par barre (ax.bar par série)
+- 'collection' : une PolyCollection par série
+
+Pour chaque taille (séries x catégories), mesure la construction du
+graphique (styled_bar, mise en page comprise) et l'export PNG (dessin Agg).
+
+Usage:
+    python benchmarks/bench_bars.py [--sizes 5x100 20x500 50x2000] [--repeat 3]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Tailles par défaut : (nombre de séries, nombre de catégories)
+DEFAULT_SIZES = ['5x100', '20x500', '50x2000']
+
+
+def _parse_size(text):
+    series, categories = text.lower().split('x')
+    return int(series), int(categories)
+
+
+def measure(n_series, n_categories, renderer, repeat=3):
+    """
+    Mesure un graphique en barres groupées.
+
+    Returns:
+    --------
+    build, savefig : tuple of float
+        Meilleurs temps (s) de construction et d'export PNG
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    import vizstyle
+
+    # Avertissements attendus à cette échelle (légende 'best', marges)
+    warnings.filterwarnings('ignore', category=UserWarning)
+
+    rng = np.random.default_rng(0)
+    x = [f'c{i}' for i in range(n_categories)]
+    y = [rng.uniform(0, 10, n_categories) for _ in range(n_series)]
+
+    build, save = [], []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fig, ax = vizstyle.styled_bar(x, y, title="Benchmark", renderer=renderer,
+                                      figsize=(16, 6), show=False)
+        t1 = time.perf_counter()
+        fig.savefig(io.BytesIO(), format='png')
+        t2 = time.perf_counter()
+        plt.close(fig)
+        build.append(t1 - t0)
+        save.append(t2 - t1)
+    return min(build), min(save)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Barres groupées : patches vs collection")
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES,
+                        help="Tailles SÉRIESxCATÉGORIES (défaut: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Répétitions par mesure (défaut: %(default)s)")
+    args = parser.parse_args()
+
+    print(f"{'taille':>10} {'barres':>8} {'rendu':>11} {'build':>9} {'savefig':>9} {'total':>9}")
+    for text in args.sizes:
+        n_series, n_categories = _parse_size(text)
+        totals = {}
+        for renderer in ('patches', 'collection'):
+            build, save = measure(n_series, n_categories, renderer, args.repeat)
+            totals[renderer] = build + save
+            print(f"{text:>10} {n_series * n_categories:>8} {renderer:>11} "
+                  f"{build:>8.3f}s {save:>8.3f}s {build + save:>8.3f}s")
+        print(f"{'':>10} accélération x{totals['patches'] / totals['collection']:.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
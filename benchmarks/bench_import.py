@@ -0,0 +1,84 @@
+"""
+Benchmark du temps d'import de VizStyle
+=======================================
+
+Mesure le temps de `import vizstyle` dans un interpréteur neuf et vérifie
+qu'il reste sous un budget fixe, sans charger les backends lourds
+(matplotlib.pyplot, seaborn, scipy, pandas).
+
+Usage:
+    python benchmarks/bench_import.py [--budget 0.1] [--repeat 5]
+
+Le script retourne un code de sortie non nul si le budget est dépassé.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Budget par défaut (en secondes) pour `import vizstyle`
+IMPORT_BUDGET = 0.1
+
+# Modules qui ne doivent pas être chargés par le simple import du package
+HEAVY_MODULES = ['matplotlib.pyplot', 'seaborn', 'scipy', 'pandas', 'numpy']
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import vizstyle
+elapsed = time.perf_counter() - t0
+print(json.dumps({'elapsed': elapsed,
+                  'loaded': [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def measure_import(repeat=5):
+    """
+    Mesure le temps d'import dans `repeat` interpréteurs neufs.
+
+    Returns:
+    --------
+    best, loaded : tuple
+        Meilleur temps (s) et modules lourds chargés pendant l'import
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+
+    timings = []
+    loaded = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', _PROBE], env=env,
+                             capture_output=True, text=True, check=True)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        timings.append(result['elapsed'])
+        loaded = sorted(set(loaded) | set(result['loaded']))
+    return min(timings), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Temps d'import de vizstyle")
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET,
+                        help="Budget en secondes (défaut: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Nombre d'interpréteurs lancés (défaut: %(default)s)")
+    args = parser.parse_args()
+
+    best, loaded = measure_import(args.repeat)
+    print(f"import vizstyle : {best * 1000:.1f} ms (budget {args.budget * 1000:.0f} ms)")
+
+    ok = True
+    if loaded:
+        print(f"   ✗ Modules lourds chargés à l'import: {', '.join(loaded)}")
+        ok = False
+    if best > args.budget:
+        print("   ✗ Budget dépassé")
+        ok = False
+    if ok:
+        print("   ✓ Import dans le budget")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
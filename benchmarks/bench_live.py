@@ -0,0 +1,118 @@
+"""
+Benchmark des courbes en direct (vizstyle.live)
+===============================================
+
+Compare, pour une courbe de monitoring qui reçoit un échantillon par
+rafraîchissement, la fréquence d'affichage soutenue de :
+- 'styled_line' : nouvelle figure styled_line à chaque rafraîchissement
+  (figure, courbes et mise en page recréées puis dessinées)
+- 'live (complet)' : LiveLine(blit=False), données mises à jour sur place
+  mais figure entièrement redessinée
+- 'live (blit)' : LiveLine, seule la zone des axes est redessinée
+
+Le backend Agg est utilisé (dessin réel, sans fenêtre). La colonne
+'mémoire' donne la variation de mémoire allouée (tracemalloc) entre la
+première et la seconde moitié des rafraîchissements de LiveLine.
+
+Usage:
+    python benchmarks/bench_live.py [--frames 500] [--capacity 600] [--series 2]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _samples(series, seed=0):
+    """Échantillons aléatoires (marche aléatoire), un tableau par rafraîchissement."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    value = np.zeros(series)
+    while True:
+        value = value + rng.normal(size=series)
+        yield value
+
+
+def measure_styled_line(frames, capacity, series):
+    """Rafraîchissements par seconde en recréant la figure à chaque fois."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    import vizstyle
+
+    samples = _samples(series)
+    history = np.zeros((series, capacity))
+    t0 = time.perf_counter()
+    for i in range(frames):
+        history = np.roll(history, -1, axis=1)
+        history[:, -1] = next(samples)
+        y = list(history) if series > 1 else history[0]
+        fig, _ = vizstyle.styled_line(np.arange(i, i + capacity), y, title="Monitoring",
+                                      show=False, downsample=False)
+        fig.canvas.draw()
+        plt.close(fig)
+    return frames / (time.perf_counter() - t0), None
+
+
+def measure_live(frames, capacity, series, blit):
+    """Rafraîchissements par seconde et variation de mémoire d'une LiveLine."""
+    from vizstyle.live import LiveLine
+
+    samples = _samples(series)
+    with LiveLine(series=series, capacity=capacity, title="Monitoring", blit=blit) as live:
+        # Tampon plein avant la mesure (régime permanent)
+        live.extend([[0.0] * capacity] * series if series > 1 else [0.0] * capacity)
+        live.refresh()
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            live.append(next(samples))
+            live.refresh()
+        rate = frames / (time.perf_counter() - t0)
+
+        tracemalloc.start()
+        try:
+            for _ in range(frames):
+                live.append(next(samples))
+                live.refresh()
+            before = tracemalloc.get_traced_memory()[0]
+            for _ in range(frames):
+                live.append(next(samples))
+                live.refresh()
+            growth = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+    return rate, growth
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Courbes en direct : styled_line vs LiveLine")
+    parser.add_argument('--frames', type=int, default=500,
+                        help="Rafraîchissements mesurés (défaut: %(default)s)")
+    parser.add_argument('--capacity', type=int, default=600,
+                        help="Échantillons affichés par série (défaut: %(default)s)")
+    parser.add_argument('--series', type=int, default=2,
+                        help="Nombre de séries (défaut: %(default)s)")
+    args = parser.parse_args()
+
+    import matplotlib
+    matplotlib.use('Agg')
+
+    print(f"{'méthode':>16} {'fréquence':>11} {'mémoire':>10}")
+    # La recréation complète est lente : moins de rafraîchissements suffisent
+    rows = [('styled_line', *measure_styled_line(max(10, args.frames // 10),
+                                                 args.capacity, args.series)),
+            ('live (complet)', *measure_live(args.frames, args.capacity, args.series, False)),
+            ('live (blit)', *measure_live(args.frames, args.capacity, args.series, True))]
+    for name, rate, growth in rows:
+        memory = f"{growth / 1024:+.1f} Ko" if growth is not None else '-'
+        print(f"{name:>16} {rate:>8.1f} Hz {memory:>10}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
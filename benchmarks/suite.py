@@ -0,0 +1,274 @@
+"""
+Suite de benchmarks de VizStyle
+===============================
+
+Mesure les six fonctions styled_* sur des tailles de données de 10^2 à
+10^7 éléments, en séparant les phases :
+- construction : appel de la fonction styled_* (sans mise en page)
+- mise en page : fig.tight_layout()
+- export : fig.savefig en PNG, SVG et PDF
+
+Pour chaque cas, le meilleur temps de `--repeat` exécutions est retenu ;
+le pic de mémoire (allocations Python et NumPy suivies par tracemalloc,
+construction + mise en page + PNG) est mesuré dans une exécution séparée
+pour ne pas fausser les temps. Les figures sont créées hors pyplot.
+
+Les résultats sont écrits en JSON avec le commit, les versions et la
+machine, pour comparer deux commits :
+
+    python benchmarks/suite.py --output avant.json
+    git checkout ma-branche
+    python benchmarks/suite.py --output apres.json --compare avant.json
+
+Avec --compare, le script retourne un code de sortie non nul si une phase
+ralentit de plus de --threshold (défaut: 20 %).
+
+Usage:
+    python benchmarks/suite.py [--kinds line bar] [--sizes 100 10000]
+                               [--formats png svg] [--repeat 3]
+                               [--output FICHIER.json] [--compare FICHIER.json]
+"""
+
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+KINDS = ['line', 'scatter', 'bar', 'histogram', 'heatmap', 'box']
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6, 10**7]
+FORMATS = ['png', 'svg', 'pdf']
+
+# Taille maximale par défaut : au-delà, le cas est ignoré (sauf --no-limit).
+# Barres : une catégorie (et un label) pour 5 barres.
+MAX_SIZE = {'bar': 10**5}
+
+# Export vectoriel ignoré au-delà de cette taille (fichiers de centaines de Mo)
+VECTOR_MAX_SIZE = 10**6
+
+
+def make_data(kind, n, seed=0):
+    """Arguments de la fonction styled_`kind` pour `n` éléments."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    labels = dict(title=f"{kind} n={n}", xlabel="X", ylabel="Y")
+    if kind == 'line':
+        return dict(x=np.arange(n), y=rng.standard_normal(n).cumsum(), **labels)
+    if kind == 'scatter':
+        return dict(x=rng.standard_normal(n), y=rng.standard_normal(n), **labels)
+    if kind == 'bar':
+        categories = max(1, n // 5)
+        return dict(x=[f"c{i}" for i in range(categories)],
+                    y=[rng.uniform(1, 10, categories) for _ in range(5)], **labels)
+    if kind == 'histogram':
+        return dict(data=rng.standard_normal(n), **labels)
+    if kind == 'heatmap':
+        side = max(1, int(round(n ** 0.5)))
+        return dict(data=rng.uniform(size=(side, side)), title=labels['title'])
+    if kind == 'box':
+        return dict(data=[rng.normal(i, 1, max(1, n // 5)) for i in range(5)], **labels)
+    raise ValueError(f"Type de graphique inconnu: {kind!r}")
+
+
+def _build(kind, kwargs):
+    """Construit le graphique sur une figure hors pyplot, sans mise en page."""
+    import vizstyle
+
+    with vizstyle._figure_source(vizstyle._detached_figure):
+        fig, _ = getattr(vizstyle, f"styled_{kind}")(show=False, layout=None, **kwargs)
+    return fig
+
+
+def measure(kind, n, formats=FORMATS, repeat=3):
+    """
+    Mesure un cas (type de graphique, taille).
+
+    Returns:
+    --------
+    result : dict
+        Temps (s) de construction, de mise en page et d'export par format,
+        taille des fichiers (octets) et pic de mémoire (octets)
+    """
+    kwargs = make_data(kind, n)
+    formats = [fmt for fmt in formats if fmt == 'png' or n <= VECTOR_MAX_SIZE]
+
+    timings = {'construct': [], 'layout': []}
+    timings.update({f"savefig_{fmt}": [] for fmt in formats})
+    sizes = {}
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fig = _build(kind, kwargs)
+        t1 = time.perf_counter()
+        fig.tight_layout()
+        t2 = time.perf_counter()
+        timings['construct'].append(t1 - t0)
+        timings['layout'].append(t2 - t1)
+        for fmt in formats:
+            buffer = io.BytesIO()
+            t0 = time.perf_counter()
+            fig.savefig(buffer, format=fmt)
+            timings[f"savefig_{fmt}"].append(time.perf_counter() - t0)
+            sizes[fmt] = buffer.tell()
+        del fig
+
+    # Pic de mémoire, dans une exécution séparée (tracemalloc ralentit tout)
+    tracemalloc.start()
+    try:
+        fig = _build(kind, kwargs)
+        fig.tight_layout()
+        fig.savefig(io.BytesIO(), format='png')
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {'kind': kind, 'size': n,
+            'times': {phase: min(values) for phase, values in timings.items()},
+            'output_bytes': sizes, 'peak_memory': peak}
+
+
+def _git_commit():
+    """Commit courant du dépôt (None hors d'un dépôt git)."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True,
+                             text=True, timeout=10)
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                               cwd=root, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if out.returncode != 0:
+        return None
+    return out.stdout.strip() + ('-modifié' if dirty.stdout.strip() else '')
+
+
+def metadata():
+    """Contexte des mesures : commit, versions, machine, date."""
+    import matplotlib
+    import numpy as np
+
+    import vizstyle
+
+    return {
+        'commit': _git_commit(),
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'vizstyle': vizstyle.__version__,
+        'matplotlib': matplotlib.__version__,
+        'numpy': np.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold=0.2):
+    """
+    Compare deux jeux de résultats, phase par phase.
+
+    Returns:
+    --------
+    rows : list of tuple
+        (type, taille, phase, temps de référence, temps, rapport), pour les
+        cas présents dans les deux jeux
+    regressions : list of tuple
+        Lignes dont le rapport dépasse 1 + threshold
+    """
+    reference = {(r['kind'], r['size']): r for r in baseline['results']}
+    rows = []
+    for result in results['results']:
+        base = reference.get((result['kind'], result['size']))
+        if base is None:
+            continue
+        for phase, seconds in result['times'].items():
+            if phase in base['times'] and base['times'][phase] > 0:
+                before = base['times'][phase]
+                rows.append((result['kind'], result['size'], phase, before, seconds,
+                             seconds / before))
+    regressions = [row for row in rows if row[5] > 1 + threshold]
+    return rows, regressions
+
+
+def _print_result(result):
+    times = result['times']
+    savefig = ' '.join(f"{phase[8:]}={seconds * 1e3:.1f}"
+                       for phase, seconds in times.items() if phase.startswith('savefig_'))
+    print(f"{result['kind']:>10} {result['size']:>9} "
+          f"{times['construct'] * 1e3:>10.1f} {times['layout'] * 1e3:>9.1f}   "
+          f"{savefig:<34} {result['peak_memory'] / 2**20:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks des fonctions styled_*")
+    parser.add_argument('--kinds', nargs='+', default=KINDS, choices=KINDS,
+                        help="Types de graphiques (défaut: tous)")
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES,
+                        help="Nombres d'éléments (défaut: 10^2 à 10^7)")
+    parser.add_argument('--formats', nargs='+', default=FORMATS, choices=FORMATS,
+                        help="Formats d'export (défaut: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Répétitions par cas, meilleur temps retenu (défaut: %(default)s)")
+    parser.add_argument('--no-limit', action='store_true',
+                        help="Ne pas ignorer les cas au-delà de MAX_SIZE")
+    parser.add_argument('--output', default=None,
+                        help="Fichier JSON des résultats (défaut: benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', default=None,
+                        help="Fichier JSON de référence à comparer")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Ralentissement toléré avec --compare (défaut: %(default)s)")
+    args = parser.parse_args()
+
+    import matplotlib
+    matplotlib.use('Agg')
+
+    # Avertissements attendus à grande échelle (légende 'best', marges)
+    warnings.filterwarnings('ignore', category=UserWarning)
+
+    results = {'meta': metadata(), 'results': []}
+    print(f"{'graphique':>10} {'taille':>9} {'construct':>10} {'layout':>9}   "
+          f"{'savefig (ms)':<34} {'mém. Mo':>8}")
+    for kind in args.kinds:
+        measure(kind, 100, args.formats, repeat=1)  # chauffe (imports, polices)
+        for n in args.sizes:
+            if not args.no_limit and n > MAX_SIZE.get(kind, n):
+                print(f"{kind:>10} {n:>9}   ignoré (au-delà de MAX_SIZE, voir --no-limit)")
+                continue
+            result = measure(kind, n, args.formats, args.repeat)
+            results['results'].append(result)
+            _print_result(result)
+
+    output = args.output
+    if output is None:
+        commit = (results['meta']['commit'] or 'local')[:12]
+        output = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results',
+                              f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nRésultats écrits dans {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows, regressions = compare(results, baseline, args.threshold)
+        print(f"\nComparaison avec {args.compare} (commit {baseline['meta'].get('commit')})")
+        for kind, n, phase, before, after, ratio in rows:
+            flag = '  RÉGRESSION' if ratio > 1 + args.threshold else ''
+            print(f"{kind:>10} {n:>9} {phase:>13} {before * 1e3:>9.1f}ms -> "
+                  f"{after * 1e3:>9.1f}ms  x{ratio:.2f}{flag}")
+        if regressions:
+            print(f"\n{len(regressions)} régression(s) au-delà de {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
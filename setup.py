@@ -28,15 +28,13 @@ setup(
         "Intended Audience :: Science/Research",
         "Topic :: Scientific/Engineering :: Visualization",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     install_requires=requirements,
     keywords="visualization plotting matplotlib graphs charts data-science",
     project_urls={
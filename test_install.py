@@ -98,6 +98,252 @@ try:
 except Exception as e:
     print(f"   ✗ Erreur avec graphiques multiples: {e}")
 
+# Test 6: Précision de la KDE FFT par rapport à scipy
+print("\n6. Test de précision de la KDE FFT...")
+try:
+    from scipy import stats
+    from vizstyle.kde import fft_kde
+
+    rng = np.random.default_rng(0)
+    data = np.concatenate([rng.normal(0, 1, 3000), rng.normal(5, 0.5, 2000)])
+    for bw_method in ['scott', 'silverman']:
+        xs = np.linspace(data.min(), data.max(), 200)
+        reference = stats.gaussian_kde(data, bw_method=bw_method)(xs)
+        _, density = fft_kde(data, xs, bw_method=bw_method)
+        error = np.max(np.abs(density - reference)) / reference.max()
+        assert error < 1e-2, f"erreur relative {error:.2e} ({bw_method})"
+        print(f"   ✓ KDE FFT ({bw_method}) : erreur relative {error:.1e}")
+
+    # Grande entrée à queue lourde (lue par blocs) : même courbe qu'en mémoire
+    import matplotlib.pyplot as plt
+
+    data = rng.lognormal(0, 1.5, 3_000_000)
+    fig, ax = vizstyle.styled_histogram(data, show=False)
+    xs, curve = ax.lines[0].get_data()
+    plt.close(fig)
+    _, reference = fft_kde(data, xs)
+    error = np.max(np.abs(curve - reference)) / reference.max()
+    assert error < 1e-2, f"erreur relative {error:.2e} (lognormale)"
+    print(f"   ✓ histogramme de 3M valeurs : erreur relative {error:.1e}")
+except Exception as e:
+    print(f"   ✗ Erreur de précision de la KDE: {e}")
+    exit(1)
+
+# Test 7: Entrées mappées en mémoire (.npy) sans copie complète
+print("\n7. Test des entrées mappées en mémoire...")
+try:
+    import os
+    import tempfile
+    import tracemalloc
+    import matplotlib.pyplot as plt
+
+    n = 16_000_000
+    path = os.path.join(tempfile.mkdtemp(), 'serie.npy')
+    values = np.lib.format.open_memmap(path, mode='w+', dtype='float64', shape=(n,))
+    for start in range(0, n, 1 << 20):
+        values[start:start + (1 << 20)] = np.random.standard_normal(min(1 << 20, n - start))
+    values.flush()
+    del values
+
+    # La mémoire allouée doit rester bien en dessous de la taille du fichier
+    budget = n * 8 // 2
+    charts = {
+        'styled_line': lambda: vizstyle.styled_line(np.load(path, mmap_mode='r'), path, show=False),
+        'styled_scatter': lambda: vizstyle.styled_scatter(path, path, show=False),
+        'styled_histogram': lambda: vizstyle.styled_histogram(path, show=False),
+    }
+    for name, chart in charts.items():
+        tracemalloc.start()
+        fig, ax = chart()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        plt.close(fig)
+        assert peak < budget, f"{name}: pic de {peak / 1e6:.0f} Mo"
+        print(f"   ✓ {name} : pic {peak / 1e6:.0f} Mo pour un fichier de {n * 8 / 1e6:.0f} Mo")
+    os.remove(path)
+except Exception as e:
+    print(f"   ✗ Erreur avec les entrées mappées en mémoire: {e}")
+    exit(1)
+
+# Test 8: Rendu concurrent depuis plusieurs threads
+print("\n8. Test du rendu concurrent (threads)...")
+try:
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    rng = np.random.default_rng(1)
+    jobs = [
+        ('line', dict(x=np.arange(200), y=np.cumsum(rng.normal(size=200)), title="Ligne")),
+        ('scatter', dict(x=rng.normal(size=500), y=rng.normal(size=500), title="Nuage")),
+        ('bar', dict(x=['A', 'B', 'C'], y=[[3, 5, 2], [4, 1, 6]], labels=['X', 'Y'])),
+        ('histogram', dict(data=rng.normal(size=2000), bins=25)),
+        ('heatmap', dict(data=rng.uniform(size=(6, 8)))),
+        ('box', dict(data=[rng.normal(i, 1, 300) for i in range(4)])),
+    ]
+    snapshot = vizstyle.style_snapshot()
+    serial = [vizstyle.render_bytes(kind, style=snapshot, **kwargs) for kind, kwargs in jobs]
+
+    # Un autre thread modifie STYLE_CONFIG pendant les rendus : l'instantané les isole
+    stop = threading.Event()
+    title_size = vizstyle.STYLE_CONFIG['fonts']['title']
+
+    def mutate():
+        while not stop.is_set():
+            vizstyle.STYLE_CONFIG['fonts']['title'] = title_size + 10
+            time.sleep(0.001)
+            vizstyle.STYLE_CONFIG['fonts']['title'] = title_size
+            time.sleep(0.001)
+
+    mutator = threading.Thread(target=mutate)
+    mutator.start()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda job: vizstyle.render_bytes(job[0], style=snapshot, **job[1]), jobs * 8))
+    finally:
+        stop.set()
+        mutator.join()
+        vizstyle.STYLE_CONFIG['fonts']['title'] = title_size
+
+    for i, data in enumerate(results):
+        kind = jobs[i % len(jobs)][0]
+        assert data == serial[i % len(jobs)], f"{kind}: rendu concurrent différent du rendu séquentiel"
+    print(f"   ✓ {len(results)} rendus sur 8 threads identiques au rendu séquentiel")
+except Exception as e:
+    print(f"   ✗ Erreur avec le rendu concurrent: {e}")
+    exit(1)
+
+# Test 9: Taille des sorties vectorielles bornée (rastérisation des données)
+print("\n9. Test de la taille des sorties SVG/PDF...")
+try:
+    rng = np.random.default_rng(2)
+    charts = {
+        'scatter': lambda n, **kw: dict(x=rng.normal(size=n), y=rng.normal(size=n),
+                                        mode='points', **kw),
+        'line': lambda n, **kw: dict(x=np.arange(n), y=np.cumsum(rng.normal(size=n)),
+                                     downsample=False, **kw),
+    }
+    for kind, make in charts.items():
+        for fmt in ('svg', 'pdf'):
+            sizes = [len(vizstyle.render_bytes(kind, fmt=fmt, **make(n))) for n in (30_000, 300_000)]
+            # 10x plus de données : le fichier ne doit presque pas grossir
+            assert sizes[1] < 2 * sizes[0], f"{kind} {fmt}: {sizes[0]} -> {sizes[1]} octets"
+            assert sizes[1] < 2_000_000, f"{kind} {fmt}: {sizes[1] / 1e6:.1f} Mo"
+            print(f"   ✓ {kind} {fmt} : {sizes[0] / 1e3:.0f} Ko -> {sizes[1] / 1e3:.0f} Ko "
+                  f"(30 000 -> 300 000 points)")
+
+    # Seules les données sont rastérisées : une image, axes et textes vectoriels
+    svg = vizstyle.render_bytes('scatter', fmt='svg', title="Nuage", **charts['scatter'](30_000))
+    vector = vizstyle.render_bytes('scatter', fmt='svg', **charts['scatter'](30_000, rasterize_threshold=None))
+    assert svg.count(b'<image') == 1, f"{svg.count(b'<image')} images dans le SVG"
+    assert b'id="text_1"' in svg and b'id="xtick_1"' in svg, "axes ou titre rastérisés"
+    assert len(vector) > 3 * len(svg), "rasterize_threshold=None doit garder les points vectoriels"
+    print(f"   ✓ seuls les points sont rastérisés ({len(svg) / 1e3:.0f} Ko au lieu de "
+          f"{len(vector) / 1e3:.0f} Ko)")
+except Exception as e:
+    print(f"   ✗ Erreur de taille des sorties vectorielles: {e}")
+    exit(1)
+
+# Test 10: Séries temporelles longues (abscisses datetime64) sous-échantillonnées
+print("\n10. Test des séries temporelles longues...")
+try:
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    n = 200_000
+    values = np.cumsum(np.random.default_rng(3).normal(size=n))
+    dates = pd.date_range('2024-01-01', periods=n, freq='s')
+    for x in (dates, dates.to_numpy()):
+        fig, ax = vizstyle.styled_line(x, values, show=False)
+        kept = np.asarray(ax.lines[0].get_xdata())
+        plt.close(fig)
+        assert len(kept) < n, "série non sous-échantillonnée"
+        assert kept[0] == dates[0] and kept[-1] == dates[-1], "dates extrêmes perdues"
+        print(f"   ✓ {type(x).__name__} : {n} points -> {len(kept)} points")
+except Exception as e:
+    print(f"   ✗ Erreur avec les séries temporelles: {e}")
+    exit(1)
+
+# Test 11: Figures recyclées par FigurePool identiques aux figures neuves
+print("\n11. Test des figures recyclées (FigurePool)...")
+try:
+    from vizstyle.pool import FigurePool
+
+    def pixels(kind, pool=None, **kwargs):
+        if pool is None:
+            source = vizstyle._figure_source(vizstyle._detached_figure)
+        else:
+            source = pool.use()
+        with source:
+            fig, ax = getattr(vizstyle, f'styled_{kind}')(show=False, **kwargs)
+            fig.canvas.draw()
+            return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    pool = FigurePool()
+    # Barres catégorielles dessinées sur une figure qui a servi à des barres groupées
+    pixels('bar', pool, x=['A', 'B', 'C'], y=[[3, 5, 2], [4, 1, 6]], labels=['X', 'Y'])
+    grid = np.random.default_rng(4).random((60, 80))
+    cases = [('bar', dict(x=['A', 'B', 'C'], y=[3, 5, 2])),
+             ('heatmap', dict(data=grid[:6, :8])),
+             ('heatmap', dict(data=grid, renderer='image'))]
+    for kind, kwargs in cases:
+        pooled, fresh = pixels(kind, pool, **kwargs), pixels(kind, **kwargs)
+        differing = np.count_nonzero((pooled != fresh).any(axis=-1))
+        assert differing == 0, f"{kind}: {differing} pixels différents avec le pool"
+        print(f"   ✓ {kind} : figure du pool identique à une figure neuve")
+    assert pool.reused > 0, "aucune figure réutilisée"
+except Exception as e:
+    print(f"   ✗ Erreur avec les figures recyclées: {e}")
+    exit(1)
+
+# Test 12: layout='cached' avec des titres et labels plus longs que les axes
+print("\n12. Test des marges mises en cache (textes longs)...")
+try:
+    def margins(**kwargs):
+        with vizstyle._figure_source(vizstyle._detached_figure):
+            fig, ax = vizstyle.styled_line(np.arange(10), np.arange(10) ** 2, show=False,
+                                           figsize=(4, 3), **kwargs)
+        params, (width, height) = fig.subplotpars, fig.bbox.size
+        return np.array([params.left * width, params.right * width,
+                         params.bottom * height, params.top * height])
+
+    cases = [({'ylabel': 'y'}, {'ylabel': "Température moyenne mesurée par le capteur (°C)"}),
+             ({'title': 't'}, {'title': "Un titre très long qui dépasse la largeur des axes"})]
+    for short, long in cases:
+        margins(layout='cached', **short)
+        error = np.abs(margins(layout='cached', **long) - margins(layout='tight', **long)).max()
+        assert error < 0.1, f"{list(long)[0]} long : marges à {error:.1f} px de tight_layout"
+        print(f"   ✓ {list(long)[0]} long : marges identiques à tight_layout")
+except Exception as e:
+    print(f"   ✗ Erreur avec les marges mises en cache: {e}")
+    exit(1)
+
+# Test 13: Animation de barres groupées réduites à un seul groupe
+print("\n13. Test de l'animation de barres (un seul groupe)...")
+try:
+    import os
+    import tempfile
+    from PIL import Image
+
+    def last_frame(frames):
+        directory = tempfile.mkdtemp()
+        n_frames = vizstyle.animate('bar', frames, directory)
+        name = sorted(os.listdir(directory))[-1]
+        return n_frames, np.asarray(Image.open(os.path.join(directory, name)))
+
+    # La dernière image doit être celle d'une animation réduite à ses hauteurs
+    steps = [np.array([3., 2, 5]), np.array([1., 4, 2]), np.array([3., 2, 5])]
+    for name, group in [('liste d\'une série', lambda h: [h]), ('tableau (1, n)', lambda h: h[None])]:
+        n_frames, image = last_frame([{'x': ['A', 'B', 'C'], 'y': group(h)} for h in steps])
+        _, reference = last_frame([{'x': ['A', 'B', 'C'], 'y': group(steps[-1])}])
+        assert n_frames == len(steps), f"{name} : {n_frames} images"
+        assert np.array_equal(image, reference), f"{name} : hauteurs non mises à jour"
+        print(f"   ✓ {name} : {n_frames} images, hauteurs mises à jour")
+except Exception as e:
+    print(f"   ✗ Erreur avec l'animation de barres: {e}")
+    exit(1)
+
 print("\n" + "=" * 60)
 print("TOUS LES TESTS ONT RÉUSSI! ✓")
 print("=" * 60)
@@ -11,15 +11,37 @@ Fonctions disponibles:
 - styled_histogram: Histogramme
 - styled_heatmap: Carte de chaleur
 - styled_box: Boîte à moustaches
+- dashboard: Plusieurs graphiques dans une seule figure (GridSpec)
+- render_bytes: Rendu direct en octets (PNG, SVG...), sans pyplot
+- to_array, to_arrays: Rendu en tableaux NumPy RGBA (H, W, 4) ou (N, H, W, 4)
+- export: Export d'une figure en plusieurs formats (PNG, SVG, PDF) en une passe
+- animate: Animation (vidéo, GIF, images) en réutilisant les artistes
+
+Modules complémentaires:
+- vizstyle.batch: Rendu en lot dans un pool de processus (render_many)
+- vizstyle.pool: Pool de figures réutilisables (FigurePool)
+- vizstyle.downsample: Sous-échantillonnage LTTB / min-max des séries
+- vizstyle.kde: KDE rapide par binning et convolution FFT
+- vizstyle.stream: Histogrammes en flux pour données hors mémoire
+- vizstyle.stats: Statistiques de boîtes à moustaches précalculées (box_stats)
+- vizstyle.cache: Cache des images rendues, indexé par empreinte (RenderCache)
+- vizstyle.aio: Rendu asynchrone pour asyncio (render, AsyncRenderer)
+- vizstyle.style: Styles compilés (Style) et thèmes nommés (THEMES, use_theme)
+- vizstyle.instrument: Durées par phase des rendus (logging, trace Chrome)
+- vizstyle.live: Courbes en direct avec tampon circulaire et blitting (LiveLine)
 
 Auteur: sidi
 Version: 1.0.0
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
-import seaborn as sns
-from matplotlib import rcParams
+import copy
+import functools
+import threading
+from contextlib import contextmanager, nullcontext
+
+# Les backends lourds (matplotlib.pyplot, numpy, seaborn, scipy) ne sont
+# importés qu'au premier appel d'une fonction styled_* qui en a besoin :
+# `import vizstyle` reste ainsi quasi instantané.
 
 # Configuration du style global
 STYLE_CONFIG = {
@@ -53,9 +75,396 @@ STYLE_CONFIG = {
         'linewidth': 1.5,
         'grid_alpha': 0.3,
         'grid_color': '#DDDDDD'
+    },
+    'text': {
+        'title': '#333333',        # Titres (et valeurs des heatmaps)
+        'label': '#555555',        # Labels des axes
+        'tick': '#666666',         # Graduations
+        'legend': '#000000'        # Texte des légendes
     }
 }
 
+# Valeurs par défaut (base des thèmes et des configurations incomplètes)
+_DEFAULT_CONFIG = copy.deepcopy(STYLE_CONFIG)
+
+from .style import THEMES, Style, _merge, theme_config  # noqa: E402
+from .animation import animate  # noqa: E402
+
+
+# Sources de figures actives (pool, rendu détaché...) et instantanés de
+# style, propres à chaque thread
+_local = threading.local()
+
+# Dernière compilation de STYLE_CONFIG : (représentation, Style)
+_compiled = (None, None)
+
+
+def _style():
+    """
+    Style compilé du thread courant : l'instantané installé par _style_scope
+    (rendu isolé), sinon STYLE_CONFIG, recompilé seulement s'il a changé.
+    """
+    styles = getattr(_local, 'styles', None)
+    if styles:
+        return styles[-1]
+
+    global _compiled
+    key = repr(STYLE_CONFIG)
+    cached_key, style = _compiled
+    if key != cached_key:
+        style = Style(STYLE_CONFIG)
+        _compiled = (key, style)
+    return style
+
+
+def style_snapshot(overrides=None, theme=None):
+    """
+    Instantané immuable (Style compilé) de la configuration de style.
+
+    Les modifications ultérieures de STYLE_CONFIG (par exemple depuis un
+    autre thread) n'affectent pas un rendu qui utilise l'instantané.
+
+    Parameters:
+    -----------
+    overrides : dict, optional
+        Valeurs remplaçant celles de STYLE_CONFIG (fusion récursive,
+        par ex. {'fonts': {'title': 20}})
+    theme : str, optional
+        Thème de départ (voir THEMES) à la place de STYLE_CONFIG
+
+    Returns:
+    --------
+    style : Style
+        Style en lecture seule, utilisable avec render_bytes(style=...)
+    """
+    if theme is not None:
+        return Style.from_theme(theme, overrides)
+    return Style(_merge(STYLE_CONFIG, overrides or {}))
+
+
+def _as_style(style):
+    """Style compilé d'un argument `style` : Style, nom de thème, dict ou None."""
+    if isinstance(style, Style):
+        return style
+    if isinstance(style, str):
+        return Style.from_theme(style)
+    return style_snapshot(style)
+
+
+def use_theme(name, overrides=None):
+    """
+    Remplace la configuration globale STYLE_CONFIG par un thème nommé.
+
+    Parameters:
+    -----------
+    name : str
+        Nom du thème ('default', 'dark', 'presentation', voir THEMES)
+    overrides : dict, optional
+        Valeurs remplaçant celles du thème (fusion récursive)
+
+    Example:
+    --------
+    >>> vizstyle.use_theme('dark')
+    >>> vizstyle.styled_line([1, 2, 3], [4, 2, 5], title="Mode sombre")
+    """
+    config = copy.deepcopy(_merge(theme_config(name), overrides or {}))
+    Style(config)  # validation avant de toucher à la configuration globale
+    STYLE_CONFIG.clear()
+    STYLE_CONFIG.update(config)
+
+
+# Traceur de vizstyle.instrument (None : instrumentation désactivée)
+_tracer = None
+_NO_PHASE = nullcontext()
+
+
+def _phase(name, info=None):
+    """
+    Contexte mesurant la phase `name` de l'appel en cours quand
+    l'instrumentation est active (sinon un contexte vide partagé).
+    `info` (dict) est lu à la fin de la phase.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_PHASE
+    return tracer.phase(name, info)
+
+
+def _traced(func):
+    """Décore une fonction styled_* : un événement par appel si l'instrumentation est active."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tracer = _tracer
+        if tracer is None:
+            return func(*args, **kwargs)
+        return tracer.call(func, args, kwargs)
+    return wrapper
+
+
+@contextmanager
+def _style_scope(style):
+    """Installe `style` comme configuration des fonctions styled_* du thread courant."""
+    stack = _local.__dict__.setdefault('styles', [])
+    stack.append(style)
+    try:
+        yield style
+    finally:
+        stack.pop()
+
+
+@contextmanager
+def _figure_source(source):
+    """
+    Installe `source(kind, figsize, dpi) -> (fig, ax)` comme fabrique de
+    figures pour les fonctions styled_* appelées dans le bloc (thread courant).
+    """
+    stack = _local.__dict__.setdefault('sources', [])
+    stack.append(source)
+    try:
+        yield source
+    finally:
+        stack.pop()
+
+
+def _new_figure(kind, figsize=None, layout=None, ax=None, subplots=True):
+    """
+    Crée la figure et les axes d'un graphique `kind` ('line', 'bar'...).
+
+    Utilise la source de figures active du thread (par ex. un FigurePool),
+    sinon plt.subplots. Avec layout='constrained', le moteur est installé
+    dès la création (les colorbars en tiennent compte). Si des axes `ax`
+    sont fournis, ils sont utilisés tels quels avec leur figure ; avec
+    subplots=False, la figure est retournée sans axes (ax vaut None).
+    """
+    style = _style()
+    figsize = figsize or style.figsize
+    dpi = style.dpi
+    if layout not in ('tight', 'constrained', 'cached', None):
+        raise ValueError(f"Mise en page inconnue: {layout!r}")
+    if ax is not None:
+        return ax.figure, ax
+
+    with _phase('figure'):
+        sources = getattr(_local, 'sources', None)
+        if sources:
+            fig, ax = sources[-1](kind, figsize, dpi)
+            if not subplots:
+                ax.remove()
+                ax = None
+        elif subplots:
+            import matplotlib.pyplot as plt
+            fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+        else:
+            import matplotlib.pyplot as plt
+            fig, ax = plt.figure(figsize=figsize, dpi=dpi), None
+
+        fig.patch.set_facecolor(style.figure_facecolor)
+        if layout == 'constrained':
+            fig.set_layout_engine('constrained')
+    return fig, ax
+
+
+def _detached_figure(kind=None, figsize=None, dpi=None):
+    """
+    Crée une figure hors pyplot (Figure + canvas Agg dédié) : elle n'est pas
+    enregistrée dans le gestionnaire global de figures et est libérée dès
+    qu'elle n'est plus référencée.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+# Nombre de mises en page gardées par layout='cached' (les plus récentes)
+LAYOUT_CACHE_SIZE = 256
+
+# Marges calculées par tight_layout, par clé de mise en page (voir _layout_key)
+_layout_cache = {}
+_layout_lock = threading.Lock()
+
+
+# Les chiffres ont tous la même largeur (chiffres tabulaires) : deux
+# graduations de même « forme » ('−0.0', '00') occupent la même place
+_DIGITS_TO_ZERO = str.maketrans('123456789', '000000000')
+
+
+def _half_length(text, dpi):
+    """Majorant (pixels) de la demi-longueur d'un texte (sa plus longue ligne), sans le mesurer."""
+    em = text.get_fontsize() * dpi / 72
+    return 0.35 * em * max(len(line) for line in text.get_text().split('\n')) + 2
+
+
+def _half_extent(axis, label):
+    """
+    Majorant (pixels) de la demi-taille d'un label de graduation le long de
+    son axe, sans mesurer le texte : au-delà, il ne déborde pas des axes.
+    """
+    em = label.get_fontsize() * axis.figure.dpi / 72
+    width = _half_length(label, axis.figure.dpi)
+    if label.get_rotation() % 180:
+        return max(width, em)
+    return width if axis.axis_name == 'x' else 0.7 * em
+
+
+def _text_overflow(ax, text):
+    """
+    Contenu d'un titre ou label qui peut dépasser des axes (majorant de sa
+    longueur plus grand que le côté des axes le long duquel il est écrit) :
+    les marges dépendent alors de sa longueur exacte. None s'il tient.
+    """
+    content = text.get_text()
+    if not content:
+        return None
+    rotation = text.get_rotation() % 180
+    if rotation % 90:
+        return content
+    length = ax.bbox.height if rotation else ax.bbox.width
+    return content if 2 * _half_length(text, ax.figure.dpi) > length else None
+
+
+def _layout_key(fig):
+    """
+    Clé de mise en page d'une figure : ce qui détermine les marges de
+    tight_layout (taille et résolution, axes, présence et taille des titres
+    et labels, texte de ceux qui peuvent dépasser des axes, forme et taille
+    des graduations), sans mesurer de texte.
+    """
+    key = [tuple(fig.get_size_inches()), fig.dpi]
+    suptitle = getattr(fig, '_suptitle', None)
+    if suptitle is not None:
+        key.append((suptitle.get_text().count('\n'), suptitle.get_fontsize(),
+                    suptitle.get_fontweight()))
+    for ax in fig.axes:
+        key.append(tuple(ax.get_position(original=True).bounds))
+        for text in (ax.title, ax._left_title, ax._right_title, ax.xaxis.label, ax.yaxis.label):
+            content = text.get_text()
+            key.append((len(content) > 0, content.count('\n'), text.get_fontsize(),
+                        text.get_fontweight(), text.get_rotation(), _text_overflow(ax, text)))
+        for axis in (ax.xaxis, ax.yaxis):
+            # Seules les graduations dans les limites sont dessinées (et mesurées)
+            lo, hi = sorted(axis.get_view_interval())
+            eps = 1e-10 * (hi - lo)
+            ticks = [(loc, label) for label, loc in
+                     zip(axis.get_majorticklabels(), axis.get_majorticklocs())
+                     if lo - eps <= loc <= hi + eps]
+            shapes = [label.get_text().translate(_DIGITS_TO_ZERO) for _, label in ticks]
+            # Une graduation extrême plus proche du bord que sa demi-taille
+            # déborde des axes : sa distance au bord fait alors partie de la clé
+            edges = ()
+            if ticks:
+                transform = axis.get_transform().transform
+                t_lo, t_hi = transform([lo, hi])
+                length = ax.bbox.width if axis is ax.xaxis else ax.bbox.height
+                fractions = (transform([loc for loc, _ in ticks]) - t_lo) / (t_hi - t_lo)
+                edges = tuple(int(round(min(d * length, _half_extent(axis, ticks[i][1]))))
+                              for i, d in ((0, fractions.min()), (-1, 1 - fractions.max())))
+            key.append((axis.get_label_position(), axis.get_ticks_position(),
+                        tuple(shapes[:1]), tuple(shapes[-1:]), frozenset(shapes), edges,
+                        ticks[0][1].get_fontsize() if ticks else 0,
+                        ticks[0][1].get_rotation() if ticks else 0))
+    return tuple(key)
+
+
+def _cached_layout(fig):
+    """Applique les marges mémorisées pour cette forme de figure, sinon tight_layout."""
+    key = _layout_key(fig)
+    with _layout_lock:
+        margins = _layout_cache.get(key)
+    if margins is not None:
+        fig.subplots_adjust(**margins)
+        return
+
+    fig.tight_layout()
+    params = fig.subplotpars
+    margins = dict(left=params.left, right=params.right, bottom=params.bottom,
+                   top=params.top, wspace=params.wspace, hspace=params.hspace)
+    with _layout_lock:
+        if len(_layout_cache) >= LAYOUT_CACHE_SIZE:
+            del _layout_cache[next(iter(_layout_cache))]
+        _layout_cache[key] = margins
+
+
+def _finalize(fig, show, layout='tight'):
+    """
+    Calcule la mise en page de la figure et l'affiche si demandé.
+
+    - 'tight' : fig.tight_layout(), qui mesure tous les textes à chaque appel
+    - 'constrained' : moteur constrained_layout, recalculé à chaque dessin
+    - 'cached' : tight_layout une seule fois par forme de figure (taille,
+      polices, longueur des graduations...), puis réutilisation des marges
+    - None : pas d'ajustement
+    """
+    from matplotlib.layout_engine import ConstrainedLayoutEngine
+
+    with _phase('layout'):
+        if layout == 'tight':
+            fig.tight_layout()
+        elif layout == 'constrained':
+            # Normalement déjà installé par _new_figure
+            if not isinstance(fig.get_layout_engine(), ConstrainedLayoutEngine):
+                fig.set_layout_engine('constrained')
+        elif layout == 'cached':
+            _cached_layout(fig)
+
+    if show:
+        import matplotlib.pyplot as plt
+        plt.show()
+
+
+# Taille des blocs utilisés pour parcourir les grandes entrées sans les copier
+CHUNK_SIZE = 1 << 20
+
+
+def _as_array(data):
+    """
+    Ouvre une entrée de données sans la copier.
+
+    - chemin vers un fichier .npy : tableau mappé en mémoire (mmap_mode='r')
+    - chemin vers un fichier .npz : tableau de l'archive (liste de tableaux
+      s'il y en a plusieurs) ; les membres .npz sont lus, pas mappés
+    - objet exposant le protocole buffer (memoryview, array.array,
+      bytearray...) : vue NumPy sur le même buffer
+
+    Les autres entrées (listes, tableaux NumPy...) sont retournées telles quelles.
+    """
+    import os
+
+    if isinstance(data, (str, os.PathLike)):
+        import numpy as np
+        path = os.fspath(data)
+        if path.endswith('.npz'):
+            with np.load(path) as archive:
+                arrays = [archive[name] for name in archive.files]
+            return arrays[0] if len(arrays) == 1 else arrays
+        return np.load(path, mmap_mode='r')
+
+    if isinstance(data, (list, tuple)) or type(data).__module__ == 'numpy':
+        return data
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return data
+
+    import numpy as np
+    return np.asarray(view)
+
+
+def _as_arrays(data):
+    """
+    Comme _as_array, en ouvrant aussi chaque élément d'une liste de séries
+    (chemins, buffers) ; les listes de nombres sont retournées telles quelles.
+    """
+    import numbers
+
+    data = _as_array(data)
+    if isinstance(data, (list, tuple)) and len(data) and \
+            not isinstance(data[0], (numbers.Number, list, tuple)):
+        return [_as_array(item) for item in data]
+    return data
+
 
 def _apply_style(ax, title=None, xlabel=None, ylabel=None):
     """
@@ -72,34 +481,108 @@ def _apply_style(ax, title=None, xlabel=None, ylabel=None):
     ylabel : str, optional
         Label de l'axe Y
     """
-    # Fond et bordures
-    ax.set_facecolor(STYLE_CONFIG['axes']['facecolor'])
-    for spine in ax.spines.values():
-        spine.set_edgecolor(STYLE_CONFIG['axes']['edgecolor'])
-        spine.set_linewidth(STYLE_CONFIG['axes']['linewidth'])
-    
-    # Grille
-    ax.grid(True, alpha=STYLE_CONFIG['axes']['grid_alpha'], 
-            color=STYLE_CONFIG['axes']['grid_color'], linestyle='--', linewidth=1)
-    ax.set_axisbelow(True)
-    
-    # Titres et labels
-    if title:
-        ax.set_title(title, fontsize=STYLE_CONFIG['fonts']['title'], 
-                    fontweight='bold', pad=20, color='#333333')
-    if xlabel:
-        ax.set_xlabel(xlabel, fontsize=STYLE_CONFIG['fonts']['label'], 
-                     fontweight='600', color='#555555')
-    if ylabel:
-        ax.set_ylabel(ylabel, fontsize=STYLE_CONFIG['fonts']['label'], 
-                     fontweight='600', color='#555555')
-    
-    # Ticks
-    ax.tick_params(labelsize=STYLE_CONFIG['fonts']['tick'], colors='#666666')
+    # Fond, bordures, grille, titres et ticks : arguments précompilés (Style)
+    with _phase('style'):
+        _style().apply(ax, title, xlabel, ylabel)
+
+
+def _panel_pixels(ax):
+    """
+    Taille (largeur, hauteur) en pixels de la case de grille des axes : toute
+    la figure pour un graphique seul, sa part de la figure pour un panneau
+    de tableau de bord (GridSpec).
+    """
+    fig = ax.figure
+    width, height = fig.bbox.width, fig.bbox.height
+    spec = ax.get_subplotspec()
+    if spec is not None:
+        n_rows, n_cols = spec.get_gridspec().get_geometry()
+        width *= len(spec.colspan) / n_cols
+        height *= len(spec.rowspan) / n_rows
+    return width, height
+
+
+def _reduce_line(x, y, ax, downsample):
+    """
+    Sous-échantillonne une courbe à environ la largeur en pixels des axes.
+    Avec downsample='auto', seules les courbes de plus de 2 points par pixel
+    sont réduites (méthode LTTB). Les abscisses non numériques (texte,
+    objets date avec fuseau...) ne sont pas réduites. Une valeur de
+    `downsample` inconnue lève ValueError, quelle que soit la longueur.
+    """
+    import numpy as np
+
+    if downsample not in (True, False, 'auto', 'lttb', 'minmax'):
+        raise ValueError(f"Sous-échantillonnage inconnu: {downsample!r}")
+    if not downsample:
+        return x, y
+    y = np.asarray(y)
+    if y.ndim != 1 or np.asarray(x).dtype.kind not in 'biufmM':
+        return x, y
+
+    n_px = int(_panel_pixels(ax)[0])
+    if downsample == 'auto' and len(y) <= 2 * n_px:
+        return x, y
+    method = 'lttb' if downsample in (True, 'auto') else downsample
+
+    from .downsample import downsample as reduce_series
+    return reduce_series(x, y, n_px, method)
+
+
+def _line_marker(n_points, ax):
+    """
+    Retourne le marqueur des courbes : 'o', ou None si les marqueurs de
+    `n_points` points ne tiennent pas dans la largeur des axes.
+    """
+    marker_px = _style().marker_size * 0.7 * ax.figure.dpi / 72
+    if n_points * marker_px > _panel_pixels(ax)[0]:
+        return None
+    return 'o'
+
+
+# Au-delà de ce nombre d'éléments de données (points des courbes, barres,
+# cellules...), rasterize_threshold='auto' rastérise les artistes de données
+# dans les sorties vectorielles (SVG, PDF)
+RASTERIZE_THRESHOLD = 20_000
+
+
+def _artist_size(artist):
+    """Nombre d'éléments dessinés par un artiste de données (points, chemins, cellules)."""
+    from matplotlib.collections import Collection, QuadMesh
+    from matplotlib.lines import Line2D
 
+    if isinstance(artist, Line2D):
+        return len(artist.get_xdata())
+    if isinstance(artist, QuadMesh):
+        rows, cols = artist.get_coordinates().shape[:2]
+        return (rows - 1) * (cols - 1)
+    if isinstance(artist, Collection):
+        return max(len(artist.get_offsets()), len(artist.get_paths()))
+    return 1
 
+
+def _rasterize_data(ax, threshold, default=None):
+    """
+    Rastérise les artistes de données des axes (courbes, collections,
+    patchs) quand ils comptent ensemble plus de `threshold` éléments : ils
+    deviennent une seule image dans les sorties SVG/PDF, tandis que les
+    axes, les textes et la légende restent vectoriels. 'auto' utilise
+    `default` (RASTERIZE_THRESHOLD), None ne rastérise rien.
+    """
+    if threshold == 'auto':
+        threshold = RASTERIZE_THRESHOLD if default is None else default
+    if threshold is None:
+        return
+    artists = [*ax.lines, *ax.collections, *ax.patches]
+    if sum(_artist_size(artist) for artist in artists) > threshold:
+        for artist in artists:
+            artist.set_rasterized(True)
+
+
+@_traced
 def styled_line(x, y, title=None, xlabel=None, ylabel=None, 
-                label=None, color=None, figsize=None, show=True):
+                label=None, color=None, figsize=None, show=True,
+                downsample='auto', layout='tight', ax=None, rasterize_threshold='auto'):
     """
     Crée un graphique en ligne avec le style personnalisé.
     
@@ -123,6 +606,22 @@ def styled_line(x, y, title=None, xlabel=None, ylabel=None,
         Taille de la figure (largeur, hauteur)
     show : bool, default=True
         Afficher le graphique immédiatement
+    downsample : {'auto', 'lttb', 'minmax'} or bool, default='auto'
+        Sous-échantillonnage des longues séries à environ la largeur en
+        pixels de la figure. 'auto' applique LTTB au-delà de 2 points par
+        pixel ; False désactive la réduction. Les marqueurs sont retirés
+        quand les points sont trop nombreux pour être distingués.
+    layout : {'tight', 'constrained', 'cached'} or None, default='tight'
+        Mise en page : tight_layout à chaque appel, constrained_layout, ou
+        'cached' (marges de tight_layout réutilisées pour les figures de
+        même forme, voir LAYOUT_CACHE_SIZE) ; None n'ajuste rien.
+    ax : matplotlib.axes.Axes, optional
+        Axes existants où tracer (par ex. un panneau de dashboard) : figsize,
+        layout et show sont ignorés, la mise en page et l'affichage restent
+        à la charge de la figure.
+    rasterize_threshold : int, 'auto' or None, default='auto'
+        Nombre total de points au-delà duquel les courbes sont rastérisées
+        en SVG/PDF ('auto' : RASTERIZE_THRESHOLD, None : jamais).
         
     Returns:
     --------
@@ -134,45 +633,174 @@ def styled_line(x, y, title=None, xlabel=None, ylabel=None,
     >>> import vizstyle
     >>> vizstyle.styled_line([1, 2, 3], [4, 2, 5], title="Ma courbe")
     """
-    figsize = figsize or STYLE_CONFIG['figure']['figsize']
-    fig, ax = plt.subplots(figsize=figsize, dpi=STYLE_CONFIG['figure']['dpi'])
-    fig.patch.set_facecolor(STYLE_CONFIG['figure']['facecolor'])
+    import numpy as np
+
+    x = _as_array(x)
+    y = _as_arrays(y)
+    style = _style()
+    if ax is not None:
+        # Panneau d'une figure existante : mise en page et affichage à sa charge
+        layout, show = None, False
+    fig, ax = _new_figure('line', figsize, layout, ax)
     
     # Gérer plusieurs courbes
     if isinstance(y[0], (list, np.ndarray)) and len(y) > 1 and not isinstance(y, np.ndarray):
         # Plusieurs courbes
-        colors = color if color else STYLE_CONFIG['colors']['palette']
+        colors = color if color else style.palette
         labels = label if label else [f'Série {i+1}' for i in range(len(y))]
         
         for i, y_data in enumerate(y):
             c = colors[i % len(colors)] if isinstance(colors, list) else colors
             l = labels[i] if isinstance(labels, list) else labels
-            ax.plot(x, y_data, color=c, linewidth=STYLE_CONFIG['lines']['width'],
-                   marker='o', markersize=STYLE_CONFIG['lines']['marker_size']*0.7,
+            x_data, y_data = _reduce_line(x, y_data, ax, downsample)
+            ax.plot(x_data, y_data, color=c, linewidth=style.line_width,
+                   marker=_line_marker(len(y_data), ax),
+                   markersize=style.marker_size*0.7,
                    label=l, alpha=0.9)
-        ax.legend(frameon=True, fancybox=True, shadow=True, 
-                 fontsize=STYLE_CONFIG['fonts']['tick'])
+        ax.legend(**style.legend_kw)
     else:
         # Une seule courbe
-        c = color or STYLE_CONFIG['colors']['primary']
-        ax.plot(x, y, color=c, linewidth=STYLE_CONFIG['lines']['width'],
-               marker='o', markersize=STYLE_CONFIG['lines']['marker_size']*0.7,
+        c = color or style.primary
+        x_data, y_data = _reduce_line(x, y, ax, downsample)
+        ax.plot(x_data, y_data, color=c, linewidth=style.line_width,
+               marker=_line_marker(len(y_data), ax),
+               markersize=style.marker_size*0.7,
                label=label, alpha=0.9)
         if label:
-            ax.legend(frameon=True, fancybox=True, shadow=True,
-                     fontsize=STYLE_CONFIG['fonts']['tick'])
+            ax.legend(**style.legend_kw)
     
+    _rasterize_data(ax, rasterize_threshold)
     _apply_style(ax, title, xlabel, ylabel)
-    plt.tight_layout()
-    
-    if show:
-        plt.show()
+    _finalize(fig, show, layout)
     
     return fig, ax
 
 
+# Au-delà de ce nombre de points, styled_scatter(mode='auto') passe en densité
+SCATTER_DENSITY_THRESHOLD = 50_000
+
+# Au-delà de ce nombre de points, le nuage est rastérisé dans les sorties
+# vectorielles (SVG, PDF) : valeur de rasterize_threshold='auto' de styled_scatter
+SCATTER_RASTERIZE_THRESHOLD = 5_000
+
+
+def _palette_cmap(color=None):
+    """
+    Colormap séquentielle construite à partir de la palette VizStyle
+    (ou dégradée vers `color` si une couleur est fournie).
+    """
+    from matplotlib.colors import LinearSegmentedColormap
+
+    style = _style()
+    if isinstance(color, str):
+        stops = ['#FFFFFF', color]
+    else:
+        stops = [style.info, style.primary, style.secondary]
+    return LinearSegmentedColormap.from_list('vizstyle', stops)
+
+
+def _bin_index(values, lo, hi, n_bins):
+    """Indice de bin (0..n_bins-1) de chaque valeur sur l'intervalle [lo, hi]."""
+    import numpy as np
+
+    scale = n_bins / (hi - lo) if hi > lo else 0.0
+    index = ((values - lo) * scale).astype(np.intp)
+    return np.clip(index, 0, n_bins - 1, out=index)
+
+
+def _finite_blocks(x, y, values=None):
+    """
+    Parcourt (x, y[, values]) par blocs de CHUNK_SIZE points convertis en
+    float, en ne gardant que les points finis. Les grandes entrées
+    (np.memmap) ne sont ainsi jamais copiées en entier.
+
+    Yields:
+    -------
+    bx, by, bv : tuple of np.ndarray (bv vaut None sans `values`)
+    """
+    import numpy as np
+
+    for start in range(0, len(x), CHUNK_SIZE):
+        block = slice(start, start + CHUNK_SIZE)
+        bx = np.asarray(x[block], dtype=float).ravel()
+        by = np.asarray(y[block], dtype=float).ravel()
+        bv = np.asarray(values[block], dtype=float).ravel() if values is not None else None
+        finite = np.isfinite(bx) & np.isfinite(by)
+        if not finite.all():
+            bx, by = bx[finite], by[finite]
+            bv = bv[finite] if bv is not None else None
+        yield bx, by, bv
+
+
+def _scatter_density(ax, x, y, c, mode, label):
+    """
+    Trace un nuage de points massif sous forme d'image de densité
+    (histogramme 2D calculé par blocs avec np.bincount) ou de hexbin. Si `c`
+    est un tableau numérique, chaque cellule prend la moyenne de `c` au lieu
+    du nombre de points.
+    """
+    import numpy as np
+    from matplotlib.colors import LogNorm
+
+    # np.asarray ne copie pas les tableaux (ni les np.memmap)
+    x = np.asarray(x)
+    y = np.asarray(y)
+    values = None
+    if c is not None and not isinstance(c, str):
+        values = np.asarray(_as_array(c))
+
+    width_px, height_px = _panel_pixels(ax)
+    cmap = _palette_cmap(c if isinstance(c, str) else None) if values is None else None
+
+    if mode == 'hexbin':
+        blocks = list(_finite_blocks(x, y, values))
+        hx = np.concatenate([b[0] for b in blocks])
+        hy = np.concatenate([b[1] for b in blocks])
+        hv = np.concatenate([b[2] for b in blocks]) if values is not None else None
+        artist = ax.hexbin(hx, hy, C=hv, gridsize=max(10, int(width_px / 12)),
+                           cmap=cmap, mincnt=1, bins='log' if values is None else None,
+                           linewidths=0)
+    else:
+        # 1er passage : étendue des points finis
+        extent = [np.inf, -np.inf, np.inf, -np.inf]
+        for bx, by, _ in _finite_blocks(x, y):
+            if len(bx):
+                extent = [min(extent[0], bx.min()), max(extent[1], bx.max()),
+                          min(extent[2], by.min()), max(extent[3], by.max())]
+
+        # 2e passage : comptage, environ une cellule pour 2 pixels
+        nx, ny = max(10, int(width_px / 2)), max(10, int(height_px / 2))
+        counts = np.zeros(nx * ny)
+        sums = np.zeros(nx * ny) if values is not None else None
+        for bx, by, bv in _finite_blocks(x, y, values):
+            cells = _bin_index(bx, extent[0], extent[1], nx) * ny + \
+                _bin_index(by, extent[2], extent[3], ny)
+            counts += np.bincount(cells, minlength=nx * ny)
+            if sums is not None:
+                sums += np.bincount(cells, weights=bv, minlength=nx * ny)
+        counts = counts.reshape(nx, ny)
+
+        if values is None:
+            image = np.ma.masked_equal(counts, 0)
+            norm = LogNorm(vmin=1, vmax=max(counts.max(), 1))
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                image = np.ma.masked_invalid(sums.reshape(nx, ny) / counts)
+            norm = None
+        artist = ax.imshow(image.T, origin='lower', extent=extent, aspect='auto',
+                           interpolation='nearest', cmap=cmap, norm=norm)
+
+    if label:
+        from matplotlib.patches import Patch
+        proxy = Patch(color=_style().primary, alpha=0.7, label=label)
+        ax.legend(handles=[proxy], **_style().legend_kw)
+    return artist
+
+
+@_traced
 def styled_scatter(x, y, title=None, xlabel=None, ylabel=None,
-                   label=None, color=None, size=None, figsize=None, show=True):
+                   label=None, color=None, size=None, figsize=None, show=True,
+                   mode='auto', layout='tight', ax=None, rasterize_threshold='auto'):
     """
     Crée un nuage de points avec le style personnalisé.
     
@@ -198,6 +826,22 @@ def styled_scatter(x, y, title=None, xlabel=None, ylabel=None,
         Taille de la figure
     show : bool, default=True
         Afficher le graphique immédiatement
+    mode : {'auto', 'points', 'hexbin', 'density'}, default='auto'
+        Rendu du nuage. 'points' trace chaque point (voir
+        rasterize_threshold) ; 'density' et 'hexbin' agrègent les points en une seule image aux
+        couleurs de la palette. 'auto' choisit 'density' au-delà de
+        SCATTER_DENSITY_THRESHOLD points.
+    layout : {'tight', 'constrained', 'cached'} or None, default='tight'
+        Mise en page : tight_layout à chaque appel, constrained_layout, ou
+        'cached' (marges de tight_layout réutilisées pour les figures de
+        même forme, voir LAYOUT_CACHE_SIZE) ; None n'ajuste rien.
+    ax : matplotlib.axes.Axes, optional
+        Axes existants où tracer (par ex. un panneau de dashboard) : figsize,
+        layout et show sont ignorés, la mise en page et l'affichage restent
+        à la charge de la figure.
+    rasterize_threshold : int, 'auto' or None, default='auto'
+        Nombre de points au-delà duquel le nuage est rastérisé en SVG/PDF
+        ('auto' : SCATTER_RASTERIZE_THRESHOLD, None : jamais).
         
     Returns:
     --------
@@ -209,31 +853,143 @@ def styled_scatter(x, y, title=None, xlabel=None, ylabel=None,
     >>> import vizstyle
     >>> vizstyle.styled_scatter([1, 2, 3, 4], [2, 4, 3, 5], title="Nuage de points")
     """
-    figsize = figsize or STYLE_CONFIG['figure']['figsize']
-    fig, ax = plt.subplots(figsize=figsize, dpi=STYLE_CONFIG['figure']['dpi'])
-    fig.patch.set_facecolor(STYLE_CONFIG['figure']['facecolor'])
-    
-    c = color if color is not None else STYLE_CONFIG['colors']['primary']
-    s = size if size is not None else STYLE_CONFIG['lines']['marker_size']**2
-    
-    scatter = ax.scatter(x, y, c=c, s=s, alpha=0.7, 
-                        edgecolors='white', linewidth=1.5, label=label)
+    if mode not in ('auto', 'points', 'hexbin', 'density'):
+        raise ValueError(f"Mode inconnu: {mode!r}")
+
+    x = _as_array(x)
+    y = _as_array(y)
+    if ax is not None:
+        # Panneau d'une figure existante : mise en page et affichage à sa charge
+        layout, show = None, False
+    fig, ax = _new_figure('scatter', figsize, layout, ax)
     
-    if label:
-        ax.legend(frameon=True, fancybox=True, shadow=True,
-                 fontsize=STYLE_CONFIG['fonts']['tick'])
+    n_points = len(x)
+    if mode == 'auto':
+        mode = 'density' if n_points > SCATTER_DENSITY_THRESHOLD else 'points'
+
+    if mode != 'points':
+        _scatter_density(ax, x, y, color, mode, label)
+    else:
+        style = _style()
+        c = color if color is not None else style.primary
+        s = size if size is not None else style.marker_size**2
+
+        scatter = ax.scatter(x, y, c=c, s=s, alpha=0.7,
+                            edgecolors='white', linewidth=1.5, label=label)
+
+        if label:
+            ax.legend(**style.legend_kw)
     
+    _rasterize_data(ax, rasterize_threshold, SCATTER_RASTERIZE_THRESHOLD)
     _apply_style(ax, title, xlabel, ylabel)
-    plt.tight_layout()
-    
-    if show:
-        plt.show()
+    _finalize(fig, show, layout)
     
     return fig, ax
 
 
+# Au-delà de ce nombre de barres groupées, renderer='auto' trace une
+# collection par série au lieu d'un Rectangle par barre
+BAR_COLLECTION_THRESHOLD = 1_000
+
+
+def _bar_collection(ax, pos, heights, width, horizontal, **style):
+    """
+    Trace une série de barres (centrées sur `pos`) en une seule PolyCollection :
+    les sommets de tous les rectangles sont construits d'un coup avec NumPy.
+    Comme ax.bar, la base 0 est une limite collante pour l'autoscale.
+    """
+    import numpy as np
+    from matplotlib.collections import PolyCollection
+
+    pos = np.asarray(pos, dtype=float)
+    heights = np.asarray(heights, dtype=float)
+    keep = np.isfinite(heights)
+    pos, heights = pos[keep], heights[keep]
+
+    left, right = pos - width / 2, pos + width / 2
+    zeros = np.zeros_like(heights)
+    # Sommets (n, 4, 2) : (position, 0) -> (position, hauteur) dans l'ordre du contour
+    verts = np.stack([np.column_stack(corner) for corner in
+                      ((left, zeros), (left, heights), (right, heights), (right, zeros))],
+                     axis=1)
+    if horizontal:
+        verts = verts[..., ::-1]
+
+    collection = PolyCollection(verts, closed=True, **style)
+    if horizontal:
+        collection.sticky_edges.x.append(0)
+    else:
+        collection.sticky_edges.y.append(0)
+    ax.add_collection(collection, autolim=True)
+    ax.autoscale_view()
+
+    # Boîtes (x0, y0, x1, y1) des barres, pour le placement de la légende
+    return np.column_stack((verts.min(axis=1), verts.max(axis=1)))
+
+
+# Positions candidates de loc='best' (codes matplotlib 1 à 10) : ancrage
+# horizontal et vertical de la légende dans les axes (0, 0.5 ou 1)
+_LEGEND_ANCHORS = {1: (1, 1), 2: (0, 1), 3: (0, 0), 4: (1, 0), 5: (1, 0.5),
+                   6: (0, 0.5), 7: (1, 0.5), 8: (0.5, 0), 9: (0.5, 1), 10: (0.5, 0.5)}
+
+
+def _bar_legend(ax, boxes, **kwargs):
+    """
+    Légende placée comme loc='best', pour des milliers de barres.
+
+    matplotlib évalue loc='best' chemin par chemin pour une PolyCollection
+    (plusieurs secondes à chaque dessin) : ici le nombre de barres
+    recouvertes par chaque position candidate est compté en une opération
+    NumPy, et la légende est créée à la meilleure position.
+    """
+    import numpy as np
+
+    get_renderer = getattr(ax.figure.canvas, 'get_renderer', None)
+    if get_renderer is None or not len(boxes):
+        return ax.legend(**kwargs)
+
+    # Taille de la légende (indépendante de sa position) en fraction des axes
+    legend = ax.legend(loc='upper right', **kwargs)
+    extent = legend.get_window_extent(get_renderer())
+    pad = legend.borderaxespad * legend.prop.get_size_in_points() * ax.figure.dpi / 72
+    width, height = extent.width / ax.bbox.width, extent.height / ax.bbox.height
+    pad_x, pad_y = pad / ax.bbox.width, pad / ax.bbox.height
+
+    # Barres en fraction des axes
+    lower = ax.transLimits.transform(boxes[:, :2])
+    upper = ax.transLimits.transform(boxes[:, 2:])
+    x0, x1 = np.minimum(lower[:, 0], upper[:, 0]), np.maximum(lower[:, 0], upper[:, 0])
+    y0, y1 = np.minimum(lower[:, 1], upper[:, 1]), np.maximum(lower[:, 1], upper[:, 1])
+
+    best = None
+    for code, (ha, va) in _LEGEND_ANCHORS.items():
+        left = pad_x + ha * (1 - 2 * pad_x - width)
+        bottom = pad_y + va * (1 - 2 * pad_y - height)
+        badness = np.count_nonzero((x0 < left + width) & (x1 > left) &
+                                   (y0 < bottom + height) & (y1 > bottom))
+        # À égalité, le plus petit code l'emporte (comme matplotlib)
+        if best is None or badness < best[0]:
+            best = (badness, code)
+        if badness == 0:
+            break
+
+    legend.remove()
+    return ax.legend(loc=best[1], **kwargs)
+
+
+def _is_grouped(y):
+    """Vrai si `y` est une liste de séries ou un tableau 2D (barres groupées)."""
+    import numpy as np
+
+    if isinstance(y, np.ndarray):
+        return y.ndim == 2
+    return isinstance(y, list) and len(y) > 0 and isinstance(y[0], (list, np.ndarray))
+
+
+@_traced
 def styled_bar(x, y, title=None, xlabel=None, ylabel=None,
-               labels=None, color=None, horizontal=False, figsize=None, show=True):
+               labels=None, color=None, horizontal=False, figsize=None, show=True,
+               renderer='auto', layout='tight', ax=None, rasterize_threshold='auto'):
     """
     Crée un graphique en barres avec le style personnalisé.
     
@@ -241,8 +997,8 @@ def styled_bar(x, y, title=None, xlabel=None, ylabel=None,
     -----------
     x : array-like
         Catégories ou positions
-    y : array-like or list of array-like
-        Hauteurs des barres (peut être multiple pour barres groupées)
+    y : array-like, list of array-like or 2D array
+        Hauteurs des barres (une série par groupe pour des barres groupées)
     title : str, optional
         Titre du graphique
     xlabel : str, optional
@@ -259,6 +1015,22 @@ def styled_bar(x, y, title=None, xlabel=None, ylabel=None,
         Taille de la figure
     show : bool, default=True
         Afficher le graphique immédiatement
+    renderer : {'auto', 'patches', 'collection'}, default='auto'
+        Tracé des barres groupées : un Rectangle par barre ('patches') ou
+        une PolyCollection par série ('collection'), beaucoup plus rapide
+        pour des milliers de barres. 'auto' choisit 'collection' au-delà de
+        BAR_COLLECTION_THRESHOLD barres.
+    layout : {'tight', 'constrained', 'cached'} or None, default='tight'
+        Mise en page : tight_layout à chaque appel, constrained_layout, ou
+        'cached' (marges de tight_layout réutilisées pour les figures de
+        même forme, voir LAYOUT_CACHE_SIZE) ; None n'ajuste rien.
+    ax : matplotlib.axes.Axes, optional
+        Axes existants où tracer (par ex. un panneau de dashboard) : figsize,
+        layout et show sont ignorés, la mise en page et l'affichage restent
+        à la charge de la figure.
+    rasterize_threshold : int, 'auto' or None, default='auto'
+        Nombre de barres au-delà duquel elles sont rastérisées en SVG/PDF
+        ('auto' : RASTERIZE_THRESHOLD, None : jamais).
         
     Returns:
     --------
@@ -270,28 +1042,43 @@ def styled_bar(x, y, title=None, xlabel=None, ylabel=None,
     >>> import vizstyle
     >>> vizstyle.styled_bar(['A', 'B', 'C'], [10, 25, 15], title="Graphique en barres")
     """
-    figsize = figsize or STYLE_CONFIG['figure']['figsize']
-    fig, ax = plt.subplots(figsize=figsize, dpi=STYLE_CONFIG['figure']['dpi'])
-    fig.patch.set_facecolor(STYLE_CONFIG['figure']['facecolor'])
-    
-    # Vérifier si y est une liste de listes (barres groupées)
-    is_grouped = isinstance(y, list) and len(y) > 0 and isinstance(y[0], (list, np.ndarray))
+    import numpy as np
+
+    if renderer not in ('auto', 'patches', 'collection'):
+        raise ValueError(f"Rendu de barres inconnu: {renderer!r}")
+
+    y = _as_arrays(y)
+    style = _style()
+    if ax is not None:
+        # Panneau d'une figure existante : mise en page et affichage à sa charge
+        layout, show = None, False
+    fig, ax = _new_figure('bar', figsize, layout, ax)
     
-    if is_grouped:
+    if _is_grouped(y):
         # Barres groupées
         n_groups = len(y)
-        colors = color if color else STYLE_CONFIG['colors']['palette'][:n_groups]
+        colors = color if color else style.palette
         labels_list = labels if labels else [f'Groupe {i+1}' for i in range(n_groups)]
         
         x_pos = np.arange(len(x))
         width = 0.8 / n_groups
+
+        if renderer == 'auto':
+            renderer = 'collection' if n_groups * len(x) > BAR_COLLECTION_THRESHOLD \
+                else 'patches'
+        boxes = []
         
         for i, y_data in enumerate(y):
             offset = (i - n_groups/2 + 0.5) * width
-            c = colors[i] if isinstance(colors, list) else colors
+            # La palette est parcourue en boucle au-delà de ses couleurs
+            c = colors[i % len(colors)] if isinstance(colors, list) else colors
             l = labels_list[i] if isinstance(labels_list, list) else labels_list
             
-            if horizontal:
+            if renderer == 'collection':
+                boxes.append(_bar_collection(ax, x_pos + offset, y_data, width, horizontal,
+                                             label=l, facecolors=c, alpha=0.8,
+                                             edgecolors='white', linewidths=1.5))
+            elif horizontal:
                 ax.barh(x_pos + offset, y_data, width, label=l, color=c, 
                        alpha=0.8, edgecolor='white', linewidth=1.5)
             else:
@@ -305,11 +1092,13 @@ def styled_bar(x, y, title=None, xlabel=None, ylabel=None,
             ax.set_xticks(x_pos)
             ax.set_xticklabels(x)
         
-        ax.legend(frameon=True, fancybox=True, shadow=True,
-                 fontsize=STYLE_CONFIG['fonts']['tick'])
+        if boxes:
+            _bar_legend(ax, np.concatenate(boxes), **style.legend_kw)
+        else:
+            ax.legend(**style.legend_kw)
     else:
         # Barres simples
-        c = color if color else STYLE_CONFIG['colors']['primary']
+        c = color if color else style.primary
         
         if horizontal:
             bars = ax.barh(x, y, color=c, alpha=0.8, 
@@ -318,17 +1107,74 @@ def styled_bar(x, y, title=None, xlabel=None, ylabel=None,
             bars = ax.bar(x, y, color=c, alpha=0.8,
                          edgecolor='white', linewidth=1.5)
     
+    _rasterize_data(ax, rasterize_threshold)
     _apply_style(ax, title, xlabel, ylabel)
-    plt.tight_layout()
-    
-    if show:
-        plt.show()
+    _finalize(fig, show, layout)
     
     return fig, ax
 
 
+# Au-delà de ce nombre d'échantillons, kde_method='auto' utilise la KDE FFT
+KDE_FFT_THRESHOLD = 10_000
+
+
+def _kde_curve(data, kde_method):
+    """
+    Calcule la courbe KDE (200 points entre min et max) de `data` avec
+    scipy.stats.gaussian_kde ('scipy') ou la KDE binée par FFT ('fft').
+    """
+    import numpy as np
+
+    if kde_method not in ('auto', 'scipy', 'fft'):
+        raise ValueError(f"Méthode KDE inconnue: {kde_method!r}")
+
+    if kde_method == 'auto':
+        kde_method = 'fft' if np.size(data) > KDE_FFT_THRESHOLD else 'scipy'
+        if kde_method == 'scipy':
+            try:
+                from scipy import stats  # noqa: F401
+            except ImportError:
+                kde_method = 'fft'
+
+    if kde_method == 'fft':
+        from .kde import fft_kde
+        return fft_kde(data, n_points=200)
+
+    from scipy import stats
+    density = stats.gaussian_kde(data)
+    xs = np.linspace(data.min(), data.max(), 200)
+    return xs, density(xs)
+
+
+def _draw_histogram(ax, data, bins, color, kde_curve, weights=None):
+    """
+    Trace les barres de l'histogramme et la courbe KDE éventuelle.
+
+    `kde_curve` est un couple (xs, densité) ou None ; s'il est fourni,
+    l'histogramme est normalisé en densité. Avec `weights`, `data` peut être
+    la liste des bords gauches de bins déjà comptés.
+    """
+    style = _style()
+    c = color or style.primary
+    kde = kde_curve is not None
+    
+    # Histogramme
+    n, bins_edges, patches = ax.hist(data, bins=bins, weights=weights, color=c,
+                                      alpha=0.7, edgecolor='white', linewidth=1.5,
+                                      density=kde)
+    
+    # KDE
+    if kde:
+        xs, density = kde_curve
+        ax.plot(xs, density, color=style.secondary,
+               linewidth=style.line_width, label='Densité (KDE)')
+        ax.legend(**style.legend_kw)
+
+
+@_traced
 def styled_histogram(data, bins=30, title=None, xlabel=None, ylabel=None,
-                     color=None, kde=True, figsize=None, show=True):
+                     color=None, kde=True, figsize=None, show=True,
+                     kde_method='auto', layout='tight', ax=None, rasterize_threshold='auto'):
     """
     Crée un histogramme avec le style personnalisé.
     
@@ -352,6 +1198,22 @@ def styled_histogram(data, bins=30, title=None, xlabel=None, ylabel=None,
         Taille de la figure
     show : bool, default=True
         Afficher le graphique immédiatement
+    kde_method : {'auto', 'scipy', 'fft'}, default='auto'
+        Calcul de la KDE : 'scipy' (gaussian_kde, exact, O(n × 200)) ou
+        'fft' (binning + convolution FFT, O(n + g log g), voir vizstyle.kde).
+        'auto' utilise 'fft' au-delà de KDE_FFT_THRESHOLD échantillons ou
+        si scipy n'est pas installé.
+    layout : {'tight', 'constrained', 'cached'} or None, default='tight'
+        Mise en page : tight_layout à chaque appel, constrained_layout, ou
+        'cached' (marges de tight_layout réutilisées pour les figures de
+        même forme, voir LAYOUT_CACHE_SIZE) ; None n'ajuste rien.
+    ax : matplotlib.axes.Axes, optional
+        Axes existants où tracer (par ex. un panneau de dashboard) : figsize,
+        layout et show sont ignorés, la mise en page et l'affichage restent
+        à la charge de la figure.
+    rasterize_threshold : int, 'auto' or None, default='auto'
+        Nombre de barres et de points de la KDE au-delà duquel ils sont
+        rastérisés en SVG/PDF ('auto' : RASTERIZE_THRESHOLD, None : jamais).
         
     Returns:
     --------
@@ -365,39 +1227,166 @@ def styled_histogram(data, bins=30, title=None, xlabel=None, ylabel=None,
     >>> data = np.random.normal(0, 1, 1000)
     >>> vizstyle.styled_histogram(data, title="Distribution")
     """
-    figsize = figsize or STYLE_CONFIG['figure']['figsize']
-    fig, ax = plt.subplots(figsize=figsize, dpi=STYLE_CONFIG['figure']['dpi'])
-    fig.patch.set_facecolor(STYLE_CONFIG['figure']['facecolor'])
-    
-    c = color or STYLE_CONFIG['colors']['primary']
-    
-    # Histogramme
-    n, bins_edges, patches = ax.hist(data, bins=bins, color=c, alpha=0.7,
-                                      edgecolor='white', linewidth=1.5, density=kde)
+    import numpy as np
+
+    data = np.asarray(_as_array(data))
+    if ax is not None:
+        # Panneau d'une figure existante : mise en page et affichage à sa charge
+        layout, show = None, False
+    fig, ax = _new_figure('histogram', figsize, layout, ax)
     
-    # KDE
-    if kde:
-        from scipy import stats
-        density = stats.gaussian_kde(data)
-        xs = np.linspace(data.min(), data.max(), 200)
-        ax.plot(xs, density(xs), color=STYLE_CONFIG['colors']['secondary'],
-               linewidth=STYLE_CONFIG['lines']['width'], label='Densité (KDE)')
-        ax.legend(frameon=True, fancybox=True, shadow=True,
-                 fontsize=STYLE_CONFIG['fonts']['tick'])
+    if isinstance(bins, int) and data.size > CHUNK_SIZE and kde_method != 'scipy':
+        # Grandes entrées : comptage par blocs, sans copie des données ; la KDE
+        # FFT (elle aussi par blocs) garde une grille à la mesure de la largeur
+        # de bande, là où la grille fixe de l'accumulateur lisse trop les
+        # distributions à queue lourde
+        from .stream import HistogramAccumulator
+        acc = HistogramAccumulator.from_array(data, CHUNK_SIZE, bins=bins)
+        counts, edges = acc.histogram()
+        with _phase('kde'):
+            curve = _kde_curve(data, kde_method) if kde and acc.std > 0 else None
+        _draw_histogram(ax, edges[:-1], edges, color, curve, weights=counts)
+    else:
+        with _phase('kde'):
+            curve = _kde_curve(data, kde_method) if kde else None
+        _draw_histogram(ax, data, bins, color, curve)
     
     ylabel = ylabel or ('Densité' if kde else 'Fréquence')
+    _rasterize_data(ax, rasterize_threshold)
     _apply_style(ax, title, xlabel, ylabel)
-    plt.tight_layout()
-    
-    if show:
-        plt.show()
+    _finalize(fig, show, layout)
     
     return fig, ax
 
 
+# Au-delà de ce nombre de cellules, styled_heatmap(renderer='auto') trace une image
+HEATMAP_IMAGE_THRESHOLD = 2_500
+
+# Taille minimale (en pixels) d'une cellule pour y écrire sa valeur
+HEATMAP_ANNOT_MIN_CELL = (30, 14)
+
+
+def _block_mean(data, max_shape):
+    """
+    Réduit une matrice à au plus `max_shape` cellules en moyennant des blocs
+    de cellules voisines (les NaN sont ignorés). La matrice est lue par
+    bandes de lignes : un np.memmap n'est jamais copié en entier.
+
+    Returns:
+    --------
+    reduced, factors : tuple
+        Matrice réduite et taille (lignes, colonnes) des blocs
+    """
+    import numpy as np
+
+    rows, cols = data.shape
+    fr = -(-rows // max(1, max_shape[0]))
+    fc = -(-cols // max(1, max_shape[1]))
+    if fr == 1 and fc == 1:
+        return np.asarray(data, dtype=float), (1, 1)
+
+    out_rows, out_cols = -(-rows // fr), -(-cols // fc)
+    reduced = np.empty((out_rows, out_cols))
+    band = max(1, CHUNK_SIZE // (fr * out_cols * fc))
+    for i0 in range(0, out_rows, band):
+        i1 = min(i0 + band, out_rows)
+        block = np.full(((i1 - i0) * fr, out_cols * fc), np.nan)
+        source = data[i0 * fr:i1 * fr]
+        block[:len(source), :cols] = source
+        block = block.reshape(i1 - i0, fr, out_cols, fc)
+        counts = np.count_nonzero(~np.isnan(block), axis=(1, 3))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            reduced[i0:i1] = np.nansum(block, axis=(1, 3)) / counts
+    return reduced, (fr, fc)
+
+
+def _heatmap_ticks(axis, labels, n_cells, n_px):
+    """
+    Place les labels de cellules sur un axe de heatmap image (au centre des
+    cellules), en n'en gardant qu'un sur k si la place manque.
+    """
+    import numpy as np
+
+    if labels is False:
+        axis.set_ticks([])
+        return
+    if labels is True or labels is None:
+        labels = list(range(n_cells))
+    # Place d'un label : hauteur d'une ligne, ou longueur du texte sur l'axe x
+    min_px = 14
+    if axis.axis_name == 'x':
+        min_px = max(min_px, 7 * max(len(str(label)) for label in labels) + 8)
+    step = max(1, -(-len(labels) // max(1, int(n_px / min_px))))
+    positions = np.arange(0, len(labels), step)
+    axis.set_ticks(positions + 0.5)
+    axis.set_ticklabels([str(labels[i]) for i in positions])
+
+
+def _heatmap_pixels(ax):
+    """Taille (largeur, hauteur) en pixels de la zone de l'image, hors colorbar et marges."""
+    width_px, height_px = _panel_pixels(ax)
+    return width_px * 0.75, height_px * 0.8
+
+
+def _heatmap_image(ax, data, cmap, annot, fmt, xticklabels, yticklabels):
+    """
+    Trace une carte de chaleur sous forme d'image (imshow), sans seaborn.
+
+    Les matrices plus grandes que la grille de pixels sont réduites par
+    moyenne de blocs ; les valeurs ne sont écrites que si les cellules sont
+    assez grandes pour être lues.
+    """
+    import numpy as np
+
+    fig = ax.figure
+    if hasattr(data, 'columns'):
+        # DataFrame pandas : mêmes labels par défaut que seaborn
+        xticklabels = list(data.columns) if xticklabels is None else xticklabels
+        yticklabels = list(data.index) if yticklabels is None else yticklabels
+        data = data.to_numpy()
+    data = data if isinstance(data, np.ndarray) else np.asarray(data, dtype=float)
+    rows, cols = data.shape
+
+    width_px, height_px = _heatmap_pixels(ax)
+    image, factors = _block_mean(data, (int(height_px), int(width_px)))
+
+    # extent en coordonnées de cellules d'origine (comme seaborn)
+    im = ax.imshow(np.ma.masked_invalid(image), cmap=cmap, aspect='auto',
+                   interpolation='nearest', extent=(0, cols, rows, 0))
+    cbar = fig.colorbar(im, ax=ax, shrink=0.8)
+    cbar.outline.set_linewidth(0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    _heatmap_ticks(ax.xaxis, xticklabels, cols, width_px)
+    _heatmap_ticks(ax.yaxis, yticklabels, rows, height_px)
+
+    cell_w, cell_h = width_px / cols, height_px / rows
+    min_w, min_h = HEATMAP_ANNOT_MIN_CELL
+    if annot and factors == (1, 1) and cell_w >= min_w and cell_h >= min_h:
+        _annotate_heatmap(ax, im, image, fmt)
+    return im
+
+
+def _annotate_heatmap(ax, im, image, fmt):
+    """Écrit la valeur de chaque cellule finie, en blanc sur les couleurs sombres."""
+    import numpy as np
+
+    style = _style()
+    rgba = im.cmap(im.norm(image))
+    luminance = rgba[..., :3] @ np.array([0.2126, 0.7152, 0.0722])
+    for (i, j), value in np.ndenumerate(image):
+        if np.isfinite(value):
+            ax.text(j + 0.5, i + 0.5, format(value, fmt), ha='center', va='center',
+                    color=style.text_color if luminance[i, j] > 0.408 else 'white',
+                    fontsize=style.tick_size)
+
+
+@_traced
 def styled_heatmap(data, title=None, xlabel=None, ylabel=None,
                    xticklabels=None, yticklabels=None, cmap=None,
-                   annot=True, fmt='.2f', figsize=None, show=True):
+                   annot=True, fmt='.2f', figsize=None, show=True,
+                   renderer='auto', layout='tight', ax=None, rasterize_threshold='auto'):
     """
     Crée une carte de chaleur avec le style personnalisé.
     
@@ -425,6 +1414,23 @@ def styled_heatmap(data, title=None, xlabel=None, ylabel=None,
         Taille de la figure
     show : bool, default=True
         Afficher le graphique immédiatement
+    renderer : {'auto', 'seaborn', 'image'}, default='auto'
+        'seaborn' trace une cellule (et une annotation) par valeur ;
+        'image' trace une seule image (imshow) sans seaborn, réduit les
+        matrices plus grandes que la grille de pixels par moyenne de blocs et
+        n'annote que les cellules assez grandes pour être lues. 'auto'
+        choisit 'image' au-delà de HEATMAP_IMAGE_THRESHOLD cellules.
+    layout : {'tight', 'constrained', 'cached'} or None, default='tight'
+        Mise en page : tight_layout à chaque appel, constrained_layout, ou
+        'cached' (marges de tight_layout réutilisées pour les figures de
+        même forme, voir LAYOUT_CACHE_SIZE) ; None n'ajuste rien.
+    ax : matplotlib.axes.Axes, optional
+        Axes existants où tracer (par ex. un panneau de dashboard) : figsize,
+        layout et show sont ignorés, la mise en page et l'affichage restent
+        à la charge de la figure.
+    rasterize_threshold : int, 'auto' or None, default='auto'
+        Nombre de cellules au-delà duquel la heatmap seaborn est rastérisée
+        en SVG/PDF ('auto' : RASTERIZE_THRESHOLD, None : jamais).
         
     Returns:
     --------
@@ -438,53 +1444,76 @@ def styled_heatmap(data, title=None, xlabel=None, ylabel=None,
     >>> data = np.random.rand(5, 5)
     >>> vizstyle.styled_heatmap(data, title="Carte de chaleur")
     """
-    figsize = figsize or (10, 8)
-    fig, ax = plt.subplots(figsize=figsize, dpi=STYLE_CONFIG['figure']['dpi'])
-    fig.patch.set_facecolor(STYLE_CONFIG['figure']['facecolor'])
+    import numpy as np
+
+    if renderer not in ('auto', 'seaborn', 'image'):
+        raise ValueError(f"Rendu inconnu: {renderer!r}")
+
+    data = _as_array(data)
+    if renderer == 'auto':
+        renderer = 'image' if np.size(data) > HEATMAP_IMAGE_THRESHOLD else 'seaborn'
+        if renderer == 'seaborn':
+            try:
+                import seaborn  # noqa: F401
+            except ImportError:
+                renderer = 'image'
+
+    if ax is not None:
+        # Panneau d'une figure existante : mise en page et affichage à sa charge
+        layout, show = None, False
+    fig, ax = _new_figure('heatmap', figsize or (10, 8), layout, ax)
     
     cmap = cmap or 'RdYlBu_r'
     
-    # Gérer les tick labels (seaborn n'accepte pas None)
-    xtick = xticklabels if xticklabels is not None else True
-    ytick = yticklabels if yticklabels is not None else True
-    
-    # Créer la heatmap avec seaborn
-    sns.heatmap(data, annot=annot, fmt=fmt, cmap=cmap, 
-               xticklabels=xtick, yticklabels=ytick,
-               cbar_kws={'shrink': 0.8}, linewidths=0.5, linecolor='white',
-               ax=ax)
+    if renderer == 'image':
+        _heatmap_image(ax, data, cmap, annot, fmt, xticklabels, yticklabels)
+    else:
+        import seaborn as sns
+
+        # Gérer les tick labels (seaborn n'accepte pas None)
+        xtick = xticklabels if xticklabels is not None else True
+        ytick = yticklabels if yticklabels is not None else True
+        
+        # Créer la heatmap avec seaborn
+        with _phase('seaborn'):
+            sns.heatmap(data, annot=annot, fmt=fmt, cmap=cmap, 
+                       xticklabels=xtick, yticklabels=ytick,
+                       cbar_kws={'shrink': 0.8}, linewidths=0.5, linecolor='white',
+                       ax=ax)
     
+    _rasterize_data(ax, rasterize_threshold)
+
     # Appliquer le style (sans la grille pour les heatmaps)
-    ax.set_facecolor(STYLE_CONFIG['axes']['facecolor'])
-    
-    if title:
-        ax.set_title(title, fontsize=STYLE_CONFIG['fonts']['title'],
-                    fontweight='bold', pad=20, color='#333333')
-    if xlabel:
-        ax.set_xlabel(xlabel, fontsize=STYLE_CONFIG['fonts']['label'],
-                     fontweight='600', color='#555555')
-    if ylabel:
-        ax.set_ylabel(ylabel, fontsize=STYLE_CONFIG['fonts']['label'],
-                     fontweight='600', color='#555555')
-    
-    ax.tick_params(labelsize=STYLE_CONFIG['fonts']['tick'], colors='#666666')
-    plt.tight_layout()
-    
-    if show:
-        plt.show()
+    with _phase('style'):
+        style = _style()
+        ax.set_facecolor(style.axes_facecolor)
+        
+        if title:
+            ax.set_title(title, **style.title_kw)
+        if xlabel:
+            ax.set_xlabel(xlabel, **style.label_kw)
+        if ylabel:
+            ax.set_ylabel(ylabel, **style.label_kw)
+        
+        ax.tick_params(**style.tick_kw)
+    _finalize(fig, show, layout)
     
     return fig, ax
 
 
+@_traced
 def styled_box(data, labels=None, title=None, xlabel=None, ylabel=None,
-               color=None, horizontal=False, figsize=None, show=True):
+               color=None, horizontal=False, figsize=None, show=True,
+               layout='tight', ax=None, rasterize_threshold='auto'):
     """
     Crée une boîte à moustaches avec le style personnalisé.
     
     Parameters:
     -----------
-    data : array-like or list of array-like
-        Données à visualiser (peut être multiple pour plusieurs boîtes)
+    data : array-like, list of array-like, dict or list of dict
+        Données à visualiser (peut être multiple pour plusieurs boîtes), ou
+        statistiques précalculées au format de matplotlib.cbook.boxplot_stats
+        (voir vizstyle.stats.box_stats), tracées sans relire les échantillons
     labels : list of str, optional
         Labels pour chaque boîte
     title : str, optional
@@ -501,6 +1530,17 @@ def styled_box(data, labels=None, title=None, xlabel=None, ylabel=None,
         Taille de la figure
     show : bool, default=True
         Afficher le graphique immédiatement
+    layout : {'tight', 'constrained', 'cached'} or None, default='tight'
+        Mise en page : tight_layout à chaque appel, constrained_layout, ou
+        'cached' (marges de tight_layout réutilisées pour les figures de
+        même forme, voir LAYOUT_CACHE_SIZE) ; None n'ajuste rien.
+    ax : matplotlib.axes.Axes, optional
+        Axes existants où tracer (par ex. un panneau de dashboard) : figsize,
+        layout et show sont ignorés, la mise en page et l'affichage restent
+        à la charge de la figure.
+    rasterize_threshold : int, 'auto' or None, default='auto'
+        Nombre de boîtes et de points aberrants au-delà duquel ils sont
+        rastérisés en SVG/PDF ('auto' : RASTERIZE_THRESHOLD, None : jamais).
         
     Returns:
     --------
@@ -514,42 +1554,526 @@ def styled_box(data, labels=None, title=None, xlabel=None, ylabel=None,
     >>> data = [np.random.normal(0, 1, 100), np.random.normal(1, 1.5, 100)]
     >>> vizstyle.styled_box(data, labels=['Groupe A', 'Groupe B'], title="Comparaison")
     """
-    figsize = figsize or STYLE_CONFIG['figure']['figsize']
-    fig, ax = plt.subplots(figsize=figsize, dpi=STYLE_CONFIG['figure']['dpi'])
-    fig.patch.set_facecolor(STYLE_CONFIG['figure']['facecolor'])
+    import numpy as np
+
+    # Statistiques précalculées : un dict ou une liste de dicts
+    if isinstance(data, dict):
+        data = [data]
+    precomputed = isinstance(data, (list, tuple)) and len(data) > 0 and \
+        all(isinstance(item, dict) for item in data)
+
+    if precomputed:
+        if labels is not None and len(labels) != len(data):
+            raise ValueError("labels doit avoir un élément par boîte")
+        data = [dict(stats, label=labels[i]) if labels is not None else stats
+                for i, stats in enumerate(data)]
+    else:
+        data = _as_arrays(data)
+
+    if ax is not None:
+        # Panneau d'une figure existante : mise en page et affichage à sa charge
+        layout, show = None, False
+    fig, ax = _new_figure('box', figsize, layout, ax)
     
     # S'assurer que data est une liste de listes
-    if not isinstance(data[0], (list, np.ndarray)):
+    if not precomputed and not isinstance(data[0], (list, np.ndarray)):
         data = [data]
     
-    colors = color if color else STYLE_CONFIG['colors']['palette']
+    style = _style()
+    colors = color if color else style.palette
     if isinstance(colors, str):
         colors = [colors]
     
-    # Créer les boxplots
-    bp = ax.boxplot(data, labels=labels, patch_artist=True, 
-                    vert=not horizontal, widths=0.6,
-                    boxprops=dict(facecolor=colors[0], alpha=0.7, linewidth=1.5),
-                    whiskerprops=dict(linewidth=1.5),
-                    capprops=dict(linewidth=1.5),
-                    medianprops=dict(color='#D81159', linewidth=2.5),
-                    flierprops=dict(marker='o', markerfacecolor=colors[0], 
-                                   markersize=6, alpha=0.5))
+    props = dict(patch_artist=True, vert=not horizontal, widths=0.6,
+                 boxprops=dict(facecolor=colors[0], alpha=0.7, linewidth=1.5),
+                 whiskerprops=dict(linewidth=1.5),
+                 capprops=dict(linewidth=1.5),
+                 medianprops=dict(color=style.warning, linewidth=2.5),
+                 flierprops=dict(marker='o', markerfacecolor=colors[0],
+                                 markersize=6, alpha=0.5))
+
+    # Créer les boxplots (ax.bxp trace directement les statistiques)
+    if precomputed:
+        bp = ax.bxp(data, **props)
+    else:
+        bp = ax.boxplot(data, labels=labels, **props)
     
     # Colorer chaque boîte différemment si plusieurs
     if len(data) > 1:
         for patch, color in zip(bp['boxes'], colors * (len(data) // len(colors) + 1)):
             patch.set_facecolor(color)
     
+    _rasterize_data(ax, rasterize_threshold)
     _apply_style(ax, title, xlabel, ylabel)
-    plt.tight_layout()
-    
-    if show:
-        plt.show()
+    _finalize(fig, show, layout)
     
     return fig, ax
 
 
+def _panel_spec(spec, name):
+    """Convertit un panneau (tuple (kind, kwargs) ou dict) en (fonction, kwargs)."""
+    from .batch import _resolve
+
+    if isinstance(spec, (tuple, list)):
+        kind, kwargs = spec
+    elif isinstance(spec, dict):
+        kind, kwargs = spec.get('kind'), spec.get('kwargs', {})
+    else:
+        raise TypeError(f"Panneau invalide ({name!r}): {spec!r}")
+    if not kind or kind == 'dashboard':
+        raise ValueError(f"Panneau sans type de graphique ({name!r})")
+    return _resolve(kind), dict(kwargs)
+
+
+def _mosaic_spans(layout):
+    """
+    Cases d'une disposition nommée ('AAB;CCD' ou liste de lignes).
+
+    Returns:
+    --------
+    shape, spans : tuple
+        (n_lignes, n_colonnes) et, par nom, les tranches (lignes, colonnes)
+        de la GridSpec occupées par le panneau
+    """
+    rows = [list(row) for row in (layout.split(';') if isinstance(layout, str) else layout)]
+    if len({len(row) for row in rows}) != 1:
+        raise ValueError("Les lignes de la disposition doivent avoir la même longueur")
+    positions = {}
+    for r, row in enumerate(rows):
+        for c, name in enumerate(row):
+            if name != '.':
+                positions.setdefault(name, []).append((r, c))
+
+    spans = {}
+    for name, cells in positions.items():
+        r0, r1 = min(r for r, _ in cells), max(r for r, _ in cells) + 1
+        c0, c1 = min(c for _, c in cells), max(c for _, c in cells) + 1
+        if len(cells) != (r1 - r0) * (c1 - c0):
+            raise ValueError(f"Le panneau {name!r} n'occupe pas un rectangle")
+        spans[name] = (slice(r0, r1), slice(c0, c1))
+    return (len(rows), len(rows[0])), spans
+
+
+@_traced
+def dashboard(layout, panels, title=None, figsize=None, show=True, engine='tight',
+              width_ratios=None, height_ratios=None):
+    """
+    Assemble plusieurs graphiques styled_* dans une seule figure (GridSpec).
+
+    Le style est résolu une seule fois pour tous les panneaux, la mise en
+    page est calculée une seule fois pour toute la figure et un seul export
+    suffit : un rapport de 12 graphiques coûte une figure au lieu de 12.
+
+    Parameters:
+    -----------
+    layout : tuple (n_lignes, n_colonnes), str or list of list
+        Grille régulière, remplie ligne par ligne avec la liste `panels` ;
+        ou disposition nommée comme Figure.subplot_mosaic ('AAB;CCD' ou
+        [['A', 'A', 'B'], ['C', 'C', 'D']], '.' pour une case vide), les
+        panneaux étant alors un dict indexé par nom
+    panels : list or dict
+        Panneaux : tuples (kind, kwargs) ou dicts {'kind': ..., 'kwargs': ...}
+        comme vizstyle.batch.render_many (sans `show` ni `figsize`) ; None
+        laisse une case vide
+    title : str, optional
+        Titre de la figure
+    figsize : tuple, optional
+        Taille de la figure (défaut: une demi-figure STYLE_CONFIG par case)
+    show : bool, default=True
+        Afficher la figure immédiatement
+    engine : {'tight', 'constrained', 'cached'} or None, default='tight'
+        Mise en page de la figure, comme le paramètre `layout` des
+        fonctions styled_*
+    width_ratios, height_ratios : list of float, optional
+        Largeurs relatives des colonnes et hauteurs relatives des lignes
+
+    Returns:
+    --------
+    fig, axes : tuple
+        Figure et axes des panneaux : liste dans l'ordre de `panels` (None
+        pour les cases vides) ou dict indexé par nom
+
+    Example:
+    --------
+    >>> fig, axes = vizstyle.dashboard((2, 2), [
+    ...     ('line', {'x': x, 'y': y, 'title': "Ventes"}),
+    ...     ('bar', {'x': ['A', 'B'], 'y': [3, 7], 'title': "Régions"}),
+    ...     ('histogram', {'data': valeurs, 'title': "Délais"}),
+    ...     ('box', {'data': groupes, 'title': "Dispersion"}),
+    ... ], title="Rapport mensuel", show=False)
+    >>> png = vizstyle.render_bytes('dashboard', layout='AB;CC', panels={...})
+    """
+    style = _style()
+    gridspec_kw = {key: value for key, value in
+                   (('width_ratios', width_ratios), ('height_ratios', height_ratios))
+                   if value is not None}
+
+    mosaic = isinstance(layout, str) or (
+        isinstance(layout, (list, tuple)) and len(layout) > 0
+        and isinstance(layout[0], (list, tuple)))
+    if mosaic:
+        if not isinstance(panels, dict):
+            raise TypeError("Une disposition nommée attend un dict de panneaux")
+        (n_rows, n_cols), spans = _mosaic_spans(layout)
+        unknown = set(panels) - set(spans)
+        if unknown:
+            raise ValueError(f"Panneaux absents de la disposition: {sorted(unknown, key=str)}")
+        cells = [(name, spans[name]) for name in spans if panels.get(name) is not None]
+    else:
+        n_rows, n_cols = layout
+        panels = list(panels)
+        if len(panels) > n_rows * n_cols:
+            raise ValueError(f"{len(panels)} panneaux pour une grille de "
+                             f"{n_rows}x{n_cols} cases")
+        cells = [(i, divmod(i, n_cols)) for i, spec in enumerate(panels) if spec is not None]
+
+    if figsize is None:
+        figsize = (n_cols * style.figsize[0] / 2, n_rows * style.figsize[1] / 2)
+    fig, _ = _new_figure('dashboard', figsize, engine, subplots=False)
+    grid = fig.add_gridspec(n_rows, n_cols, **gridspec_kw)
+
+    specs = [(name, cell, *_panel_spec(panels[name], name)) for name, cell in cells]
+    # sns.heatmap dessine toute la figure (chevauchement des graduations) :
+    # les cartes de chaleur sont tracées d'abord, et chaque axe n'est créé
+    # qu'au moment de tracer son panneau
+    specs.sort(key=lambda spec: spec[2] is not styled_heatmap)
+
+    axes = {} if mosaic else [None] * len(panels)
+    # Un seul style (compilé une fois) pour tous les panneaux
+    with _style_scope(style):
+        for name, cell, func, kwargs in specs:
+            with _phase('figure'):
+                ax = axes[name] = fig.add_subplot(grid[cell])
+            func(ax=ax, **kwargs)
+    if mosaic:
+        # Ordre de la disposition
+        axes = {name: axes[name] for name, _ in cells}
+
+    if title:
+        fig.suptitle(title, **{key: value for key, value in style.title_kw.items()
+                               if key != 'pad'})
+    _finalize(fig, show, engine)
+
+    return fig, axes
+
+
+def render_bytes(kind, fmt='png', savefig=None, style=None, **kwargs):
+    """
+    Rend un graphique directement en octets, sans pyplot.
+
+    La figure est créée hors du gestionnaire global de pyplot (Figure et
+    canvas Agg dédiés), encodée dans un tampon mémoire puis abandonnée :
+    rien n'est à fermer, et plusieurs threads peuvent rendre en même temps
+    (serveurs web). Le style est figé au début de l'appel (instantané
+    immuable) : modifier STYLE_CONFIG pendant le rendu n'a pas d'effet.
+
+    Parameters:
+    -----------
+    kind : str
+        Type de graphique ('line' ou 'styled_line', 'bar', 'heatmap'...) ou
+        'dashboard'
+    fmt : str, default='png'
+        Format de sortie ('png', 'svg', 'pdf'...)
+    savefig : dict, optional
+        Arguments supplémentaires de fig.savefig (dpi, transparent...)
+    style : Style, str or dict, optional
+        Style compilé (style_snapshot(), Style.from_theme()...), nom d'un
+        thème, ou valeurs remplaçant celles de STYLE_CONFIG pour ce rendu
+        (défaut: instantané de STYLE_CONFIG)
+    **kwargs :
+        Arguments de la fonction styled_* ou de dashboard (sans `show`)
+
+    Returns:
+    --------
+    data : bytes
+        Image encodée
+
+    Example:
+    --------
+    >>> png = vizstyle.render_bytes('line', x=[1, 2, 3], y=[4, 2, 5], title="Courbe")
+    >>> svg = vizstyle.render_bytes('bar', fmt='svg', x=['A', 'B'], y=[3, 7])
+    """
+    import io
+
+    from .batch import _resolve
+
+    func = _resolve(kind)
+    style = _as_style(style)
+
+    with _style_scope(style), _figure_source(_detached_figure):
+        fig, ax = func(show=False, **kwargs)
+
+    buffer = io.BytesIO()
+    info = {'format': fmt}
+    with _phase('savefig', info):
+        fig.savefig(buffer, format=fmt, **(savefig or {}))
+        info['bytes'] = buffer.tell()
+    return buffer.getvalue()
+
+
+def _canvas_rgba(fig):
+    """Dessine la figure et retourne le buffer RGBA de son canvas Agg (vue H x W x 4)."""
+    import numpy as np
+
+    with _phase('draw'):
+        fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba())
+
+
+def to_array(kind, dpi=None, style=None, **kwargs):
+    """
+    Rend un graphique en tableau NumPy RGBA, sans encodage PNG.
+
+    La figure est créée hors pyplot et dessinée sur son canvas Agg ; le
+    tableau retourné est une vue (sans copie) du buffer de ce canvas. La
+    figure étant abandonnée, personne d'autre n'écrit dans ce buffer.
+
+    Parameters:
+    -----------
+    kind : str
+        Type de graphique ('line' ou 'styled_line', 'bar', 'heatmap'...) ou
+        'dashboard'
+    dpi : float, optional
+        Résolution (défaut: STYLE_CONFIG['figure']['dpi'])
+    style : Style, str or dict, optional
+        Style du rendu, comme pour render_bytes
+    **kwargs :
+        Arguments de la fonction styled_* ou de dashboard (sans `show`)
+
+    Returns:
+    --------
+    image : np.ndarray
+        Tableau uint8 de forme (hauteur, largeur, 4), identique aux pixels
+        d'un savefig PNG à la même résolution
+
+    Example:
+    --------
+    >>> image = vizstyle.to_array('line', x=[1, 2, 3], y=[4, 2, 5], figsize=(4, 3), dpi=64)
+    >>> image.shape
+    (192, 256, 4)
+    """
+    from .batch import _resolve
+
+    func = _resolve(kind)
+    style = _as_style(style)
+
+    def source(kind, figsize, default_dpi):
+        return _detached_figure(kind, figsize, dpi or default_dpi)
+
+    with _style_scope(style), _figure_source(source):
+        fig, ax = func(show=False, **kwargs)
+    return _canvas_rgba(fig)
+
+
+def to_arrays(kind, items, out=None, dpi=None, style=None, pool=None, **kwargs):
+    """
+    Rend N graphiques de même taille dans un seul tableau (N, H, W, 4).
+
+    Chaque graphique est dessiné puis copié directement dans sa tranche du
+    tableau préalloué, sans encodage ni décodage d'image.
+
+    Parameters:
+    -----------
+    kind : str
+        Type de graphique ('line', 'bar', 'heatmap'...) ou 'dashboard'
+    items : iterable of dict
+        Arguments propres à chaque graphique ({'x': ..., 'y': ...})
+    out : np.ndarray, optional
+        Tableau uint8 (N, H, W, 4) à remplir (par ex. un np.memmap) ; alloué
+        d'après le premier graphique s'il n'est pas fourni
+    dpi : float, optional
+        Résolution (défaut: STYLE_CONFIG['figure']['dpi'])
+    style : Style, str or dict, optional
+        Style des rendus, comme pour render_bytes
+    pool : FigurePool, optional
+        Pool dans lequel recycler les figures (voir vizstyle.pool) ; par
+        défaut chaque graphique a sa propre figure, comme avec to_array
+    **kwargs :
+        Arguments communs à tous les graphiques (title, figsize...)
+
+    Returns:
+    --------
+    images : np.ndarray
+        `out`, rempli
+
+    Example:
+    --------
+    >>> images = vizstyle.to_arrays('line', ({'x': x, 'y': y} for y in series),
+    ...                             figsize=(2, 2), dpi=32)
+    >>> images.shape
+    (len(series), 64, 64, 4)
+    """
+    import numpy as np
+
+    from .batch import _resolve
+
+    func = _resolve(kind)
+    style = _as_style(style)
+    items = items if hasattr(items, '__len__') else list(items)
+    if out is not None and (out.ndim != 4 or out.shape[0] != len(items) or out.shape[3] != 4
+                            or out.dtype != np.uint8):
+        raise ValueError(f"out doit être un tableau uint8 de forme ({len(items)}, H, W, 4), "
+                         f"pas {out.dtype} {out.shape}")
+
+    borrowed = []
+
+    def source(kind, figsize, default_dpi):
+        if pool is None:
+            return _detached_figure(kind, figsize, dpi or default_dpi)
+        fig, ax = pool.acquire(kind, figsize, dpi or default_dpi)
+        borrowed.append(fig)
+        return fig, ax
+
+    with _style_scope(style):
+        for i, item in enumerate(items):
+            try:
+                with _figure_source(source):
+                    fig, ax = func(show=False, **{**kwargs, **item})
+                image = _canvas_rgba(fig)
+                if out is None:
+                    out = np.empty((len(items), *image.shape), dtype=np.uint8)
+                if image.shape != out.shape[1:]:
+                    raise ValueError(f"Graphique {i} de taille {image.shape[:2]} au lieu de "
+                                     f"{out.shape[1:3]} : tous doivent avoir la même taille")
+                out[i] = image
+            finally:
+                # Le buffer est copié : la figure peut retourner au pool
+                while borrowed:
+                    pool.release(borrowed.pop())
+    return out
+
+
+def _encode_png(rgba, target, dpi, compress_level):
+    """Encode un buffer RGBA en PNG comme savefig, dans `target` ou en octets."""
+    import io
+
+    from matplotlib.image import imsave
+
+    buffer = io.BytesIO() if target is None else target
+    info = {'format': 'png'}
+    with _phase('savefig', info):
+        pil_kwargs = {} if compress_level is None else {'compress_level': compress_level}
+        imsave(buffer, rgba, format='png', dpi=dpi, pil_kwargs=pil_kwargs)
+        if target is None:
+            info['bytes'] = buffer.tell()
+            return buffer.getvalue()
+    return target
+
+
+def export(fig, formats=('png', 'svg', 'pdf'), path=None, dpi=None, png_compress_level=None,
+           savefig=None):
+    """
+    Exporte une figure dans plusieurs formats avec une seule mise en page.
+
+    La mise en page (moteur 'constrained' éventuel) est calculée une fois
+    puis figée pour tous les formats. Le PNG est dessiné une seule fois en
+    RGBA brut ; son encodage (zlib, qui libère le GIL) se fait dans un
+    thread pendant que les formats vectoriels (SVG, PDF...) sont dessinés.
+    Les dessins eux-mêmes restent successifs : une figure matplotlib ne
+    peut pas être dessinée par deux threads à la fois.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        Figure à exporter (par ex. retournée par une fonction styled_*)
+    formats : sequence of str, default=('png', 'svg', 'pdf')
+        Formats de sortie (tout format accepté par fig.savefig)
+    path : str or path-like, optional
+        Chemin sans extension ('rapport/ventes') : un fichier par format
+        (rapport/ventes.png, ...). Si absent, les images sont retournées
+        en octets
+    dpi : float, optional
+        Résolution (défaut: celle de la figure)
+    png_compress_level : int, optional
+        Niveau de compression zlib du PNG, de 0 à 9 (défaut: celui de
+        Pillow, 6). 1 est plusieurs fois plus rapide pour des fichiers à
+        peine plus gros
+    savefig : dict, optional
+        Arguments supplémentaires de fig.savefig (transparent, facecolor...) ;
+        `metadata`, propre à chaque format, n'est transmis qu'aux formats
+        autres que PNG. Avec `bbox_inches` ou `pad_inches`, le PNG est
+        exporté par un savefig ordinaire (dessin et encodage sur place)
+
+    Returns:
+    --------
+    outputs : dict
+        {format: octets} sans `path`, {format: chemin du fichier} sinon
+
+    Example:
+    --------
+    >>> fig, ax = vizstyle.styled_line(x, y, title="Ventes", show=False)
+    >>> vizstyle.export(fig, ['png', 'svg', 'pdf'], path='rapport/ventes', dpi=150)
+    {'png': 'rapport/ventes.png', 'svg': 'rapport/ventes.svg', 'pdf': 'rapport/ventes.pdf'}
+    >>> images = vizstyle.export(fig, ['png'], png_compress_level=1)
+    """
+    import io
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy as np
+
+    formats = [fmt.lower().lstrip('.') for fmt in formats]
+    if path is not None:
+        path = os.fspath(path)
+        stem, ext = os.path.splitext(path)
+        # 'ventes.png' avec formats=['png', 'svg'] : même radical pour tous
+        path = stem if ext.lstrip('.').lower() in formats else path
+    dpi = dpi or fig.dpi
+    targets = {fmt: (None if path is None else f"{path}.{fmt}") for fmt in formats}
+
+    # Mise en page calculée une fois, puis figée le temps des exports
+    engine = fig.get_layout_engine()
+    if engine is not None:
+        with _phase('layout'):
+            engine.execute(fig)
+        fig.set_layout_engine('none')
+
+    outputs = {}
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            # Une image recadrée (bbox_inches) n'a pas la taille de la figure :
+            # le PNG passe alors par savefig comme les autres formats
+            cropped = any((savefig or {}).get(key) is not None
+                          for key in ('bbox_inches', 'pad_inches'))
+            if 'png' in formats and not cropped:
+                raw = io.BytesIO()
+                fig.savefig(raw, format='rgba', dpi=dpi,
+                            **{k: v for k, v in (savefig or {}).items() if k != 'metadata'})
+                width, height = fig.get_size_inches() * dpi
+                rgba = np.frombuffer(raw.getbuffer(), dtype=np.uint8)
+                rgba = rgba.reshape(int(height), int(width), 4)
+                encode = (_encode_png, rgba, targets['png'], dpi, png_compress_level)
+                # Sans autre format, rien à recouvrir : encodage sur place
+                if len(formats) > 1:
+                    pending = executor.submit(*encode)
+                else:
+                    outputs['png'] = encode[0](*encode[1:])
+
+            for fmt in formats:
+                if fmt == 'png' and not cropped:
+                    continue
+                target = targets[fmt] or io.BytesIO()
+                options = dict(savefig or {})
+                if fmt == 'png':
+                    options.pop('metadata', None)
+                    if png_compress_level is not None:
+                        options['pil_kwargs'] = {'compress_level': png_compress_level}
+                info = {'format': fmt}
+                with _phase('savefig', info):
+                    fig.savefig(target, format=fmt, dpi=dpi, **options)
+                    if path is None:
+                        info['bytes'] = target.tell()
+                outputs[fmt] = targets[fmt] or target.getvalue()
+
+            if pending is not None:
+                outputs['png'] = pending.result()
+    finally:
+        if engine is not None:
+            fig.set_layout_engine(engine)
+    return {fmt: outputs[fmt] for fmt in formats}
+
+
 # Exporter les fonctions principales
 __all__ = [
     'styled_line',
@@ -558,6 +2082,16 @@ __all__ = [
     'styled_histogram',
     'styled_heatmap',
     'styled_box',
+    'dashboard',
+    'animate',
+    'render_bytes',
+    'to_array',
+    'to_arrays',
+    'export',
+    'style_snapshot',
+    'use_theme',
+    'Style',
+    'THEMES',
     'STYLE_CONFIG'
 ]
 
@@ -0,0 +1,233 @@
+"""
+Rendu asynchrone (asyncio)
+==========================
+
+Rendre un graphique bloque le thread pendant des centaines de
+millisecondes : appelé depuis une coroutine, styled_line(...) + savefig
+gèle la boucle d'événements. Ce module délègue le rendu
+(vizstyle.render_bytes) à un exécuteur borné :
+
+- 'thread' (défaut) : pool de threads ; chaque rendu utilise sa propre
+  figure et un instantané du style, sans état pyplot partagé. Le dessin
+  Agg garde le GIL : la boucle reste réactive mais peut être ralentie de
+  quelques dizaines de millisecondes sous forte charge.
+- 'process' : pool de processus (backend Agg), pour paralléliser les
+  rendus sur plusieurs cœurs et isoler complètement la boucle.
+
+Le nombre de rendus en cours est limité (`limit`) : au-delà, les appels
+attendent leur tour sans bloquer la boucle (contre-pression). Annuler la
+tâche qui attend un rendu retire celui-ci de la file s'il n'a pas commencé ;
+un rendu déjà lancé se termine mais son résultat est ignoré, et il occupe
+sa place dans la limite jusqu'à la fin.
+
+Exemple:
+--------
+>>> from vizstyle import aio
+>>> png = await aio.render('line', x=x, y=y, title="Ventes")
+>>> images = await aio.render_all([('bar', {'x': ['A', 'B'], 'y': [3, 7]}),
+...                                ('histogram', {'data': valeurs})])
+"""
+
+import asyncio
+import copy
+import os
+import threading
+
+__all__ = ['AsyncRenderer', 'render', 'render_all']
+
+
+def _render_job(kind, fmt, savefig, style, kwargs):
+    """Rendu exécuté par un worker (thread ou processus)."""
+    import vizstyle
+
+    return vizstyle.render_bytes(kind, fmt, savefig, style=style, **kwargs)
+
+
+class AsyncRenderer:
+    """
+    Exécuteur de rendus pour asyncio, avec limite de concurrence.
+
+    Parameters:
+    -----------
+    limit : int, optional
+        Nombre maximal de rendus en cours (défaut: os.cpu_count()) ; les
+        appels suivants attendent une place
+    executor : {'thread', 'process'}, default='thread'
+        Type de pool utilisé pour les rendus
+    mp_context : multiprocessing context, optional
+        Contexte multiprocessing (executor='process')
+
+    Attributes:
+    -----------
+    running : nombre de rendus en cours dans l'exécuteur
+    waiting : nombre d'appels en attente d'une place
+
+    Example:
+    --------
+    >>> async with AsyncRenderer(limit=4, executor='process') as renderer:
+    ...     png = await renderer.render('scatter', x=x, y=y)
+    """
+
+    def __init__(self, limit=None, executor='thread', mp_context=None):
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"Exécuteur inconnu: {executor!r}")
+        self.limit = limit or os.cpu_count() or 1
+        self.kind = executor
+        self.mp_context = mp_context
+        self.running = 0
+        self.waiting = 0
+        self._executor = None
+        self._slots = None
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        """Crée l'exécuteur au premier rendu."""
+        with self._lock:
+            if self._executor is None:
+                if self.kind == 'thread':
+                    from concurrent.futures import ThreadPoolExecutor
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.limit, thread_name_prefix='vizstyle')
+                else:
+                    from concurrent.futures import ProcessPoolExecutor
+
+                    import vizstyle
+                    from .batch import _init_worker
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.limit, mp_context=self.mp_context,
+                        initializer=_init_worker,
+                        initargs=(copy.deepcopy(vizstyle.STYLE_CONFIG),))
+            return self._executor
+
+    async def render(self, kind, fmt='png', savefig=None, style=None, **kwargs):
+        """
+        Rend un graphique sans bloquer la boucle d'événements.
+
+        Parameters:
+        -----------
+        kind, fmt, savefig, style, **kwargs :
+            Mêmes paramètres que vizstyle.render_bytes. Le style est figé au
+            moment de l'appel.
+
+        Returns:
+        --------
+        data : bytes
+            Image encodée
+        """
+        import vizstyle
+
+        # Instantané pris dans le thread de la boucle, au moment de l'appel
+        style = vizstyle._as_style(style)
+
+        # La limite s'applique par boucle d'événements (un sémaphore asyncio
+        # est lié à sa boucle)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._slots = loop, asyncio.Semaphore(self.limit)
+        slots = self._slots
+
+        self.waiting += 1
+        try:
+            await slots.acquire()
+        finally:
+            self.waiting -= 1
+
+        try:
+            future = self._get_executor().submit(_render_job, kind, fmt, savefig, style, kwargs)
+        except BaseException:
+            slots.release()
+            raise
+        self.running += 1
+
+        # La place est rendue quand le rendu se termine réellement (même annulé)
+        def release():
+            self.running -= 1
+            slots.release()
+
+        def done(_):
+            try:
+                loop.call_soon_threadsafe(release)
+            except RuntimeError:
+                pass  # boucle déjà fermée
+        future.add_done_callback(done)
+
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    async def render_all(self, specs, return_exceptions=False):
+        """
+        Rend une liste de graphiques en parallèle (dans la limite de concurrence).
+
+        Parameters:
+        -----------
+        specs : iterable of dict or tuple
+            Spécifications comme pour vizstyle.batch.render_many : tuples
+            (kind, kwargs) ou dicts avec les clés 'kind', 'kwargs' et
+            optionnellement 'format' et 'savefig'
+        return_exceptions : bool, default=False
+            Retourner les exceptions à la place des images au lieu de lever
+            la première
+
+        Returns:
+        --------
+        images : list of bytes
+            Dans l'ordre des spécifications
+        """
+        from .batch import _normalize
+
+        jobs = [_normalize(spec, i) for i, spec in enumerate(specs)]
+        return await asyncio.gather(
+            *(self.render(job['kind'], job['format'], job['savefig'], **job['kwargs'])
+              for job in jobs),
+            return_exceptions=return_exceptions)
+
+    def close(self, wait=True):
+        """Arrête l'exécuteur."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def __repr__(self):
+        return (f"AsyncRenderer(limit={self.limit}, executor={self.kind!r}, "
+                f"en cours={self.running}, en attente={self.waiting})")
+
+
+# Exécuteur partagé des fonctions du module, créé au premier appel
+_default = None
+_default_lock = threading.Lock()
+
+
+def _default_renderer():
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = AsyncRenderer()
+        return _default
+
+
+async def render(kind, fmt='png', savefig=None, style=None, **kwargs):
+    """
+    Rend un graphique avec l'exécuteur partagé (threads, limite os.cpu_count()).
+
+    Mêmes paramètres que vizstyle.render_bytes ; voir AsyncRenderer.render.
+    """
+    return await _default_renderer().render(kind, fmt, savefig, style, **kwargs)
+
+
+async def render_all(specs, return_exceptions=False):
+    """
+    Rend une liste de graphiques avec l'exécuteur partagé ; voir
+    AsyncRenderer.render_all.
+    """
+    return await _default_renderer().render_all(specs, return_exceptions)
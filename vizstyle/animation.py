@@ -0,0 +1,391 @@
+"""
+Animations et séquences d'images
+================================
+
+animate construit la figure stylisée une seule fois (première image), puis
+pour chaque image suivante ne remplace que les données des artistes déjà
+tracés :
+
+- 'line' : données des courbes (Line2D.set_data, sous-échantillonnées
+  comme styled_line)
+- 'scatter' : positions des points (set_offsets), tailles et couleurs
+- 'bar' : hauteurs des barres (catégories fixes)
+- 'heatmap' : tableau de l'image (set_data) et annotations
+
+Chaque image est dessinée sur le canvas Agg et son buffer RGBA brut est
+transmis directement à l'encodeur, sans savefig :
+
+- vidéo (.mp4, .webm, .mov, .mkv, .avi) : flux rawvideo vers ffmpeg
+  (binaire local, voir rcParams['animation.ffmpeg_path']) ;
+- .gif : ffmpeg s'il est présent, sinon Pillow (images gardées en mémoire,
+  en 256 couleurs, jusqu'à l'écriture) ;
+- dossier : une image PNG par frame (frame_00000.png, ...).
+
+Exemple:
+--------
+>>> frames = ({'x': x + 0.1 * t, 'y': y, 'title': f"t = {t}"} for t in range(300))
+>>> vizstyle.animate('scatter', frames, 'nuage.mp4', fps=30, xlabel="X", ylabel="Y")
+>>> vizstyle.animate('heatmap', (grille(t) for t in range(100)), 'images/')
+"""
+
+import os
+
+__all__ = ['animate']
+
+# Extensions encodées par ffmpeg (obligatoire)
+VIDEO_EXTENSIONS = ('.mp4', '.webm', '.mov', '.mkv', '.avi')
+
+# Arguments de données de chaque type animable, dans l'ordre des frames
+# données sous forme de tuple (ou d'une seule valeur)
+DATA_ARGUMENTS = {
+    'line': ('x', 'y'),
+    'scatter': ('x', 'y'),
+    'bar': ('x', 'y'),
+    'heatmap': ('data',),
+}
+
+
+def _frame_kwargs(kind, frame):
+    """Arguments d'une frame : dict, tuple dans l'ordre de DATA_ARGUMENTS, ou valeur seule."""
+    if isinstance(frame, dict):
+        return dict(frame)
+    names = DATA_ARGUMENTS[kind]
+    if len(names) == 1:
+        return {names[0]: frame}
+    if isinstance(frame, (tuple, list)) and len(frame) == len(names):
+        return dict(zip(names, frame))
+    raise TypeError(f"Frame invalide pour {kind!r} : dict ou tuple {names} attendu")
+
+
+def _line_updater(ax, autoscale):
+    import vizstyle
+
+    lines = list(ax.lines)
+
+    def update(current, changed):
+        y = vizstyle._as_arrays(current['y'])
+        series = y if len(lines) > 1 else [y]
+        if len(series) != len(lines):
+            raise ValueError(f"{len(series)} séries au lieu de {len(lines)}")
+        x = vizstyle._as_array(current['x'])
+        for line, values in zip(lines, series):
+            line.set_data(*vizstyle._reduce_line(x, values, ax, current.get('downsample', 'auto')))
+        if autoscale:
+            ax.relim()
+            ax.autoscale_view()
+    return update
+
+
+def _scatter_updater(ax, autoscale):
+    import numpy as np
+
+    import vizstyle
+
+    points = ax.collections[0]
+    mapped = points.get_array() is not None
+
+    def update(current, changed):
+        if 'x' in changed or 'y' in changed:
+            offsets = np.column_stack((np.asarray(vizstyle._as_array(current['x']), dtype=float),
+                                       np.asarray(vizstyle._as_array(current['y']), dtype=float)))
+            points.set_offsets(offsets)
+            if autoscale:
+                ax.ignore_existing_data_limits = True
+                ax.update_datalim(offsets)
+                ax.autoscale_view()
+        if changed.get('size') is not None:
+            points.set_sizes(np.atleast_1d(changed['size']))
+        if changed.get('color') is not None:
+            if mapped:
+                points.set_array(np.asarray(changed['color']))
+            else:
+                points.set_facecolor(changed['color'])
+    return update
+
+
+def _bar_updater(ax, autoscale):
+    import numpy as np
+
+    import vizstyle
+
+    groups = list(ax.containers)
+
+    def update(current, changed):
+        y = vizstyle._as_arrays(current['y'])
+        # Même détection que styled_bar : un seul groupe reste une liste de séries
+        heights = y if vizstyle._is_grouped(y) else [y]
+        horizontal = current.get('horizontal', False)
+        for bars, values in zip(groups, heights):
+            values = np.asarray(values, dtype=float)
+            if len(values) != len(bars):
+                raise ValueError(f"{len(values)} barres au lieu de {len(bars)} "
+                                 "(les catégories sont fixées par la première frame)")
+            for rect, value in zip(bars, values):
+                if horizontal:
+                    rect.set_width(value)
+                else:
+                    rect.set_height(value)
+        if autoscale:
+            ax.relim()
+            ax.autoscale_view()
+    return update
+
+
+def _heatmap_updater(ax, autoscale):
+    import numpy as np
+
+    import vizstyle
+
+    im = ax.images[0]
+    shape = im.get_extent()
+    shape = (int(abs(shape[2] - shape[3])), int(abs(shape[1] - shape[0])))
+    annotated = len(ax.texts) > 0
+    width_px, height_px = vizstyle._heatmap_pixels(ax)
+
+    def update(current, changed):
+        data = vizstyle._as_array(current['data'])
+        data = data.to_numpy() if hasattr(data, 'columns') else np.asarray(data, dtype=float)
+        if data.shape != shape:
+            raise ValueError(f"Matrice {data.shape} au lieu de {shape}")
+        image, _ = vizstyle._block_mean(data, (int(height_px), int(width_px)))
+        im.set_data(np.ma.masked_invalid(image))
+        if autoscale:
+            im.autoscale()
+        if annotated:
+            for text in list(ax.texts):
+                text.remove()
+            vizstyle._annotate_heatmap(ax, im, image, current.get('fmt', '.2f'))
+    return update
+
+
+_UPDATERS = {
+    'line': _line_updater,
+    'scatter': _scatter_updater,
+    'bar': _bar_updater,
+    'heatmap': _heatmap_updater,
+}
+
+
+def _ffmpeg_path():
+    """Chemin du binaire ffmpeg (rcParams['animation.ffmpeg_path']), ou None."""
+    import shutil
+
+    from matplotlib import rcParams
+
+    return shutil.which(rcParams['animation.ffmpeg_path'])
+
+
+class _FfmpegWriter:
+    """Envoie les buffers RGBA bruts à ffmpeg (démarré à la première image)."""
+
+    def __init__(self, ffmpeg, path, fps, codec=None):
+        self.ffmpeg = ffmpeg
+        self.path = path
+        self.fps = fps
+        self.codec = codec
+        self._process = None
+        self._errors = None
+
+    def _start(self, width, height):
+        import subprocess
+        import tempfile
+
+        command = [self.ffmpeg, '-y', '-loglevel', 'error',
+                   '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}',
+                   '-r', str(self.fps), '-i', '-']
+        if self.path.lower().endswith('.gif'):
+            # Palette calculée sur toute la vidéo
+            command += ['-filter_complex', '[0:v]split[a][b];[a]palettegen[p];[b][p]paletteuse']
+        else:
+            # yuv420p (lisible partout) impose des dimensions paires
+            command += ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p']
+            if self.codec:
+                command += ['-vcodec', self.codec]
+        command.append(self.path)
+        self._errors = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE,
+                                         stdout=subprocess.DEVNULL, stderr=self._errors)
+
+    def write(self, rgba):
+        if self._process is None:
+            self._start(rgba.shape[1], rgba.shape[0])
+        try:
+            self._process.stdin.write(rgba)
+        except BrokenPipeError:
+            self.close()
+            raise RuntimeError("ffmpeg s'est arrêté pendant l'encodage")
+
+    def close(self):
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        if not process.stdin.closed:
+            process.stdin.close()
+        process.wait()
+        self._errors.seek(0)
+        errors = self._errors.read().decode(errors='replace').strip()
+        self._errors.close()
+        if process.returncode != 0:
+            raise RuntimeError(f"Échec de ffmpeg ({process.returncode}): {errors}")
+
+
+class _GifWriter:
+    """GIF avec Pillow : images réduites à 256 couleurs, écrites à la fermeture."""
+
+    def __init__(self, path, fps):
+        self.path = path
+        self.duration = int(round(1000 / fps))
+        self._frames = []
+
+    def write(self, rgba):
+        from PIL import Image
+
+        image = Image.frombuffer('RGBA', (rgba.shape[1], rgba.shape[0]), rgba, 'raw', 'RGBA', 0, 1)
+        method = getattr(Image, 'Quantize', Image).FASTOCTREE
+        self._frames.append(image.convert('RGB').quantize(256, method=method))
+
+    def close(self):
+        if self._frames:
+            first, *rest = self._frames
+            first.save(self.path, save_all=True, append_images=rest,
+                       duration=self.duration, loop=0)
+        self._frames = []
+
+
+class _FrameDirWriter:
+    """Une image PNG par frame dans un dossier."""
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.count = 0
+
+    def write(self, rgba):
+        from PIL import Image
+
+        image = Image.frombuffer('RGBA', (rgba.shape[1], rgba.shape[0]), rgba, 'raw', 'RGBA', 0, 1)
+        image.save(os.path.join(self.directory, f"frame_{self.count:05d}.png"))
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+def _writer(out, fps, codec):
+    """Choisit l'encodeur d'après la sortie (extension vidéo, .gif ou dossier)."""
+    path = os.fspath(out)
+    ext = os.path.splitext(path)[1].lower()
+    if ext in VIDEO_EXTENSIONS:
+        ffmpeg = _ffmpeg_path()
+        if ffmpeg is None:
+            raise RuntimeError(f"ffmpeg introuvable : nécessaire pour les vidéos {ext} "
+                               "(sinon, utilisez un .gif ou un dossier d'images)")
+        return _FfmpegWriter(ffmpeg, path, fps, codec)
+    if ext == '.gif':
+        ffmpeg = _ffmpeg_path()
+        return _FfmpegWriter(ffmpeg, path, fps) if ffmpeg else _GifWriter(path, fps)
+    if not ext or os.path.isdir(path):
+        return _FrameDirWriter(path)
+    raise ValueError(f"Sortie non prise en charge: {path!r} "
+                     f"({', '.join(VIDEO_EXTENSIONS)}, .gif ou dossier)")
+
+
+def animate(kind, frames, out, fps=10, dpi=None, style=None, autoscale=False, codec=None,
+            **kwargs):
+    """
+    Exporte une animation : la figure est construite une seule fois, puis
+    seules les données changent d'une image à l'autre.
+
+    Parameters:
+    -----------
+    kind : str
+        Type de graphique : 'line', 'scatter', 'bar' ou 'heatmap' (ou
+        'styled_line'...)
+    frames : iterable
+        Une entrée par image, lue au fur et à mesure : dict d'arguments de
+        la fonction styled_* ({'x': ..., 'y': ...}, {'data': ...}, avec
+        éventuellement 'title', 'color', 'size'), tuple (x, y), ou matrice
+        seule pour 'heatmap'. Les arguments absents gardent leur valeur
+        précédente.
+    out : str or path-like
+        Fichier vidéo (.mp4, .webm... : ffmpeg requis), .gif, ou dossier
+        d'images PNG
+    fps : float, default=10
+        Images par seconde
+    dpi : float, optional
+        Résolution des images (défaut: STYLE_CONFIG['figure']['dpi'])
+    style : Style, str or dict, optional
+        Style du rendu, comme pour render_bytes
+    autoscale : bool, default=False
+        Recalculer les limites des axes (ou l'échelle de couleurs de la
+        heatmap) à chaque image ; par défaut celles de la première image
+        sont conservées
+    codec : str, optional
+        Codec vidéo de ffmpeg (par ex. 'libx264', 'libvpx-vp9')
+    **kwargs :
+        Arguments fixes de la fonction styled_* (title, xlabel, cmap...)
+
+    Returns:
+    --------
+    n_frames : int
+        Nombre d'images écrites
+
+    Example:
+    --------
+    >>> vizstyle.animate('bar', ((regions, ventes[mois]) for mois in range(12)),
+    ...                  'ventes.gif', fps=2, title="Ventes")
+    """
+    import vizstyle
+    from .batch import _resolve
+
+    name = kind[len('styled_'):] if kind.startswith('styled_') else kind
+    if name not in _UPDATERS:
+        raise ValueError(f"Type non animable: {kind!r} (disponibles: {', '.join(_UPDATERS)})")
+    # Rendus dont les artistes peuvent être mis à jour sur place
+    if name == 'scatter' and kwargs.setdefault('mode', 'points') != 'points':
+        raise ValueError("animate('scatter') ne prend en charge que mode='points'")
+    if name == 'bar' and kwargs.setdefault('renderer', 'patches') != 'patches':
+        raise ValueError("animate('bar') ne prend en charge que renderer='patches'")
+    if name == 'heatmap' and kwargs.setdefault('renderer', 'image') != 'image':
+        raise ValueError("animate('heatmap') ne prend en charge que renderer='image'")
+
+    func = _resolve(name)
+    style = vizstyle._as_style(style)
+    frames = iter(frames)
+    try:
+        first = _frame_kwargs(name, next(frames))
+    except StopIteration:
+        raise ValueError("Aucune frame à animer") from None
+
+    writer = _writer(out, fps, codec)
+
+    def source(kind, figsize, default_dpi):
+        return vizstyle._detached_figure(kind, figsize, dpi or default_dpi)
+
+    count = 0
+    try:
+        current = {**kwargs, **first}
+        with vizstyle._style_scope(style):
+            with vizstyle._figure_source(source):
+                fig, ax = func(show=False, **current)
+            update = _UPDATERS[name](ax, autoscale)
+            canvas = fig.canvas
+
+            frame = first
+            while True:
+                if count:
+                    if 'title' in frame:
+                        ax.title.set_text(frame['title'])
+                    update(current, frame)
+                canvas.draw()
+                writer.write(canvas.buffer_rgba())
+                count += 1
+
+                frame = next(frames, None)
+                if frame is None:
+                    break
+                frame = _frame_kwargs(name, frame)
+                current.update(frame)
+    finally:
+        writer.close()
+    return count
@@ -0,0 +1,160 @@
+"""
+Rendu en lot (batch) de graphiques VizStyle
+===========================================
+
+Rend un grand nombre de graphiques en parallèle dans un pool de processus
+utilisant le backend Agg (sans affichage). Chaque processus est initialisé
+une seule fois : matplotlib, vizstyle et la configuration STYLE_CONFIG sont
+chargés au démarrage du worker et réutilisés pour tous ses graphiques.
+
+Exemple:
+--------
+>>> from vizstyle.batch import render_many
+>>> specs = [
+...     {'kind': 'line', 'kwargs': {'x': [1, 2, 3], 'y': [4, 2, 5]}, 'name': 'courbe'},
+...     {'kind': 'styled_bar', 'kwargs': {'x': ['A', 'B'], 'y': [3, 7]}},
+... ]
+>>> results = render_many(specs, 'sorties/', workers=4)
+>>> results[0]['path'], results[0]['seconds']
+"""
+
+import copy
+import os
+import time
+import traceback
+
+__all__ = ['render_many']
+
+
+def _resolve(kind):
+    """
+    Retourne la fonction styled_* correspondant à `kind` ('line' ou
+    'styled_line'), ou vizstyle.dashboard pour 'dashboard'.
+    """
+    import vizstyle
+
+    name = kind if kind.startswith('styled_') or kind == 'dashboard' else f'styled_{kind}'
+    func = getattr(vizstyle, name, None)
+    if func is None or name not in vizstyle.__all__:
+        raise ValueError(f"Type de graphique inconnu: {kind!r}")
+    return func
+
+
+def _normalize(spec, index):
+    """Convertit une spécification (dict ou tuple (kind, kwargs)) en dict complet."""
+    if isinstance(spec, (tuple, list)):
+        kind, kwargs = spec
+        spec = {'kind': kind, 'kwargs': kwargs}
+    elif not isinstance(spec, dict):
+        raise TypeError(f"Spécification invalide (index {index}): {spec!r}")
+
+    kind = spec.get('kind') or spec.get('func')
+    if not kind:
+        raise ValueError(f"Spécification sans 'kind' (index {index})")
+
+    fmt = spec.get('format', 'png')
+    name = spec.get('name') or f"{index:05d}_{kind.replace('styled_', '')}"
+    return {
+        'kind': kind,
+        'kwargs': dict(spec.get('kwargs', {})),
+        'name': name,
+        'format': fmt,
+        'savefig': dict(spec.get('savefig', {})),
+    }
+
+
+def _init_worker(style_config):
+    """
+    Initialise un processus worker : backend Agg, import de pyplot et de
+    vizstyle, et copie de la configuration de style du processus parent.
+    """
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    import matplotlib.pyplot  # noqa: F401  (chargé une seule fois par worker)
+
+    import vizstyle
+    vizstyle.STYLE_CONFIG.clear()
+    vizstyle.STYLE_CONFIG.update(style_config)
+
+
+def _render_one(job):
+    """Rend une spécification normalisée et retourne le résultat (dict)."""
+    import matplotlib.pyplot as plt
+
+    path = job['path']
+    t0 = time.perf_counter()
+    try:
+        func = _resolve(job['kind'])
+        fig, ax = func(show=False, **job['kwargs'])
+        try:
+            fig.savefig(path, format=job['format'], **job['savefig'])
+        finally:
+            plt.close(fig)
+    except Exception as exc:
+        return {'name': job['name'], 'path': None,
+                'seconds': time.perf_counter() - t0,
+                'error': f"{type(exc).__name__}: {exc}",
+                'traceback': traceback.format_exc()}
+    return {'name': job['name'], 'path': path,
+            'seconds': time.perf_counter() - t0, 'error': None}
+
+
+def render_many(specs, out_dir, workers=None, chunksize=None, mp_context=None):
+    """
+    Rend une liste de graphiques dans `out_dir` en parallèle.
+
+    Parameters:
+    -----------
+    specs : iterable of dict or tuple
+        Spécifications déclaratives. Chaque élément est soit un tuple
+        (kind, kwargs), soit un dict avec les clés :
+        - 'kind' : nom de la fonction ('line' ou 'styled_line')
+        - 'kwargs' : arguments passés à la fonction (sans `show`)
+        - 'name' : nom du fichier sans extension (optionnel)
+        - 'format' : format de sortie, 'png' par défaut (optionnel)
+        - 'savefig' : arguments supplémentaires pour fig.savefig (optionnel)
+    out_dir : str or path-like
+        Dossier de sortie (créé si nécessaire)
+    workers : int, optional
+        Nombre de processus (défaut: os.cpu_count()). Avec workers=1 le
+        rendu se fait dans le processus courant.
+    chunksize : int, optional
+        Nombre de graphiques envoyés à un worker à la fois
+    mp_context : multiprocessing context, optional
+        Contexte multiprocessing (par ex. multiprocessing.get_context('spawn'))
+
+    Returns:
+    --------
+    results : list of dict
+        Un résultat par spécification, dans l'ordre d'entrée, avec les clés
+        'name', 'path', 'seconds' et 'error' (None si succès ; en cas
+        d'échec, 'traceback' contient la trace complète).
+    """
+    import vizstyle
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    jobs = []
+    for i, spec in enumerate(specs):
+        job = _normalize(spec, i)
+        job['path'] = os.path.join(out_dir, f"{job['name']}.{job['format']}")
+        jobs.append(job)
+
+    if not jobs:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+
+    if workers == 1:
+        return [_render_one(job) for job in jobs]
+
+    style_config = copy.deepcopy(vizstyle.STYLE_CONFIG)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = chunksize or max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                             initializer=_init_worker,
+                             initargs=(style_config,)) as executor:
+        return list(executor.map(_render_one, jobs, chunksize=chunksize))
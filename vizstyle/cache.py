@@ -0,0 +1,341 @@
+"""
+Cache de rendus VizStyle
+========================
+
+Les tableaux de bord redemandent sans cesse les mêmes graphiques. Un
+RenderCache garde les images encodées (PNG, SVG...) indexées par une
+empreinte de tout ce qui détermine le rendu :
+
+- le type de graphique, le format et les arguments de savefig
+- les arguments de la fonction styled_* (octets des tableaux NumPy, listes,
+  DataFrame pandas ; chemin, taille et date des fichiers .npy/.npz)
+- STYLE_CONFIG
+- les versions de vizstyle et de matplotlib
+
+Deux niveaux : un LRU en mémoire (quelques dizaines d'images) et un dossier
+sur disque plafonné en taille (les fichiers les moins récemment utilisés
+sont supprimés). Un succès de cache ne charge pas matplotlib ; un échec
+rend le graphique avec vizstyle.render_bytes. Les rendus dont un argument
+n'a pas d'empreinte fiable (objet quelconque) ne sont pas mis en cache.
+
+Exemple:
+--------
+>>> from vizstyle.cache import RenderCache
+>>> cache = RenderCache('cache_graphiques/', max_bytes=512 * 2**20)
+>>> png = cache.render('line', x=x, y=y, title="Ventes")
+>>> cache.hits, cache.misses
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+__all__ = ['RenderCache', 'fingerprint']
+
+
+def _matplotlib_version():
+    """Version de matplotlib, lue dans les métadonnées sans l'importer."""
+    try:
+        from importlib.metadata import version
+        return version('matplotlib')
+    except Exception:
+        return 'inconnue'
+
+
+def _update_array(h, values):
+    """Ajoute un tableau NumPy à l'empreinte (par blocs pour les np.memmap)."""
+    import numpy as np
+
+    import vizstyle
+
+    h.update(f"ndarray:{values.dtype.str}:{values.shape}".encode())
+    if values.dtype.kind == 'O':
+        for item in values.reshape(-1):
+            _update(h, item)
+        return
+    flat = values.reshape(-1)
+    for start in range(0, len(flat), vizstyle.CHUNK_SIZE):
+        h.update(np.ascontiguousarray(flat[start:start + vizstyle.CHUNK_SIZE]).data)
+
+
+def _is_buffer(value):
+    """Indique si `value` expose le protocole buffer."""
+    try:
+        memoryview(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _update(h, value):
+    """Ajoute une valeur quelconque (récursivement) à l'empreinte `h`."""
+    import datetime
+    import numbers
+
+    if value is None or isinstance(value, (bool, numbers.Number, datetime.date,
+                                           datetime.time, datetime.timedelta)):
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, str):
+        h.update(f"str:{len(value)}:".encode())
+        h.update(value.encode('utf-8', 'surrogatepass'))
+        # Fichier de données : son contenu peut changer sous le même nom
+        if value.endswith(('.npy', '.npz')) and os.path.isfile(value):
+            stat = os.stat(value)
+            h.update(f"fichier:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    elif isinstance(value, bytes):
+        h.update(f"bytes:{len(value)}:".encode())
+        h.update(value)
+    elif isinstance(value, os.PathLike):
+        _update(h, os.fspath(value))
+    elif isinstance(value, Mapping):
+        h.update(f"dict:{len(value)}:".encode())
+        for key in sorted(value, key=repr):
+            _update(h, key)
+            _update(h, value[key])
+    elif isinstance(value, (list, tuple)):
+        import numpy as np
+
+        h.update(f"{type(value).__name__}:{len(value)}:".encode())
+        # Listes homogènes (nombres, chaînes) : hachées d'un bloc
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            array = None
+        if array is not None and array.dtype.kind in 'biufcUSmM':
+            _update_array(h, array)
+        else:
+            for item in value:
+                _update(h, item)
+    elif type(value).__module__ == 'numpy' or hasattr(value, '__array_interface__'):
+        import numpy as np
+        _update_array(h, np.asarray(value))
+    elif hasattr(value, 'to_numpy') and hasattr(value, 'index'):
+        # Series / DataFrame pandas : valeurs, index et noms de colonnes
+        h.update(f"{type(value).__name__}:".encode())
+        _update(h, list(value.index))
+        _update(h, list(getattr(value, 'columns', [getattr(value, 'name', None)])))
+        _update_array(h, value.to_numpy())
+    elif _is_buffer(value):
+        # memoryview, bytearray, array.array... : octets, type et forme
+        import numpy as np
+        _update_array(h, np.asarray(value))
+    else:
+        # Pas d'empreinte du contenu (repr souvent basé sur l'adresse ou
+        # tronqué) : deux données différentes auraient la même clé
+        raise TypeError(f"Argument sans empreinte de contenu: {type(value).__qualname__}")
+
+
+def fingerprint(kind, fmt='png', savefig=None, **kwargs):
+    """
+    Empreinte (hexadécimale) d'un rendu : type de graphique, format,
+    arguments, STYLE_CONFIG et versions de vizstyle et matplotlib. Lève
+    TypeError pour un argument dont le contenu ne peut pas être haché
+    (objet quelconque dont seul le repr serait disponible).
+
+    Parameters:
+    -----------
+    kind : str
+        Type de graphique ('line' ou 'styled_line'...)
+    fmt : str, default='png'
+        Format de sortie
+    savefig : dict, optional
+        Arguments supplémentaires de fig.savefig
+    **kwargs :
+        Arguments de la fonction styled_*
+
+    Returns:
+    --------
+    key : str
+    """
+    import vizstyle
+
+    h = hashlib.blake2b(digest_size=20)
+    _update(h, kind if kind.startswith('styled_') else f'styled_{kind}')
+    _update(h, fmt)
+    _update(h, savefig or {})
+    _update(h, kwargs)
+    _update(h, vizstyle.STYLE_CONFIG)
+    _update(h, (vizstyle.__version__, _matplotlib_version()))
+    return h.hexdigest()
+
+
+class RenderCache:
+    """
+    Cache d'images rendues, en mémoire et (optionnellement) sur disque.
+
+    Parameters:
+    -----------
+    directory : str or path-like, optional
+        Dossier du cache disque (créé si nécessaire) ; sans dossier seul le
+        niveau mémoire est utilisé
+    max_bytes : int, default=256 Mo
+        Taille maximale du cache disque
+    memory_items : int, default=64
+        Nombre d'images gardées en mémoire (0 pour désactiver)
+
+    Attributes:
+    -----------
+    hits, misses : nombre de succès et d'échecs de cache
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 2**20, memory_items=64):
+        self.directory = os.fspath(directory) if directory is not None else None
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    # ------------------------------------------------------------------
+    # Stockage
+    # ------------------------------------------------------------------
+    def _path(self, key, fmt):
+        return os.path.join(self.directory, f"{key}.{fmt}")
+
+    def _disk_entries(self):
+        """Fichiers du cache disque : (chemin, taille, dernier accès)."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _remember(self, key, data):
+        """Ajoute une image au niveau mémoire (LRU)."""
+        if self.memory_items <= 0:
+            return
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        """Supprime les fichiers les moins récemment utilisés au-delà de max_bytes."""
+        if self._disk_bytes <= self.max_bytes:
+            return
+        for path, size, _ in sorted(self._disk_entries(), key=lambda e: e[2]):
+            if self._disk_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            self._disk_bytes -= size
+
+    def get(self, key, fmt='png'):
+        """
+        Image associée à `key`, ou None (l'accès la rend la plus récente).
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+        if self.directory is None:
+            return None
+
+        path = self._path(key, fmt)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            self._remember(key, data)
+        return data
+
+    def put(self, key, data, fmt='png'):
+        """Enregistre une image dans les deux niveaux du cache."""
+        with self._lock:
+            self._remember(key, data)
+        if self.directory is None or len(data) > self.max_bytes:
+            return
+
+        # Écriture atomique : un lecteur concurrent ne voit jamais de fichier partiel
+        path = self._path(key, fmt)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        with self._lock:
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp, path)
+            self._disk_bytes += len(data) - previous
+            self._evict()
+
+    # ------------------------------------------------------------------
+    # Rendu
+    # ------------------------------------------------------------------
+    def render(self, kind, fmt='png', savefig=None, **kwargs):
+        """
+        Image encodée d'un graphique, depuis le cache si possible.
+
+        Parameters:
+        -----------
+        kind : str
+            Type de graphique ('line' ou 'styled_line'...)
+        fmt : str, default='png'
+            Format de sortie ('png', 'svg', 'pdf'...)
+        savefig : dict, optional
+            Arguments supplémentaires de fig.savefig (dpi...)
+        **kwargs :
+            Arguments de la fonction styled_* (sans `show`)
+
+        Returns:
+        --------
+        data : bytes
+        """
+        try:
+            key = fingerprint(kind, fmt, savefig, **kwargs)
+        except TypeError:
+            # Arguments sans empreinte fiable : rendu direct, sans cache
+            with self._lock:
+                self.misses += 1
+            return _render(kind, fmt, savefig, kwargs)
+        data = self.get(key, fmt)
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+            return data
+
+        with self._lock:
+            self.misses += 1
+        data = _render(kind, fmt, savefig, kwargs)
+        self.put(key, data, fmt)
+        return data
+
+    def clear(self):
+        """Vide le cache (mémoire et disque)."""
+        with self._lock:
+            self._memory.clear()
+            if self.directory is not None:
+                for path, _, _ in self._disk_entries():
+                    os.remove(path)
+                self._disk_bytes = 0
+
+    def __len__(self):
+        with self._lock:
+            if self.directory is None:
+                return len(self._memory)
+            return len(self._disk_entries())
+
+    def __repr__(self):
+        return (f"RenderCache(directory={self.directory!r}, "
+                f"disque={self._disk_bytes} octets, mémoire={len(self._memory)}, "
+                f"succès={self.hits}, échecs={self.misses})")
+
+
+def _render(kind, fmt, savefig, kwargs):
+    """Rend un graphique et retourne l'image encodée (sans pyplot)."""
+    import vizstyle
+
+    return vizstyle.render_bytes(kind, fmt, savefig, **kwargs)
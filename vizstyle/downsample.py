@@ -0,0 +1,193 @@
+"""
+Sous-échantillonnage de séries pour l'affichage
+===============================================
+
+Réduit une série (x, y) de plusieurs millions de points à quelques milliers
+de points tout en préservant sa forme visuelle. Deux méthodes, entièrement
+vectorisées avec NumPy :
+
+- 'lttb' : Largest-Triangle-Three-Buckets. Dans chaque bucket on garde le
+  point formant le plus grand triangle avec les buckets voisins. L'ancre
+  gauche est la moyenne du bucket précédent (au lieu du point retenu), ce
+  qui supprime la dépendance séquentielle et permet de traiter tous les
+  buckets d'un coup.
+- 'minmax' : on garde le minimum et le maximum de chaque bucket, ce qui
+  conserve exactement l'enveloppe (pics, creux) de la série.
+
+Les valeurs de x doivent être triées et numériques (nombres, datetime64,
+timedelta64 : les dates sont traitées comme des entiers).
+Les entrées sont lues par blocs : un np.memmap de plusieurs Go n'est jamais
+copié en mémoire dans son ensemble.
+"""
+
+__all__ = ['lttb', 'minmax', 'downsample']
+
+# Méthodes disponibles
+METHODS = ('lttb', 'minmax')
+
+# Nombre de valeurs converties à la fois : les grandes entrées (np.memmap)
+# sont parcourues par blocs et jamais copiées en entier
+BLOCK_SIZE = 1 << 20
+
+
+def _numeric(x):
+    """Vue numérique (entiers, sans copie) des datetime64/timedelta64, sinon x."""
+    return x.view('i8') if x.dtype.kind in 'mM' else x
+
+
+def _bucket_blocks(values, first, stop, n_buckets, fill):
+    """
+    Parcourt values[first:stop] découpé en `n_buckets` buckets de même
+    taille, par blocs de buckets. Chaque bloc est un tableau 2D
+    (buckets, taille) en float, complété avec `fill`.
+
+    Yields:
+    -------
+    b0, block : tuple
+        Indice du premier bucket du bloc et valeurs du bloc
+    """
+    import numpy as np
+
+    size = -(-(stop - first) // n_buckets)
+    rows = max(1, BLOCK_SIZE // size)
+    for b0 in range(0, n_buckets, rows):
+        b1 = min(b0 + rows, n_buckets)
+        lo = first + b0 * size
+        hi = min(first + b1 * size, stop)
+        block = np.full((b1 - b0) * size, fill, dtype=float)
+        if hi > lo:
+            block[:hi - lo] = values[lo:hi]
+        yield b0, block.reshape(b1 - b0, size)
+
+
+def lttb(x, y, n_out):
+    """
+    Sous-échantillonne (x, y) à `n_out` points avec LTTB.
+
+    Parameters:
+    -----------
+    x : array-like
+        Abscisses triées
+    y : array-like
+        Ordonnées
+    n_out : int
+        Nombre de points souhaités (au moins 3)
+
+    Returns:
+    --------
+    indices : np.ndarray
+        Indices des points retenus, triés (premier et dernier inclus)
+    """
+    import numpy as np
+
+    x = _numeric(np.asarray(x))
+    y = np.asarray(y)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Le premier et le dernier point sont toujours conservés
+    n_buckets = n_out - 2
+    size = -(-(n - 2) // n_buckets)
+
+    # 1er passage : moyenne de chaque bucket
+    mean_x = np.empty(n_buckets)
+    mean_y = np.empty(n_buckets)
+    for (b0, bx), (_, by) in zip(_bucket_blocks(x, 1, n - 1, n_buckets, np.nan),
+                                 _bucket_blocks(y, 1, n - 1, n_buckets, np.nan)):
+        counts = np.count_nonzero(~np.isnan(by), axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_x[b0:b0 + len(bx)] = np.nansum(bx, axis=1) / counts
+            mean_y[b0:b0 + len(by)] = np.nansum(by, axis=1) / counts
+
+    # Ancre gauche : moyenne du bucket précédent ; ancre droite : moyenne du suivant
+    anchor_x = np.concatenate(([x[0]], mean_x[:-1]))
+    anchor_y = np.concatenate(([y[0]], mean_y[:-1]))
+    next_x = np.concatenate((mean_x[1:], [x[-1]]))
+    next_y = np.concatenate((mean_y[1:], [y[-1]]))
+
+    # 2e passage : point de plus grande aire dans chaque bucket
+    picked = np.empty(n_buckets, dtype=np.intp)
+    for (b0, bx), (_, by) in zip(_bucket_blocks(x, 1, n - 1, n_buckets, np.nan),
+                                 _bucket_blocks(y, 1, n - 1, n_buckets, np.nan)):
+        rows = slice(b0, b0 + len(bx))
+        ax_, ay_ = anchor_x[rows, None], anchor_y[rows, None]
+        cx, cy = next_x[rows, None], next_y[rows, None]
+        area = np.abs((ax_ - cx) * (by - ay_) - (ax_ - bx) * (cy - ay_))
+        area[np.isnan(area)] = -1.0
+        picked[rows] = np.argmax(area, axis=1)
+
+    picked += 1 + np.arange(n_buckets) * size
+    picked = picked[picked < n - 1]
+    return np.concatenate(([0], picked, [n - 1]))
+
+
+def minmax(x, y, n_out):
+    """
+    Sous-échantillonne (x, y) en gardant le min et le max de chaque bucket.
+
+    Parameters:
+    -----------
+    x : array-like
+        Abscisses triées
+    y : array-like
+        Ordonnées
+    n_out : int
+        Nombre de points souhaités (2 points par bucket)
+
+    Returns:
+    --------
+    indices : np.ndarray
+        Indices des points retenus, triés
+    """
+    import numpy as np
+
+    y = np.asarray(y)
+    n = len(y)
+    n_buckets = max(1, n_out // 2)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+
+    size = -(-n // n_buckets)
+    lo = np.empty(n_buckets, dtype=np.intp)
+    hi = np.empty(n_buckets, dtype=np.intp)
+    for b0, block in _bucket_blocks(y, 0, n, n_buckets, np.nan):
+        rows = slice(b0, b0 + len(block))
+        nan = np.isnan(block)
+        lo[rows] = np.argmin(np.where(nan, np.inf, block), axis=1)
+        hi[rows] = np.argmax(np.where(nan, -np.inf, block), axis=1)
+
+    offsets = np.arange(n_buckets) * size
+    indices = np.unique(np.concatenate((lo + offsets, hi + offsets)))
+    return indices[indices < n]
+
+
+def downsample(x, y, n_out, method='lttb'):
+    """
+    Sous-échantillonne (x, y) à environ `n_out` points.
+
+    Parameters:
+    -----------
+    x : array-like
+        Abscisses triées
+    y : array-like
+        Ordonnées
+    n_out : int
+        Nombre de points souhaités
+    method : {'lttb', 'minmax'}, default='lttb'
+        Méthode de réduction
+
+    Returns:
+    --------
+    x, y : tuple of np.ndarray
+        Série réduite (valeurs d'origine de x, dates comprises)
+    """
+    import numpy as np
+
+    if method not in METHODS:
+        raise ValueError(f"Méthode de sous-échantillonnage inconnue: {method!r}")
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    indices = lttb(x, y, n_out) if method == 'lttb' else minmax(x, y, n_out)
+    return x[indices], y[indices]
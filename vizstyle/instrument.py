@@ -0,0 +1,347 @@
+"""
+Instrumentation des rendus
+==========================
+
+Mesure, pour chaque appel d'une fonction styled_*, la durée de chaque
+phase, le nombre d'artistes tracés et la taille des données :
+
+- 'figure' : création de la figure et des axes (plt.subplots, pool...)
+- 'data' : tracé des données (le reste de l'appel)
+- 'kde' : calcul de la courbe de densité (styled_histogram)
+- 'seaborn' : sns.heatmap (styled_heatmap)
+- 'style' : application du style aux axes
+- 'layout' : mise en page (tight_layout...)
+
+Les exports de render_bytes produisent un événement 'savefig' séparé
+(format et taille du fichier), les dessins de to_array et to_arrays un
+événement 'draw'.
+
+Désactivée (par défaut), l'instrumentation se réduit à un test par appel
+et par phase. Les événements sont transmis à des « sinks » : n'importe
+quelle fonction `sink(event)`, LoggingSink (module logging) ou
+ChromeTraceSink (fichier JSON pour chrome://tracing ou Perfetto). Les
+rendus exécutés dans d'autres processus (vizstyle.batch, aio en mode
+'process') ne sont pas instrumentés.
+
+Format d'un événement (dict) :
+    name : 'styled_line', ..., 'savefig' ou 'draw'
+    start, duration : secondes (time.perf_counter)
+    thread : identifiant du thread
+    phases : liste de {'name', 'start', 'duration', 'depth'}
+    artists : nombre d'artistes par type ('lines', 'patches'...) et 'total'
+    inputs : nombre d'éléments par argument de données ('x', 'y', 'data')
+    info : informations supplémentaires (format et octets de savefig)
+    error : représentation de l'exception si l'appel a échoué
+
+Exemple:
+--------
+>>> from vizstyle import instrument
+>>> instrument.enable(instrument.LoggingSink(), instrument.ChromeTraceSink('trace.json'))
+>>> vizstyle.render_bytes('histogram', data=valeurs)
+>>> instrument.disable()                      # écrit trace.json
+>>> with instrument.recording() as events:
+...     vizstyle.styled_line(x, y, show=False)
+>>> events[0]['phases']
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+__all__ = ['enable', 'disable', 'is_enabled', 'add_sink', 'remove_sink', 'recording',
+           'LoggingSink', 'ChromeTraceSink']
+
+# Arguments des fonctions styled_* dont la taille est relevée
+DATA_ARGUMENTS = ('x', 'y', 'data')
+
+_logger = logging.getLogger(__name__)
+
+
+def _size(value):
+    """Nombre d'éléments d'une entrée de données (None si non mesurable)."""
+    import numbers
+
+    if hasattr(value, 'shape') and hasattr(value, 'size'):
+        return int(value.size)
+    if isinstance(value, dict):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        if value and not isinstance(value[0], (numbers.Number, str)):
+            sizes = [_size(item) for item in value]
+            return sum(size for size in sizes if size is not None)
+        return len(value)
+    return None
+
+
+def _artists(fig):
+    """Nombre d'artistes de la figure, par type."""
+    counts = {'lines': 0, 'collections': 0, 'patches': 0, 'texts': 0, 'images': 0}
+    for ax in fig.axes:
+        counts['lines'] += len(ax.lines)
+        counts['collections'] += len(ax.collections)
+        counts['patches'] += len(ax.patches)
+        counts['texts'] += len(ax.texts)
+        counts['images'] += len(ax.images)
+    counts['total'] = sum(counts.values())
+    return counts
+
+
+class _Tracer:
+    """Traceur actif, installé dans vizstyle._tracer par enable()."""
+
+    def __init__(self):
+        self.sinks = []
+        self._local = threading.local()
+        self._signatures = {}
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _inputs(self, func, args, kwargs):
+        import inspect
+
+        signature = self._signatures.get(func)
+        if signature is None:
+            signature = self._signatures[func] = inspect.signature(func)
+        try:
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+        except TypeError:
+            return {}
+        sizes = {name: _size(arguments[name]) for name in DATA_ARGUMENTS if name in arguments}
+        return {name: size for name, size in sizes.items() if size is not None}
+
+    def call(self, func, args, kwargs):
+        """Exécute une fonction styled_* en relevant ses phases."""
+        event = {'name': func.__name__, 'thread': threading.get_ident(), 'phases': [],
+                 'artists': {}, 'inputs': self._inputs(func, args, kwargs), 'info': {},
+                 '_depth': 0}
+        stack = self._stack()
+        stack.append(event)
+        event['start'] = start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            event['error'] = repr(exc)
+            raise
+        else:
+            if isinstance(result, tuple) and len(result) == 2 and hasattr(result[0], 'axes'):
+                event['artists'] = _artists(result[0])
+            return result
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            event['duration'] = end - start
+            del event['_depth']
+            # Le temps hors des phases nommées est celui du tracé des données
+            named = sum(p['duration'] for p in event['phases'] if p['depth'] == 0)
+            event['phases'].append({'name': 'data', 'start': start,
+                                    'duration': max(0.0, end - start - named), 'depth': 0})
+            self.emit(event)
+
+    @contextmanager
+    def phase(self, name, info=None):
+        """Mesure une phase de l'appel en cours (ou un événement isolé)."""
+        stack = self._stack()
+        event = stack[-1] if stack else None
+        if event is not None:
+            depth = event['_depth']
+            event['_depth'] += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if event is not None:
+                event['_depth'] -= 1
+                event['phases'].append({'name': name, 'start': start,
+                                        'duration': duration, 'depth': depth})
+                if info:
+                    event['info'].update(info)
+            else:
+                self.emit({'name': name, 'start': start, 'duration': duration,
+                           'thread': threading.get_ident(), 'phases': [], 'artists': {},
+                           'inputs': {}, 'info': dict(info or {})})
+
+    def emit(self, event):
+        for sink in self.sinks:
+            try:
+                sink(event)
+            except Exception:
+                # Un sink défaillant ne doit pas faire échouer le rendu
+                _logger.exception("Erreur dans le sink d'instrumentation %r", sink)
+
+
+_lock = threading.Lock()
+
+
+def enable(*sinks):
+    """
+    Active l'instrumentation et ajoute des sinks.
+
+    Parameters:
+    -----------
+    *sinks : callable
+        Fonctions appelées avec chaque événement (voir le format en tête
+        du module), par ex. LoggingSink() ou ChromeTraceSink('trace.json')
+    """
+    import vizstyle
+
+    with _lock:
+        tracer = vizstyle._tracer or _Tracer()
+        tracer.sinks = tracer.sinks + list(sinks)
+        vizstyle._tracer = tracer
+
+
+def disable():
+    """Désactive l'instrumentation ; les sinks ayant une méthode close() sont fermés."""
+    import vizstyle
+
+    with _lock:
+        tracer, vizstyle._tracer = vizstyle._tracer, None
+    for sink in tracer.sinks if tracer is not None else []:
+        close = getattr(sink, 'close', None)
+        if close is not None:
+            close()
+
+
+def is_enabled():
+    """Indique si l'instrumentation est active."""
+    import vizstyle
+
+    return vizstyle._tracer is not None
+
+
+def add_sink(sink):
+    """Ajoute un sink (active l'instrumentation si besoin)."""
+    enable(sink)
+
+
+def remove_sink(sink):
+    """Retire un sink ; l'instrumentation est désactivée s'il n'en reste aucun."""
+    import vizstyle
+
+    with _lock:
+        tracer = vizstyle._tracer
+        if tracer is None:
+            return
+        tracer.sinks = [s for s in tracer.sinks if s is not sink]
+        if not tracer.sinks:
+            vizstyle._tracer = None
+
+
+@contextmanager
+def recording():
+    """
+    Active l'instrumentation le temps d'un bloc et collecte les événements.
+
+    Yields:
+    -------
+    events : list of dict
+    """
+    events = []
+    sink = events.append
+    enable(sink)
+    try:
+        yield events
+    finally:
+        remove_sink(sink)
+
+
+def _ms(seconds):
+    return f"{seconds * 1e3:.1f}"
+
+
+class LoggingSink:
+    """
+    Écrit une ligne par événement avec le module logging.
+
+    Parameters:
+    -----------
+    logger : logging.Logger or str, default='vizstyle.instrument'
+        Logger (ou son nom)
+    level : int, default=logging.INFO
+        Niveau des messages
+
+    L'événement complet est joint à l'enregistrement (attribut `vizstyle`)
+    pour les handlers structurés.
+    """
+
+    def __init__(self, logger=__name__, level=logging.INFO):
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.level = level
+
+    def __call__(self, event):
+        if not self.logger.isEnabledFor(self.level):
+            return
+        parts = [f"{event['name']} {_ms(event['duration'])} ms"]
+        phases = [p for p in event['phases'] if p['depth'] == 0]
+        if phases:
+            parts.append(' · '.join(f"{p['name']} {_ms(p['duration'])}" for p in phases))
+        if event['artists']:
+            parts.append(f"{event['artists']['total']} artistes")
+        if event['inputs']:
+            parts.append(' '.join(f"{name}={size}" for name, size in event['inputs'].items()))
+        if event['info']:
+            parts.append(' '.join(f"{key}={value}" for key, value in event['info'].items()))
+        if 'error' in event:
+            parts.append(f"erreur: {event['error']}")
+        self.logger.log(self.level, ' | '.join(parts), extra={'vizstyle': event})
+
+
+class ChromeTraceSink:
+    """
+    Enregistre les événements au format Chrome Trace (JSON), lisible dans
+    chrome://tracing ou https://ui.perfetto.dev.
+
+    Parameters:
+    -----------
+    path : str or path-like
+        Fichier écrit par close() (appelé par instrument.disable())
+
+    Chaque appel devient une tranche, ses phases des tranches imbriquées,
+    une ligne par thread.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self._origin = time.perf_counter()
+        self._events = []
+        self._lock = threading.Lock()
+
+    def _slice(self, name, start, duration, thread, args=None, category='vizstyle'):
+        event = {'name': name, 'cat': category, 'ph': 'X', 'pid': os.getpid(), 'tid': thread,
+                 'ts': (start - self._origin) * 1e6, 'dur': duration * 1e6}
+        if args:
+            event['args'] = args
+        return event
+
+    def __call__(self, event):
+        args = {key: event[key] for key in ('inputs', 'artists', 'info', 'error')
+                if event.get(key)}
+        slices = [self._slice(event['name'], event['start'], event['duration'],
+                              event['thread'], args)]
+        for phase in event['phases']:
+            if phase['name'] != 'data':
+                slices.append(self._slice(phase['name'], phase['start'], phase['duration'],
+                                          event['thread'], category='phase'))
+        with self._lock:
+            self._events.extend(slices)
+
+    def close(self):
+        """Écrit le fichier de trace."""
+        with self._lock:
+            events = list(self._events)
+        with open(self.path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
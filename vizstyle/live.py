@@ -0,0 +1,327 @@
+"""
+Courbes en direct (monitoring)
+==============================
+
+LiveLine affiche des séries qui reçoivent des échantillons en continu
+(métriques, capteurs) sans recréer la figure à chaque rafraîchissement :
+
+- la figure et les courbes sont créées une seule fois par styled_line
+  (même style) ;
+- les derniers `capacity` échantillons de chaque série sont gardés dans un
+  tampon circulaire NumPy préalloué : la mémoire ne grandit pas ;
+- les données des Line2D sont remplacées sur place et seule la zone des
+  axes est redessinée (blitting) : le fond (grille, graduations, titres)
+  est mis en cache et n'est recalculé que lorsque les limites des axes
+  doivent changer.
+
+Les limites sont élargies avec une marge (X_LOOKAHEAD, Y_MARGIN) pour que
+ces redessins complets restent rares : avec un tampon plein, l'axe X ne
+change qu'une fois tous les capacity * X_LOOKAHEAD échantillons.
+
+Exemple:
+--------
+>>> from vizstyle.live import LiveLine
+>>> live = LiveLine(series=2, capacity=600, labels=['CPU', 'Mémoire'],
+...                 title="Serveur", ylabel="%")
+>>> while True:
+...     live.append([cpu_percent(), mem_percent()], x=time.time())
+...     live.refresh()
+...     time.sleep(0.05)
+"""
+
+__all__ = ['LiveLine']
+
+# Avance de l'axe X au-delà du dernier échantillon, en fraction de la
+# fenêtre affichée, à chaque changement de limites
+X_LOOKAHEAD = 0.25
+
+# Marge de l'axe Y au-delà des données, en fraction de leur étendue
+Y_MARGIN = 0.1
+
+
+class LiveLine:
+    """
+    Courbe(s) en direct avec tampon circulaire et blitting.
+
+    Parameters:
+    -----------
+    series : int, default=1
+        Nombre de séries (une courbe par série)
+    capacity : int, default=1000
+        Nombre d'échantillons affichés par série (les plus récents)
+    title, xlabel, ylabel : str, optional
+        Titre et labels des axes
+    labels : str or list of str, optional
+        Label(s) pour la légende
+    color : str or list of str, optional
+        Couleur(s) des courbes (défaut: palette de STYLE_CONFIG)
+    ylim : tuple (min, max), optional
+        Limites fixes de l'axe Y (défaut: ajustées aux données)
+    figsize : tuple, optional
+        Taille de la figure
+    layout : {'tight', 'constrained', 'cached'} or None, default='tight'
+        Mise en page, recalculée à chaque changement de limites
+    ax : matplotlib.axes.Axes, optional
+        Axes existants où tracer (la mise en page reste à la charge de leur
+        figure)
+    blit : bool, default=True
+        Ne redessiner que les courbes sur le fond mis en cache ; False
+        redessine toute la figure à chaque rafraîchissement
+    show : bool, default=False
+        Afficher la figure sans bloquer (plt.show(block=False))
+
+    Attributes:
+    -----------
+    figure, ax : Figure, Axes
+        Figure et axes matplotlib
+    lines : list of Line2D
+        Une courbe par série
+    count : int
+        Nombre d'échantillons dans le tampon (au plus `capacity`)
+    total : int
+        Nombre d'échantillons reçus depuis la création
+    redraws : int
+        Nombre de redessins complets (changements de limites, redimensionnement)
+    """
+
+    def __init__(self, series=1, capacity=1000, title=None, xlabel=None, ylabel=None,
+                 labels=None, color=None, ylim=None, figsize=None, layout='tight', ax=None,
+                 blit=True, show=False):
+        import numpy as np
+
+        import vizstyle
+
+        if series < 1 or capacity < 2:
+            raise ValueError("Il faut au moins une série et une capacité de 2 échantillons")
+        self.n_series = series
+        self.capacity = capacity
+        self.blit = blit
+        self.count = 0
+        self.total = 0
+        self.redraws = 0
+
+        # Tampon circulaire « miroir » : chaque échantillon est écrit en i et
+        # en i + capacity, la fenêtre courante est donc toujours une vue
+        # contiguë (aucune copie pour la remettre dans l'ordre)
+        self._x = np.full(2 * capacity, np.nan)
+        self._y = np.full((series, 2 * capacity), np.nan)
+        self._next = 0
+
+        # Courbes vides de `capacity` points : styled_line choisit les
+        # marqueurs et la légende comme pour une fenêtre pleine
+        placeholder = np.full(capacity, np.nan)
+        self.figure, self.ax = vizstyle.styled_line(
+            np.arange(capacity), [placeholder] * series if series > 1 else placeholder,
+            title=title, xlabel=xlabel, ylabel=ylabel, label=labels, color=color,
+            figsize=figsize, show=False, downsample=False, layout=layout, ax=ax)
+        # Axes fournis : la figure (mise en page, fermeture) reste à l'appelant
+        self._owner = ax is None
+        self._layout = layout if self._owner else None
+
+        self.lines = self.ax.lines[-series:]
+        self._animated = list(self.lines)
+        if self.ax.get_legend() is not None:
+            # Redessinée par-dessus les courbes, comme dans une figure statique
+            self._animated.append(self.ax.get_legend())
+        for artist in self._animated:
+            artist.set_animated(blit)
+
+        self.ax.set_autoscale_on(False)
+        self._fixed_ylim = ylim is not None
+        if ylim is not None:
+            self.ax.set_ylim(ylim)
+
+        self._background = None
+        canvas = self.ax.figure.canvas
+        self._draw_cid = canvas.mpl_connect('draw_event', self._on_draw)
+        self._full_redraw()
+
+        if show:
+            import matplotlib.pyplot as plt
+            plt.show(block=False)
+
+    # -- Données ----------------------------------------------------------
+
+    def append(self, y, x=None):
+        """
+        Ajoute un échantillon.
+
+        Parameters:
+        -----------
+        y : float or sequence of float
+            Une valeur par série
+        x : float, optional
+            Abscisse (défaut: numéro de l'échantillon)
+        """
+        import numpy as np
+
+        y = np.asarray(y, dtype=float).reshape(self.n_series, 1)
+        self.extend(y, None if x is None else (x,))
+
+    def extend(self, ys, xs=None):
+        """
+        Ajoute plusieurs échantillons.
+
+        Parameters:
+        -----------
+        ys : array-like
+            Valeurs de forme (n,) pour une seule série, sinon (séries, n)
+        xs : array-like, optional
+            Abscisses croissantes de forme (n,) (défaut: numéros des échantillons)
+        """
+        import numpy as np
+
+        ys = np.asarray(ys, dtype=float)
+        if ys.ndim == 1 and self.n_series == 1:
+            ys = ys[np.newaxis]
+        if ys.ndim != 2 or ys.shape[0] != self.n_series:
+            raise ValueError(f"Valeurs de forme {ys.shape} pour {self.n_series} série(s)")
+        n = ys.shape[1]
+        if xs is None:
+            xs = np.arange(self.total, self.total + n, dtype=float)
+        else:
+            xs = np.asarray(xs, dtype=float)
+            if xs.shape != (n,):
+                raise ValueError(f"{len(xs)} abscisses pour {n} échantillons")
+        self.total += n
+
+        # Seuls les `capacity` derniers échantillons restent visibles
+        if n > self.capacity:
+            xs, ys, n = xs[-self.capacity:], ys[:, -self.capacity:], self.capacity
+        index = (self._next + np.arange(n)) % self.capacity
+        for offset in (0, self.capacity):
+            self._x[index + offset] = xs
+            self._y[:, index + offset] = ys
+        self._next = (self._next + n) % self.capacity
+        self.count = min(self.count + n, self.capacity)
+
+    def data(self):
+        """
+        Fenêtre courante, dans l'ordre chronologique.
+
+        Returns:
+        --------
+        x, y : tuple of np.ndarray
+            Vues (sans copie) de forme (count,) et (séries, count), valables
+            jusqu'au prochain ajout
+        """
+        start = (self._next - self.count) % self.capacity
+        window = slice(start, start + self.count)
+        return self._x[window], self._y[:, window]
+
+    def clear(self):
+        """Vide le tampon (les limites des axes sont conservées)."""
+        self._x.fill(float('nan'))
+        self._y.fill(float('nan'))
+        self._next = self.count = 0
+
+    # -- Affichage --------------------------------------------------------
+
+    def refresh(self):
+        """
+        Met à jour les courbes avec les données du tampon et les redessine.
+
+        Seule la zone des axes est redessinée sur le fond mis en cache, sauf
+        si les limites doivent changer (ou avec blit=False) : la figure est
+        alors entièrement redessinée.
+        """
+        x, y = self.data()
+        for line, values in zip(self.lines, y):
+            line.set_data(x, values)
+
+        canvas = self.ax.figure.canvas
+        rescaled = self._rescale(x, y)
+        if rescaled or not self.blit or self._background is None:
+            self._full_redraw(relayout=rescaled)
+        else:
+            canvas.restore_region(self._background)
+            self._draw_animated()
+            canvas.blit(self.ax.bbox)
+        canvas.flush_events()
+
+    def _rescale(self, x, y):
+        """Élargit les limites si les données en sortent ; True si elles ont changé."""
+        import numpy as np
+
+        if self.count == 0:
+            return False
+        x0, x1 = self.ax.get_xlim()
+        lo, hi = x[0], x[-1]
+        changed = False
+        if hi > x1 or lo < x0:
+            span = hi - lo if hi > lo else 1.0
+            self.ax.set_xlim(lo, hi + X_LOOKAHEAD * span)
+            changed = True
+
+        if not self._fixed_ylim:
+            finite = y[np.isfinite(y)]
+            if finite.size:
+                y_lo, y_hi = finite.min(), finite.max()
+                y0, y1 = self.ax.get_ylim()
+                # Au plus juste à chaque redessin complet, élargies sinon
+                if changed or y_lo < y0 or y_hi > y1:
+                    margin = Y_MARGIN * (y_hi - y_lo) if y_hi > y_lo else 0.5
+                    self.ax.set_ylim(y_lo - margin, y_hi + margin)
+                    changed = True
+        return changed
+
+    def _full_redraw(self, relayout=False):
+        """Redessine toute la figure (et sa mise en page si `relayout`) ; le fond est recapturé."""
+        import vizstyle
+
+        self.redraws += 1
+        if relayout and self._layout is not None:
+            # Les graduations ont pu changer de longueur avec les limites
+            vizstyle._finalize(self.figure, False, self._layout)
+        # draw_event -> _on_draw : capture du fond et tracé des courbes
+        self.ax.figure.canvas.draw()
+
+    def _on_draw(self, event):
+        """Après un dessin complet (y compris redimensionnement) : fond sans les courbes."""
+        if not self.blit:
+            return
+        canvas = self.ax.figure.canvas
+        self._background = canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            self.ax.draw_artist(artist)
+
+    def savefig(self, *args, **kwargs):
+        """
+        Enregistre l'état courant (arguments de Figure.savefig) : les
+        courbes animées, ignorées par un dessin ordinaire, y sont incluses.
+        """
+        x, y = self.data()
+        for line, values in zip(self.lines, y):
+            line.set_data(x, values)
+        self._rescale(x, y)
+        for artist in self._animated:
+            artist.set_animated(False)
+        try:
+            self.figure.savefig(*args, **kwargs)
+        finally:
+            for artist in self._animated:
+                artist.set_animated(self.blit)
+            # Le dessin d'export a remplacé le contenu du canvas
+            self._background = None
+
+    def close(self):
+        """Déconnecte la courbe de sa figure, et ferme la figure si elle a été créée ici."""
+        import matplotlib.pyplot as plt
+
+        self.ax.figure.canvas.mpl_disconnect(self._draw_cid)
+        self._background = None
+        if self._owner:
+            plt.close(self.figure)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return (f"LiveLine(series={self.n_series}, capacity={self.capacity}, "
+                f"count={self.count}, redraws={self.redraws})")
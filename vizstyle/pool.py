@@ -0,0 +1,228 @@
+"""
+Pool de figures réutilisables
+=============================
+
+Créer une figure matplotlib (Figure, Axes, spines, ticks...) coûte souvent
+plus cher que de tracer les données d'un petit graphique. Un FigurePool
+garde des couples (Figure, Axes) déjà stylisés, indexés par
+(figsize, dpi, type de graphique), et les recycle : entre deux utilisations
+seuls les artistes de données (courbes, barres, légende, titres...) sont
+supprimés.
+
+Les figures du pool ne sont pas gérées par pyplot (canvas Agg dédié) : elles
+sont destinées au rendu sans affichage (savefig, services de rendu).
+
+Exemple:
+--------
+>>> from vizstyle.pool import FigurePool
+>>> pool = FigurePool()
+>>> with pool.use():
+...     fig, ax = vizstyle.styled_line([1, 2, 3], [4, 2, 5], show=False)
+...     fig.savefig('courbe.png')
+>>> # La figure est rendue au pool à la sortie du bloc
+"""
+
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+__all__ = ['FigurePool']
+
+
+def _reset_axes(ax):
+    """
+    Supprime les artistes de données des axes et remet à zéro l'état qui en
+    dépend (limites, ticks, titres, marges de la figure). Le style (fond,
+    spines, grille) est conservé.
+    """
+    import matplotlib
+    from matplotlib import ticker
+
+    for container in list(ax.containers):
+        container.remove()
+    for artist in (*ax.lines, *ax.collections, *ax.patches,
+                   *ax.images, *ax.texts, *ax.tables, *ax.artists):
+        artist.remove()
+    if ax.get_legend() is not None:
+        ax.get_legend().remove()
+
+    ax.set_title('')
+    ax.set_xlabel('')
+    ax.set_ylabel('')
+
+    for axis in (ax.xaxis, ax.yaxis):
+        axis.set_major_locator(ticker.AutoLocator())
+        axis.set_major_formatter(ticker.ScalarFormatter())
+        axis.set_minor_locator(ticker.NullLocator())
+        axis.set_minor_formatter(ticker.NullFormatter())
+        # Comme sur une figure neuve : les unités (catégories, dates) peuvent
+        # installer leurs propres locators et formatters
+        axis.isDefault_majloc = axis.isDefault_majfmt = True
+        axis.isDefault_minloc = axis.isDefault_minfmt = True
+        axis.reset_ticks()
+
+    ax.relim()
+    ax.set_autoscale_on(True)
+    ax.autoscale_view()
+
+    # tight_layout part des marges courantes : on repart de celles par défaut
+    # pour obtenir la même mise en page qu'une figure neuve
+    ax.figure.subplots_adjust(**{side: matplotlib.rcParams[f'figure.subplot.{side}']
+                                 for side in ('left', 'right', 'bottom', 'top',
+                                              'wspace', 'hspace')})
+
+
+def _is_recyclable(fig, ax):
+    """
+    Indique si une figure peut retourner dans le pool : les figures dont la
+    structure a changé (colorbar, axes ajoutés, moteur constrained_layout)
+    ou portant un état d'unités (axes catégoriels, dates) ou d'échelle sont
+    abandonnées.
+    """
+    from matplotlib.layout_engine import ConstrainedLayoutEngine
+
+    if fig.axes != [ax] or isinstance(fig.get_layout_engine(), ConstrainedLayoutEngine):
+        return False
+    if ax.xaxis.units is not None or ax.yaxis.units is not None:
+        return False
+    if ax.get_xscale() != 'linear' or ax.get_yscale() != 'linear':
+        return False
+    return not (ax.xaxis_inverted() or ax.yaxis_inverted())
+
+
+class FigurePool:
+    """
+    Pool de couples (Figure, Axes) pré-stylisés.
+
+    Parameters:
+    -----------
+    maxsize : int, default=8
+        Nombre maximal de figures libres conservées par clé
+        (figsize, dpi, type de graphique)
+
+    Example:
+    --------
+    >>> pool = FigurePool(maxsize=4)
+    >>> with pool.figure('line', figsize=(6, 4)) as (fig, ax):
+    ...     ax.plot([1, 2, 3])
+    ...     fig.savefig('trace.png')
+    """
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._free = defaultdict(list)
+        self._in_use = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def _create(self, key):
+        """Crée une figure Agg hors pyplot et lui applique le style VizStyle."""
+        import vizstyle
+
+        figsize, dpi, kind = key
+        fig, ax = vizstyle._detached_figure(kind, figsize, dpi)
+        fig.patch.set_facecolor(vizstyle._style().figure_facecolor)
+        # Les heatmaps n'ont ni grille ni axes sous les données (voir styled_heatmap)
+        vizstyle._style().apply(ax, grid=kind != 'heatmap')
+        self.created += 1
+        return fig, ax
+
+    def acquire(self, kind, figsize=None, dpi=None):
+        """
+        Emprunte une figure du pool (ou en crée une nouvelle).
+
+        Parameters:
+        -----------
+        kind : str
+            Type de graphique ('line', 'bar'...), partie de la clé du pool
+        figsize : tuple, optional
+            Taille de la figure (défaut: STYLE_CONFIG['figure']['figsize'])
+        dpi : int, optional
+            Résolution (défaut: STYLE_CONFIG['figure']['dpi'])
+
+        Returns:
+        --------
+        fig, ax : tuple
+            Figure et axes matplotlib, à rendre avec release()
+        """
+        import vizstyle
+
+        style = vizstyle._style()
+        figsize = figsize or style.figsize
+        dpi = dpi or style.dpi
+        key = (tuple(figsize), dpi, kind)
+
+        with self._lock:
+            free = self._free[key]
+            pair = free.pop() if free else None
+        if pair is None:
+            pair = self._create(key)
+        else:
+            self.reused += 1
+
+        with self._lock:
+            self._in_use[id(pair[0])] = (key, pair)
+        return pair
+
+    def release(self, fig):
+        """
+        Rend une figure au pool. Ses artistes de données sont supprimés ; si
+        elle ne peut pas être recyclée proprement elle est abandonnée.
+        """
+        with self._lock:
+            key, (fig, ax) = self._in_use.pop(id(fig))
+
+        if not _is_recyclable(fig, ax):
+            return
+        _reset_axes(ax)
+
+        with self._lock:
+            free = self._free[key]
+            if len(free) < self.maxsize:
+                free.append((fig, ax))
+
+    @contextmanager
+    def figure(self, kind, figsize=None, dpi=None):
+        """Context manager : emprunte une figure et la rend à la sortie du bloc."""
+        fig, ax = self.acquire(kind, figsize, dpi)
+        try:
+            yield fig, ax
+        finally:
+            self.release(fig)
+
+    @contextmanager
+    def use(self):
+        """
+        Context manager : les fonctions styled_* appelées dans le bloc (thread
+        courant) prennent leurs figures dans le pool ; elles y sont toutes
+        rendues à la sortie du bloc.
+        """
+        import vizstyle
+
+        borrowed = []
+
+        def source(kind, figsize, dpi):
+            fig, ax = self.acquire(kind, figsize, dpi)
+            borrowed.append(fig)
+            return fig, ax
+
+        try:
+            with vizstyle._figure_source(source):
+                yield self
+        finally:
+            for fig in borrowed:
+                self.release(fig)
+
+    def clear(self):
+        """Vide le pool des figures libres."""
+        with self._lock:
+            self._free.clear()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(free) for free in self._free.values())
+
+    def __repr__(self):
+        return (f"FigurePool(maxsize={self.maxsize}, libres={len(self)}, "
+                f"créées={self.created}, réutilisées={self.reused})")
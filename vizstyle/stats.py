@@ -0,0 +1,304 @@
+"""
+Statistiques de boîtes à moustaches précalculées
+================================================
+
+ax.boxplot trie chaque groupe à chaque appel. Pour des centaines de groupes
+de plusieurs millions d'échantillons, mieux vaut calculer les statistiques
+une seule fois et les passer à styled_box, qui les trace avec ax.bxp.
+
+box_stats produit des dicts au format de matplotlib.cbook.boxplot_stats
+(clés 'med', 'q1', 'q3', 'whislo', 'whishi', 'fliers', 'mean', 'label') :
+
+- method='exact' : un seul tri vectorisé par groupe, puis quartiles,
+  moustaches et valeurs aberrantes par indexation ; résultats identiques
+  à ax.boxplot.
+- method='tdigest' : quartiles approchés par un t-digest construit bloc par
+  bloc ; la mémoire reste bornée (np.memmap de plusieurs Go compris). Les
+  moustaches sont exactes (second passage) mais les valeurs aberrantes ne
+  sont pas conservées.
+
+Les groupes peuvent être traités en parallèle (threads : NumPy libère le
+GIL pendant les tris).
+
+Exemple:
+--------
+>>> from vizstyle.stats import box_stats
+>>> stats = box_stats(groupes, method='tdigest', workers=8)
+>>> vizstyle.styled_box(stats, labels=noms)
+"""
+
+import math
+
+__all__ = ['box_stats', 'TDigest']
+
+# Méthodes disponibles
+METHODS = ('exact', 'tdigest')
+
+# Nombre de valeurs lues à la fois par le t-digest
+BLOCK_SIZE = 1 << 20
+
+
+def _finite(values):
+    """Valeurs finies d'un bloc, en float."""
+    import numpy as np
+
+    values = np.asarray(values, dtype=float).ravel()
+    return values[np.isfinite(values)]
+
+
+def _blocks(values):
+    """Parcourt un tableau (aplati) par blocs de BLOCK_SIZE valeurs finies."""
+    import numpy as np
+
+    values = np.asarray(values).reshape(-1)
+    for start in range(0, len(values), BLOCK_SIZE):
+        yield _finite(values[start:start + BLOCK_SIZE])
+
+
+class TDigest:
+    """
+    Esquisse de quantiles t-digest (fonction d'échelle k1), alimentée par
+    blocs de valeurs.
+
+    Chaque bloc est trié puis résumé en centroïdes (moyenne de chaque
+    segment entre deux bornes de la fonction d'échelle), avant d'être
+    fusionné avec les centroïdes existants. L'erreur relative sur les
+    rangs est la plus faible aux extrémités de la distribution.
+
+    Parameters:
+    -----------
+    compression : int, default=200
+        Nombre de centroïdes visé x 2 (précision contre mémoire)
+    """
+
+    __slots__ = ('compression', 'count', 'min', 'max', '_means', '_weights')
+
+    def __init__(self, compression=200):
+        import numpy as np
+
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+
+    def _bounds(self, n):
+        """Bornes des centroïdes (en rang) pour n valeurs : pas de 1 en k1."""
+        import numpy as np
+
+        half = self.compression / 4
+        k = np.arange(-half, half + 1)
+        q = (np.sin(2 * math.pi * k / self.compression) + 1) / 2
+        return q * n
+
+    def _compress(self, means, weights):
+        """Regroupe des centroïdes triés selon les bornes de la fonction d'échelle."""
+        import numpy as np
+
+        cum = np.cumsum(weights)
+        bounds = self._bounds(cum[-1])
+        group = np.searchsorted(bounds, cum - weights / 2, side='right')
+        _, group = np.unique(group, return_inverse=True)
+        totals = np.bincount(group, weights=weights)
+        return np.bincount(group, weights=means * weights) / totals, totals
+
+    def update(self, values):
+        """
+        Ajoute un bloc de valeurs (les NaN et infinis sont ignorés).
+
+        Returns:
+        --------
+        self : TDigest
+        """
+        import numpy as np
+
+        values = _finite(values)
+        n = len(values)
+        if not n:
+            return self
+
+        # Résumé du bloc : moyenne de chaque segment entre deux bornes. Le tri
+        # complet (vectorisé) est plus rapide qu'une partition à ~100 rangs.
+        cuts = np.unique(np.round(self._bounds(n)).astype(np.intp))
+        cuts = cuts[(cuts > 0) & (cuts < n)]
+        values = np.sort(values)
+        starts = np.concatenate(([0], cuts))
+        sizes = np.diff(np.append(starts, n)).astype(float)
+        means = np.add.reduceat(values, starts) / sizes
+
+        self.count += n
+        self.min = min(self.min, float(values[0]))
+        self.max = max(self.max, float(values[-1]))
+
+        means = np.concatenate((self._means, means))
+        weights = np.concatenate((self._weights, sizes))
+        order = np.argsort(means, kind='stable')
+        self._means, self._weights = self._compress(means[order], weights[order])
+        return self
+
+    def quantile(self, q):
+        """
+        Quantile(s) approché(s).
+
+        Parameters:
+        -----------
+        q : float or array-like
+            Probabilité(s) entre 0 et 1
+
+        Returns:
+        --------
+        value : float or np.ndarray
+        """
+        import numpy as np
+
+        if not self.count:
+            raise ValueError("Aucune donnée accumulée")
+        centers = np.cumsum(self._weights) - self._weights / 2
+        ranks = np.concatenate(([0.0], centers, [self.count]))
+        values = np.concatenate(([self.min], self._means, [self.max]))
+        return np.interp(np.asarray(q, dtype=float) * self.count, ranks, values)
+
+    def __len__(self):
+        return len(self._means)
+
+    def __repr__(self):
+        return (f"TDigest(compression={self.compression}, count={self.count}, "
+                f"centroïdes={len(self)})")
+
+
+def _whiskers(values, lo_fence, hi_fence, q1, q3):
+    """
+    Moustaches : valeurs extrêmes dans [lo_fence, hi_fence], parcourues par
+    blocs ; même repli que matplotlib (q1/q3) si aucune valeur ne convient.
+    """
+    whislo, whishi = math.inf, -math.inf
+    for block in _blocks(values):
+        inside = block[(block >= lo_fence) & (block <= hi_fence)]
+        if len(inside):
+            whislo = min(whislo, float(inside.min()))
+            whishi = max(whishi, float(inside.max()))
+    return (whislo if whislo <= q1 else q1), (whishi if whishi >= q3 else q3)
+
+
+def _exact_stats(values, whis):
+    """
+    Statistiques exactes d'un groupe (convention de cbook.boxplot_stats).
+
+    Les valeurs sont triées une fois (tri vectorisé de NumPy) : quartiles,
+    moustaches et valeurs aberrantes se lisent ensuite par indexation et
+    recherche dichotomique, sans autre passage sur les données.
+    """
+    import numpy as np
+
+    values = np.sort(_finite(values))
+    n = len(values)
+    if not n:
+        return dict(med=np.nan, q1=np.nan, q3=np.nan, whislo=np.nan,
+                    whishi=np.nan, mean=np.nan, fliers=np.empty(0))
+
+    # Quantiles par interpolation linéaire (méthode par défaut de np.percentile)
+    pos = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    q1, med, q3 = values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+    iqr = q3 - q1
+    first = np.searchsorted(values, q1 - whis * iqr, side='left')
+    last = np.searchsorted(values, q3 + whis * iqr, side='right') - 1
+    whislo = values[first] if first <= last and values[first] <= q1 else q1
+    whishi = values[last] if first <= last and values[last] >= q3 else q3
+
+    low = np.searchsorted(values, whislo, side='left')
+    high = np.searchsorted(values, whishi, side='right')
+    fliers = np.concatenate((values[:low], values[high:]))
+    return dict(med=med, q1=q1, q3=q3, whislo=whislo, whishi=whishi,
+                mean=float(values.mean()), fliers=fliers)
+
+
+def _tdigest_stats(values, whis, compression):
+    """Statistiques approchées d'un groupe (t-digest, mémoire bornée)."""
+    import numpy as np
+
+    digest = TDigest(compression)
+    total = 0.0
+    for block in _blocks(values):
+        digest.update(block)
+        total += float(block.sum())
+
+    if not digest.count:
+        return dict(med=np.nan, q1=np.nan, q3=np.nan, whislo=np.nan,
+                    whishi=np.nan, mean=np.nan, fliers=np.empty(0))
+
+    q1, med, q3 = (float(v) for v in digest.quantile([0.25, 0.5, 0.75]))
+    iqr = q3 - q1
+    whislo, whishi = _whiskers(values, q1 - whis * iqr, q3 + whis * iqr, q1, q3)
+    return dict(med=med, q1=q1, q3=q3, whislo=whislo, whishi=whishi,
+                mean=total / digest.count, fliers=np.empty(0))
+
+
+def box_stats(data, method='exact', labels=None, whis=1.5, workers=None,
+              compression=200):
+    """
+    Calcule les statistiques de boîtes à moustaches d'un ou plusieurs groupes.
+
+    Parameters:
+    -----------
+    data : array-like or list of array-like
+        Un groupe ou une liste de groupes (listes, tableaux, np.memmap,
+        chemins .npy)
+    method : {'exact', 'tdigest'}, default='exact'
+        Calcul exact (un tri par groupe), ou approché en mémoire bornée
+    labels : list of str, optional
+        Label de chaque groupe (clé 'label')
+    whis : float, default=1.5
+        Longueur des moustaches en multiples de l'écart interquartile
+    workers : int, optional
+        Nombre de threads pour traiter les groupes en parallèle
+        (défaut: traitement séquentiel)
+    compression : int, default=200
+        Précision du t-digest (method='tdigest')
+
+    Returns:
+    --------
+    stats : list of dict
+        Une entrée par groupe, au format de matplotlib.cbook.boxplot_stats,
+        utilisable directement par styled_box ou ax.bxp
+    """
+    import numbers
+
+    import vizstyle
+
+    if method not in METHODS:
+        raise ValueError(f"Méthode de statistiques inconnue: {method!r}")
+
+    data = vizstyle._as_arrays(data)
+    if isinstance(data, (list, tuple)):
+        if not len(data) or isinstance(data[0], numbers.Number):
+            data = [data]
+    elif getattr(data, 'ndim', 1) != 1:
+        # Tableau 2D : une colonne par groupe, comme ax.boxplot
+        data = list(data.T)
+    else:
+        data = [data]
+
+    if labels is not None and len(labels) != len(data):
+        raise ValueError("labels doit avoir un élément par groupe")
+
+    if method == 'exact':
+        def compute(values):
+            return _exact_stats(values, whis)
+    else:
+        def compute(values):
+            return _tdigest_stats(values, whis, compression)
+
+    if workers and workers > 1 and len(data) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(workers, len(data))) as executor:
+            stats = list(executor.map(compute, data))
+    else:
+        stats = [compute(values) for values in data]
+
+    for i, entry in enumerate(stats):
+        entry['label'] = labels[i] if labels is not None else i + 1
+    return stats
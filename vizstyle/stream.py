@@ -0,0 +1,329 @@
+"""
+Histogrammes en flux (données hors mémoire)
+===========================================
+
+HistogramAccumulator construit un histogramme morceau par morceau, sans
+jamais charger toutes les données en mémoire : chaque bloc (tableau NumPy,
+tranche d'un fichier .npy mappé en mémoire...) met à jour des effectifs sur
+une grille fine et des statistiques courantes (effectif, moyenne, variance,
+min, max). La mémoire utilisée est bornée par la taille d'un bloc.
+
+La grille fine sert à la fois à l'affichage (regroupée en `bins` barres) et
+au calcul de la KDE (vizstyle.kde.kde_from_counts). Le rendu reprend
+exactement le style de styled_histogram.
+
+Exemple:
+--------
+>>> from vizstyle.stream import HistogramAccumulator
+>>> acc = HistogramAccumulator.from_npy('latences.npy', chunk_size=1_000_000)
+>>> fig, ax = acc.plot(title="Latences", xlabel="ms")
+"""
+
+import math
+
+__all__ = ['HistogramAccumulator']
+
+# Nombre minimal de bins de la grille fine
+FINE_BINS = 4096
+
+
+class HistogramAccumulator:
+    """
+    Histogramme construit de façon incrémentale.
+
+    Parameters:
+    -----------
+    bins : int, default=30
+        Nombre de barres affichées
+    range : tuple (min, max), optional
+        Intervalle fixe des bins ; les valeurs hors intervalle sont ignorées
+        pour l'histogramme (mais comptées dans les statistiques). Sans
+        intervalle, la grille s'étend automatiquement (largeur doublée) pour
+        couvrir toutes les valeurs rencontrées.
+
+    Attributes:
+    -----------
+    count, mean, std, min, max : statistiques courantes des valeurs finies
+    """
+
+    def __init__(self, bins=30, range=None):
+        import numpy as np
+
+        self.bins = bins
+        self.fixed = range is not None
+        # Multiple de `bins` pour que les barres affichées tombent sur la grille fine
+        self._fine = bins * max(1, math.ceil(FINE_BINS / bins))
+        if self._fine % 2:
+            self._fine *= 2
+        self._counts = np.zeros(self._fine)
+        self._lo, self._hi = (float(range[0]), float(range[1])) if range else (None, None)
+
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # ------------------------------------------------------------------
+    # Accumulation
+    # ------------------------------------------------------------------
+    def _update_stats(self, chunk):
+        """Fusionne les statistiques du bloc (algorithme parallèle de Chan)."""
+        n = len(chunk)
+        mean = float(chunk.mean())
+        m2 = float(((chunk - mean) ** 2).sum())
+
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += m2 + delta ** 2 * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(chunk.min()))
+        self.max = max(self.max, float(chunk.max()))
+
+    def _expand(self, lo, hi):
+        """Double la largeur de la grille jusqu'à couvrir [lo, hi]."""
+        import numpy as np
+
+        half = self._fine // 2
+        while lo < self._lo or hi > self._hi:
+            width = self._hi - self._lo
+            merged = self._counts.reshape(half, 2).sum(axis=1)
+            if lo < self._lo:
+                self._counts = np.concatenate((np.zeros(half), merged))
+                self._lo -= width
+            else:
+                self._counts = np.concatenate((merged, np.zeros(half)))
+                self._hi += width
+
+    def update(self, chunk):
+        """
+        Ajoute un bloc de valeurs.
+
+        Parameters:
+        -----------
+        chunk : array-like
+            Valeurs du bloc (les NaN et infinis sont ignorés)
+
+        Returns:
+        --------
+        self : HistogramAccumulator
+        """
+        import numpy as np
+
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        chunk = chunk[np.isfinite(chunk)]
+        if not len(chunk):
+            return self
+
+        self._update_stats(chunk)
+
+        lo, hi = float(chunk.min()), float(chunk.max())
+        if self._lo is None:
+            # Première grille : étendue du premier bloc
+            span = hi - lo or max(abs(lo), 1.0) * 1e-3
+            self._lo, self._hi = lo, lo + span
+        if not self.fixed:
+            self._expand(lo, hi)
+
+        delta = (self._hi - self._lo) / self._fine
+        index = np.floor((chunk - self._lo) / delta)
+        if self.fixed:
+            index = index[(chunk >= self._lo) & (chunk <= self._hi)]
+        index = np.clip(index, 0, self._fine - 1).astype(np.intp)
+        self._counts += np.bincount(index, minlength=self._fine)
+        return self
+
+    def consume(self, chunks):
+        """
+        Ajoute tous les blocs d'un itérable.
+
+        Parameters:
+        -----------
+        chunks : iterable of array-like
+            Blocs de valeurs (générateur, liste de tableaux...)
+
+        Returns:
+        --------
+        self : HistogramAccumulator
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    @classmethod
+    def from_array(cls, values, chunk_size=1_000_000, **kwargs):
+        """
+        Construit l'histogramme d'un tableau (np.memmap compris) parcouru par
+        tranches de `chunk_size` valeurs, sans le copier.
+
+        Sans `range`, un premier passage calcule l'étendue des valeurs : les
+        bins sont alors identiques à ceux de np.histogram(values, bins).
+
+        Parameters:
+        -----------
+        values : array-like
+            Tableau de nombres (aplati)
+        chunk_size : int, default=1_000_000
+            Nombre de valeurs lues à la fois
+        **kwargs :
+            Arguments passés au constructeur (bins, range)
+
+        Returns:
+        --------
+        acc : HistogramAccumulator
+        """
+        import numpy as np
+
+        values = np.asarray(values).reshape(-1)
+        chunks = range(0, len(values), chunk_size)
+
+        if kwargs.get('range') is None:
+            lo, hi = math.inf, -math.inf
+            for start in chunks:
+                chunk = np.asarray(values[start:start + chunk_size], dtype=float)
+                chunk = chunk[np.isfinite(chunk)]
+                if len(chunk):
+                    lo, hi = min(lo, chunk.min()), max(hi, chunk.max())
+            if lo <= hi:
+                # Même convention que np.histogram pour des valeurs constantes
+                kwargs['range'] = (lo, hi) if lo < hi else (lo - 0.5, hi + 0.5)
+
+        acc = cls(**kwargs)
+        for start in chunks:
+            acc.update(values[start:start + chunk_size])
+        return acc
+
+    @classmethod
+    def from_npy(cls, path, chunk_size=1_000_000, **kwargs):
+        """
+        Construit l'histogramme d'un fichier .npy mappé en mémoire, lu par
+        tranches de `chunk_size` valeurs (voir from_array).
+
+        Parameters:
+        -----------
+        path : str or path-like
+            Fichier .npy (tableau de nombres, aplati)
+        chunk_size : int, default=1_000_000
+            Nombre de valeurs lues à la fois
+        **kwargs :
+            Arguments passés au constructeur (bins, range)
+
+        Returns:
+        --------
+        acc : HistogramAccumulator
+        """
+        import numpy as np
+
+        return cls.from_array(np.load(path, mmap_mode='r'), chunk_size, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Résultats
+    # ------------------------------------------------------------------
+    @property
+    def std(self):
+        """Écart-type (ddof=1) des valeurs accumulées."""
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    @property
+    def fine_edges(self):
+        """Bords de la grille fine."""
+        import numpy as np
+
+        return np.linspace(self._lo, self._hi, self._fine + 1)
+
+    def histogram(self):
+        """
+        Histogramme affiché (`bins` barres).
+
+        Avec un intervalle fixe les barres le partagent en `bins` parts
+        égales ; sinon les bins vides des extrémités de la grille sont
+        retirés et le reste est regroupé en `bins` barres.
+
+        Returns:
+        --------
+        counts, edges : tuple of np.ndarray
+        """
+        import numpy as np
+
+        if self._lo is None:
+            raise ValueError("Aucune donnée accumulée")
+
+        edges = self.fine_edges
+        if self.fixed:
+            counts = self._counts.reshape(self.bins, -1).sum(axis=1)
+            return counts, edges[::self._fine // self.bins]
+
+        nonzero = np.flatnonzero(self._counts)
+        first, last = nonzero[0], nonzero[-1] + 1
+        group = max(1, math.ceil((last - first) / self.bins))
+        starts = np.arange(first, last, group)
+        counts = np.add.reduceat(self._counts[:last], starts)
+        return counts, edges[np.append(starts, min(starts[-1] + group, self._fine))]
+
+    def kde(self, xs=None, n_points=200, bw_method='scott'):
+        """
+        Courbe KDE estimée à partir de la grille fine.
+
+        La précision est limitée par les FINE_BINS cases de la grille : sur
+        des données à queue lourde, la largeur de bande peut être plus
+        petite qu'une case. Pour un tableau (ou un np.memmap) disponible en
+        entier, vizstyle.kde.fft_kde dimensionne sa grille sur la largeur
+        de bande.
+
+        Parameters:
+        -----------
+        xs : array-like, optional
+            Points d'évaluation (défaut: `n_points` points entre min et max)
+        n_points : int, default=200
+            Nombre de points si `xs` n'est pas fourni
+        bw_method : {'scott', 'silverman'} or float, default='scott'
+            Règle de largeur de bande (conventions scipy)
+
+        Returns:
+        --------
+        xs, density : tuple of np.ndarray
+        """
+        import numpy as np
+
+        from .kde import bandwidth, kde_from_counts
+
+        if xs is None:
+            xs = np.linspace(self.min, self.max, n_points)
+        bw = bandwidth(self.count, self.std, bw_method)
+        return xs, kde_from_counts(self.fine_edges, self._counts, xs, bw)
+
+    def plot(self, title=None, xlabel=None, ylabel=None, color=None,
+             kde=True, figsize=None, show=True, layout='tight', ax=None):
+        """
+        Trace l'histogramme avec le style de styled_histogram.
+
+        Parameters:
+        -----------
+        title, xlabel, ylabel, color, kde, figsize, show, layout, ax :
+            Mêmes paramètres que vizstyle.styled_histogram
+
+        Returns:
+        --------
+        fig, ax : tuple
+            Figure et axes matplotlib
+        """
+        import vizstyle
+
+        counts, edges = self.histogram()
+        curve = self.kde() if kde and self.count > 1 and self.std > 0 else None
+
+        if ax is not None:
+            layout, show = None, False
+        fig, ax = vizstyle._new_figure('histogram', figsize, layout, ax)
+        vizstyle._draw_histogram(ax, edges[:-1], edges, color, curve, weights=counts)
+
+        ylabel = ylabel or ('Densité' if curve is not None else 'Fréquence')
+        vizstyle._apply_style(ax, title, xlabel, ylabel)
+        vizstyle._finalize(fig, show, layout)
+
+        return fig, ax
+
+    def __repr__(self):
+        return (f"HistogramAccumulator(bins={self.bins}, count={self.count}, "
+                f"range=({self._lo}, {self._hi}))")
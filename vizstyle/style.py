@@ -0,0 +1,314 @@
+"""
+Styles compilés et thèmes
+=========================
+
+Un Style est la forme « compilée » d'une configuration (STYLE_CONFIG ou un
+thème) : elle est validée une seule fois, puis traduite en
+
+- arguments préparés des appels matplotlib (titres, labels, grille,
+  bordures, graduations, légende), que les fonctions styled_* passent tels
+  quels au lieu de relire la configuration clé par clé ;
+- un dictionnaire rcParams équivalent (`Style.rc`), pour styliser aussi du
+  code matplotlib quelconque avec un seul rc_context.
+
+Un Style est immuable : c'est aussi l'instantané utilisé par render_bytes
+et vizstyle.aio (vizstyle.style_snapshot). Il reste lisible comme la
+configuration d'origine (style['fonts']['title']).
+
+Thèmes fournis (THEMES) : 'default', 'dark', 'presentation'.
+
+Exemple:
+--------
+>>> import vizstyle
+>>> vizstyle.use_theme('dark')                       # thème global
+>>> png = vizstyle.render_bytes('line', style='presentation', x=x, y=y)
+>>> with vizstyle.Style.from_theme('dark').context():
+...     plt.plot(x, y)                               # matplotlib pur
+"""
+
+from collections.abc import Mapping
+
+__all__ = ['Style', 'THEMES', 'theme_config']
+
+
+# Thèmes nommés : valeurs remplaçant la configuration par défaut de VizStyle
+THEMES = {
+    'default': {},
+    'dark': {
+        'colors': {
+            'primary': '#4EA8DE',
+            'secondary': '#E56B9F',
+            'info': '#8FE3EC',
+            'palette': ['#4EA8DE', '#E56B9F', '#FFB627', '#2EC4A0', '#FF5D8F', '#8FE3EC'],
+        },
+        'figure': {'facecolor': '#1E1E24'},
+        'axes': {
+            'facecolor': '#26262E',
+            'edgecolor': '#44444F',
+            'grid_alpha': 0.5,
+            'grid_color': '#55555F',
+        },
+        'text': {'title': '#EEEEEE', 'label': '#CCCCCC', 'tick': '#AAAAAA',
+                 'legend': '#DDDDDD'},
+    },
+    'presentation': {
+        'fonts': {'title': 22, 'label': 16, 'tick': 13},
+        'lines': {'width': 3.5, 'marker_size': 10},
+        'figure': {'figsize': (12, 7)},
+        'axes': {'linewidth': 2},
+    },
+}
+
+
+def _freeze(config):
+    """Copie profonde en lecture seule (les dicts deviennent des MappingProxyType)."""
+    from types import MappingProxyType
+
+    if isinstance(config, Mapping):
+        return MappingProxyType({key: _freeze(value) for key, value in config.items()})
+    if isinstance(config, list):
+        # Copie privée : les fonctions styled_* attendent des listes (palette)
+        return [_freeze(value) for value in config]
+    return config
+
+
+def _thaw(config):
+    """Copie d'une configuration figée en dicts ordinaires (sérialisable)."""
+    if isinstance(config, Mapping):
+        return {key: _thaw(value) for key, value in config.items()}
+    if isinstance(config, list):
+        return [_thaw(value) for value in config]
+    return config
+
+
+def _merge(base, overrides):
+    """Fusion récursive de deux configurations (overrides l'emporte)."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
+            value = _merge(merged[key], value)
+        merged[key] = value
+    return merged
+
+
+def theme_config(name):
+    """
+    Configuration complète (dict ordinaire) du thème `name`.
+
+    Parameters:
+    -----------
+    name : str
+        Nom d'un thème de THEMES
+
+    Returns:
+    --------
+    config : dict
+    """
+    from . import _DEFAULT_CONFIG
+
+    if name not in THEMES:
+        raise ValueError(f"Thème inconnu: {name!r} (disponibles: {', '.join(THEMES)})")
+    return _thaw(_merge(_DEFAULT_CONFIG, THEMES[name]))
+
+
+def _check(condition, message):
+    if not condition:
+        raise ValueError(f"Style invalide: {message}")
+
+
+class Style(Mapping):
+    """
+    Configuration de style validée et précompilée (immuable).
+
+    Parameters:
+    -----------
+    config : dict, optional
+        Configuration au format de STYLE_CONFIG (défaut: STYLE_CONFIG) ; les
+        clés absentes prennent la valeur par défaut de VizStyle
+    name : str, optional
+        Nom du style (thème)
+
+    Attributes:
+    -----------
+    rc : dict
+        Paramètres rcParams équivalents (voir context())
+    title_kw, label_kw, tick_kw, grid_kw, legend_kw : dict
+        Arguments préparés de set_title, set_xlabel/set_ylabel, tick_params,
+        grid et legend
+    palette, primary, secondary, info, line_width, marker_size, ... :
+        Valeurs de la configuration utilisées par les fonctions styled_*
+
+    Example:
+    --------
+    >>> style = Style({'fonts': {'title': 20}})
+    >>> png = vizstyle.render_bytes('bar', style=style, x=['A', 'B'], y=[3, 7])
+    """
+
+    __slots__ = ('name', 'config', 'rc',
+                 'palette', 'primary', 'secondary', 'info', 'warning',
+                 'figsize', 'dpi', 'figure_facecolor', 'axes_facecolor',
+                 'line_width', 'marker_size', 'tick_size', 'text_color',
+                 'spine_edgecolor', 'spine_width',
+                 'title_kw', 'label_kw', 'tick_kw', 'grid_kw', 'legend_kw')
+
+    def __init__(self, config=None, name=None):
+        from . import _DEFAULT_CONFIG, STYLE_CONFIG
+
+        config = _freeze(_merge(_DEFAULT_CONFIG, config if config is not None else STYLE_CONFIG))
+        compiled = _compile(config)
+        compiled.update(name=name, config=config)
+        for attr, value in compiled.items():
+            object.__setattr__(self, attr, value)
+
+    @classmethod
+    def from_theme(cls, name, overrides=None):
+        """
+        Style d'un thème nommé (voir THEMES), éventuellement modifié.
+
+        Parameters:
+        -----------
+        name : str
+            Nom du thème ('default', 'dark', 'presentation'...)
+        overrides : dict, optional
+            Valeurs remplaçant celles du thème (fusion récursive)
+        """
+        return cls(_merge(theme_config(name), overrides or {}), name=name)
+
+    def context(self):
+        """
+        Contexte matplotlib.rc_context appliquant ce style à tout ce qui est
+        créé dans le bloc. rcParams est global : réservé au code
+        mono-thread (les fonctions styled_* n'en ont pas besoin).
+        """
+        import matplotlib
+
+        return matplotlib.rc_context(self.rc)
+
+    def apply(self, ax, title=None, xlabel=None, ylabel=None, grid=True):
+        """Applique le style aux axes `ax` (fond, bordures, grille, textes, graduations)."""
+        ax.set_facecolor(self.axes_facecolor)
+        for spine in ax.spines.values():
+            spine.set_edgecolor(self.spine_edgecolor)
+            spine.set_linewidth(self.spine_width)
+        if grid:
+            ax.grid(True, **self.grid_kw)
+            ax.set_axisbelow(True)
+
+        if title:
+            ax.set_title(title, **self.title_kw)
+        if xlabel:
+            ax.set_xlabel(xlabel, **self.label_kw)
+        if ylabel:
+            ax.set_ylabel(ylabel, **self.label_kw)
+        ax.tick_params(**self.tick_kw)
+
+    # Lecture comme la configuration d'origine
+    def __getitem__(self, key):
+        return self.config[key]
+
+    def __iter__(self):
+        return iter(self.config)
+
+    def __len__(self):
+        return len(self.config)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("Un Style est immuable : créez-en un nouveau")
+
+    def __reduce__(self):
+        # Recompilé à la lecture (processus de rendu)
+        return (type(self), (_thaw(self.config), self.name))
+
+    def __repr__(self):
+        return f"Style(name={self.name!r})" if self.name else "Style()"
+
+
+def _compile(config):
+    """Valide `config` et calcule les attributs d'un Style."""
+    import numbers
+
+    from matplotlib import RcParams
+    from matplotlib.colors import is_color_like
+
+    colors, fonts, lines = config['colors'], config['fonts'], config['lines']
+    figure, axes, text = config['figure'], config['axes'], config['text']
+
+    for section, key in [('colors', 'primary'), ('colors', 'secondary'), ('colors', 'info'),
+                         ('colors', 'warning'), ('figure', 'facecolor'),
+                         ('axes', 'facecolor'), ('axes', 'edgecolor'), ('axes', 'grid_color'),
+                         ('text', 'title'), ('text', 'label'), ('text', 'tick'),
+                         ('text', 'legend')]:
+        _check(is_color_like(config[section][key]),
+               f"{section}.{key} n'est pas une couleur ({config[section][key]!r})")
+    palette = colors['palette']
+    _check(isinstance(palette, (list, tuple)) and len(palette) > 0
+           and all(is_color_like(c) for c in palette),
+           "colors.palette doit être une liste de couleurs")
+    for section, key in [('fonts', 'title'), ('fonts', 'label'), ('fonts', 'tick'),
+                         ('lines', 'width'), ('lines', 'marker_size'), ('figure', 'dpi'),
+                         ('axes', 'linewidth')]:
+        value = config[section][key]
+        _check(isinstance(value, numbers.Real) and value > 0,
+               f"{section}.{key} doit être un nombre positif ({value!r})")
+    _check(0 <= axes['grid_alpha'] <= 1, "axes.grid_alpha doit être entre 0 et 1")
+    _check(len(figure['figsize']) == 2 and all(v > 0 for v in figure['figsize']),
+           "figure.figsize doit être un couple (largeur, hauteur) positif")
+
+    title_kw = dict(fontsize=fonts['title'], fontweight='bold', pad=20, color=text['title'])
+    label_kw = dict(fontsize=fonts['label'], fontweight='600', color=text['label'])
+    tick_kw = dict(labelsize=fonts['tick'], colors=text['tick'])
+    grid_kw = dict(alpha=axes['grid_alpha'], color=axes['grid_color'],
+                   linestyle='--', linewidth=1)
+    legend_kw = dict(frameon=True, fancybox=True, shadow=True, fontsize=fonts['tick'],
+                     facecolor=axes['facecolor'], edgecolor=axes['edgecolor'],
+                     labelcolor=text['legend'])
+
+    # Équivalent rcParams, validé par matplotlib
+    from cycler import cycler
+    rc = RcParams({
+        'figure.figsize': tuple(figure['figsize']),
+        'figure.dpi': figure['dpi'],
+        'figure.facecolor': figure['facecolor'],
+        'axes.facecolor': axes['facecolor'],
+        'axes.edgecolor': axes['edgecolor'],
+        'axes.linewidth': axes['linewidth'],
+        'axes.grid': True,
+        'axes.axisbelow': True,
+        'axes.prop_cycle': cycler(color=list(palette)),
+        'grid.alpha': axes['grid_alpha'],
+        'grid.color': axes['grid_color'],
+        'grid.linestyle': grid_kw['linestyle'],
+        'grid.linewidth': grid_kw['linewidth'],
+        'axes.titlesize': fonts['title'],
+        'axes.titleweight': title_kw['fontweight'],
+        'axes.titlepad': title_kw['pad'],
+        'axes.titlecolor': text['title'],
+        'axes.labelsize': fonts['label'],
+        'axes.labelweight': 600,
+        'axes.labelcolor': text['label'],
+        'xtick.labelsize': fonts['tick'],
+        'ytick.labelsize': fonts['tick'],
+        'xtick.color': text['tick'],
+        'ytick.color': text['tick'],
+        'lines.linewidth': lines['width'],
+        'lines.markersize': lines['marker_size'],
+        'legend.fontsize': fonts['tick'],
+        'legend.frameon': True,
+        'legend.fancybox': True,
+        'legend.shadow': True,
+        'legend.facecolor': axes['facecolor'],
+        'legend.edgecolor': axes['edgecolor'],
+        'legend.labelcolor': text['legend'],
+    })
+
+    return dict(
+        rc=dict(rc),
+        palette=list(palette), primary=colors['primary'], secondary=colors['secondary'],
+        info=colors['info'], warning=colors['warning'],
+        figsize=tuple(figure['figsize']), dpi=figure['dpi'],
+        figure_facecolor=figure['facecolor'], axes_facecolor=axes['facecolor'],
+        line_width=lines['width'], marker_size=lines['marker_size'],
+        tick_size=fonts['tick'], text_color=text['title'],
+        spine_edgecolor=axes['edgecolor'], spine_width=axes['linewidth'],
+        title_kw=title_kw, label_kw=label_kw, tick_kw=tick_kw, grid_kw=grid_kw,
+        legend_kw=legend_kw)